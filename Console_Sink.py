@@ -0,0 +1,156 @@
+import collections
+import os
+import threading
+import time
+
+from Log_Writer import log_writer
+
+CONSOLE_LOG = "TestTools/console_log.txt"
+
+RED = (255, 0, 0)  # "\033" in the text
+CYAN = (102, 255, 255)  # "\034"
+WHITE = (255, 255, 255)
+
+
+def text_colour(string):
+    if "\033" in string:
+        return RED
+    if "\034" in string:
+        return CYAN
+    return WHITE
+
+
+class ConsoleSink:
+    """stdout of the GUI into a rich text control (Glink_Top.RedirectText).
+
+    write() appends the text to a ring (deque append / popleft, no lock) and
+    wakes a ticker thread; at most hz times a second the ticker hands one
+    drain() to call_after (wx.CallAfter), which writes every pending text to
+    the control: one WriteText per run of the same colour, one ScrollPages.
+    The "\\033" (red) / "\\034" (cyan) / "\\b" (line up) handling is the one of
+    the old RedirectText, per write() call.
+
+    The control keeps max_lines: older lines spill to the spill LogWriter
+    (TestTools/console_log.txt), trimmed down to 3/4 of max_lines at a time.
+    GetValue() is that file + the control (what an unbounded control would
+    hold), Clear() empties both.
+
+    call_after=None writes through to the control on every write(), the
+    behaviour before the ring (max_lines still applies).
+    """
+
+    def __init__(self, control, **kwargs) -> None:
+        self.out = control
+        self.call_after = kwargs.get("call_after", None)
+        self.hz = kwargs.get("hz", 30)
+        self.max_lines = kwargs.get("max_lines", 5000)  # 0: no cap
+        self.spill = kwargs.get("spill", None) or log_writer(CONSOLE_LOG)
+        self.gui_thread = kwargs.get("gui_thread", threading.current_thread())
+        self.ring = collections.deque()
+        self.wake = threading.Event()
+        self.drained = threading.Event()
+        self.last = 0.0  # monotonic time of the last drain
+        self.stats = {"writes": 0, "drains": 0, "control_writes": 0, "spilled": 0}
+        self.thread = None
+        self.spill.truncate()
+
+    def write(self, string) -> None:
+        self.stats["writes"] += 1
+        if self.call_after is None:
+            self._show([string])
+            return
+        self.ring.append(string)
+        self.wake.set()
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(
+                target=self._run, name="ConsoleSink", daemon=True
+            )
+            self.thread.start()
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> None:
+        # GUI thread: pending text to the control
+        chunks = []
+        while self.ring:
+            chunks.append(self.ring.popleft())
+        if chunks:
+            self._show(chunks)
+            self.stats["drains"] += 1
+        self.drained.set()
+
+    def GetValue(self) -> str:
+        # every line since Clear(): spilled + in the control
+        if threading.current_thread() is self.gui_thread:
+            self.drain()
+        self.spill.flush()
+        spilled = ""
+        if os.path.exists(self.spill.path):
+            with open(self.spill.path, "r") as f:
+                spilled = f.read()
+        return spilled + self.out.GetValue()
+
+    @property
+    def Value(self) -> str:
+        return self.GetValue()
+
+    def Clear(self) -> None:
+        self.ring.clear()  # printed before the Clear
+        self.out.Clear()
+        self.spill.truncate()
+
+    def _run(self):
+        while True:
+            self.wake.wait()
+            delay = self.last + 1 / self.hz - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)  # coalesce writes into one drain
+            self.wake.clear()
+            self.drained.clear()
+            try:
+                self.call_after(self.drain)
+            except Exception:
+                continue  # no GUI (app closing)
+            self.drained.wait()  # one drain in flight
+            self.last = time.monotonic()
+
+    def _show(self, chunks):
+        if self.max_lines:
+            # text that would scroll out before it is seen goes to the spill
+            lines, k = 0, len(chunks)
+            while k > 0 and lines <= self.max_lines:
+                k -= 1
+                lines += chunks[k].count("\n")
+            if k > 0:
+                head = self.out.GetValue() + "".join(chunks[:k])
+                self.spill.write(head)
+                self.stats["spilled"] += head.count("\n")
+                self.out.Clear()
+                chunks = chunks[k:]
+
+        runs = []  # [colour, line up, [text, ...]]
+        for string in chunks:
+            colour = text_colour(string)
+            up = "\b" in string
+            if runs and not up and not runs[-1][1] and runs[-1][0] == colour:
+                runs[-1][2].append(string)
+            else:
+                runs.append([colour, up, [string]])
+        for colour, up, strings in runs:
+            self.out.MoveEnd()
+            if up:
+                self.out.MoveUp()
+            self.out.BeginTextColour(colour)
+            self.out.WriteText("".join(strings))
+            self.out.EndTextColour()
+            self.stats["control_writes"] += 1
+        self.out.ScrollPages(1)
+
+        lines = self.out.GetNumberOfLines()
+        if self.max_lines and lines > self.max_lines:
+            keep = self.max_lines - self.max_lines // 4
+            end = self.out.XYToPosition(0, lines - keep)
+            self.spill.write(self.out.GetRange(0, end))
+            self.out.Remove(0, end)
+            self.stats["spilled"] += lines - keep
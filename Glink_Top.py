@@ -26,27 +26,21 @@ import Glink_run
 import gui  # import the newly created GUI file by wxformbuilder
 import psutil
 import TestTools.pico_python_library.pyautogui as pyautogui
+from Console_Sink import ConsoleSink
 from Instrument import D2D_Subprogram
+from Log_Store import LOG_STORE, LogStore, log_open
+from Log_Writer import I2C_LOG, log_writer
 from Raspberry_Pico import *
 
+# GPIO6/7/8 chip reset low time; the former pico_gpio_low 1/0/1 sequence
+# held each pin low for one REPL round trip, about 0.6 ms on the bench
+CHIP_RST_PULSE_US = 600
 
-class RedirectText(object):
+
+class RedirectText(ConsoleSink):
+    # m_richText1 console: ConsoleSink drained by wx.CallAfter at <= 30 Hz
     def __init__(self, aWxRichTextCtrl):
-        self.out = aWxRichTextCtrl
-
-    def write(self, string):
-        self.out.MoveEnd()
-        if "\b" in string:
-            self.out.MoveUp()
-        if "\033" in string:
-            self.out.BeginTextColour((255, 0, 0))
-        elif "\034" in string:
-            self.out.BeginTextColour((102, 255, 255))
-        else:
-            self.out.BeginTextColour((255, 255, 255))
-        self.out.WriteText(string)
-        self.out.ScrollPages(1)
-        self.out.EndTextColour()
+        ConsoleSink.__init__(self, aWxRichTextCtrl, call_after=wx.CallAfter)
 
     def flush(self):
         try:
@@ -87,10 +81,15 @@ class MainFrame(gui.MainFrame):
         self.m_richText1.SetDefaultStyle(wx.TextAttr(wx.WHITE, (16, 16, 16)))
         self.TestItem_Now_wx.SetBackgroundColour(wx.Colour(16, 16, 16))
         self.TestItem_Now_wx.SetDefaultStyle(wx.TextAttr(wx.WHITE, (16, 16, 16)))
-        sys.stdout = RedirectText(self.m_richText1)
+        self.console = RedirectText(self.m_richText1)
+        sys.stdout = self.console
         self.info_window_wx.Selection = 2
         self.def_gui()
         self.tools_path = os.path.dirname(os.path.abspath(__file__))
+        # Test_Report Log item logs and i2c_log.txt overflow, capped on disk
+        self.log_store = LogStore(LOG_STORE)
+        log_writer(I2C_LOG).rotate_setup(self.log_store)
+        self.run_n = 0
 
         # Load pll map for gui tree use
         # dirPath = r"Test_Report\Register Map\PLL_Map"
@@ -132,7 +131,7 @@ class MainFrame(gui.MainFrame):
         self.xls_report_path = "Test_Report\\Test Report EZ0005A.xlsx"
 
         self.info_window_wx.Selection = 1
-        self.m_richText1.Clear()
+        self.console.Clear()
         print("Start Connect Test Chip", flush=True)
         self.eye_graph_info_wx.SetBitmap(
             wx.Bitmap("TestTools/blank.png", wx.BITMAP_TYPE_ANY)
@@ -157,8 +156,8 @@ class MainFrame(gui.MainFrame):
         get_json = self.project_select(True)
         print(f"get_json check = {get_json}")
 
-        if (self.m_richText1.GetValue()).find("COM") != -1:
-            buffer = (((self.m_richText1.GetValue()).split("COM"))[1])[0]
+        if (self.console.GetValue()).find("COM") != -1:
+            buffer = (((self.console.GetValue()).split("COM"))[1])[0]
             self.I2C_info.SetBackgroundColour(colour="green")
             self.I2C_info.Value = f"I2C Module Raspberry Pico Initialization Pass"
             # self.I2C_info.Value = f'GUC UCIe 32Gb/s Eye Diagram'
@@ -167,7 +166,7 @@ class MainFrame(gui.MainFrame):
             self.I2C_info.Value = f"I2C Module Raspberry Pico Initialization Fail"
 
         if (self.ip_version).find("Version") != -1:
-            self.m_richText1.Clear()
+            self.console.Clear()
             print(f"\033 Please Select IP Version !!")
         # self.phy_0.set_input_pin6()
 
@@ -175,7 +174,7 @@ class MainFrame(gui.MainFrame):
         # self.run_0.thermal_die_CHK()
         # aa = self.visa.IDN(visa='USB0::0x2A8D::0x3302::MY61001409::0::INSTR')
         self.sw_en = 0
-        self.m_richText1.Clear()
+        self.console.Clear()
         self.phase_num = 64
         self.vref_num = 32
         self.driving_strength_en = 0
@@ -196,11 +195,12 @@ class MainFrame(gui.MainFrame):
             if self.m_toggleBtn_run_test.GetValue() == 1:
                 self.m_toggleBtn_run_test.Label = "Disable"
 
-            self.m_richText1.Clear()
+            self.console.Clear()
 
             self.Test_step_Now = 0
             for run_n in range(int(self.Test_Cycle_wx.Value)):
-                self.m_richText1.Clear()
+                self.run_n = run_n  # test cycle of the log store index
+                self.console.Clear()
                 self.eye_scan_en = 0
 
                 self.Chip_Corner = self.Corner_Version_wx.Value
@@ -241,14 +241,14 @@ class MainFrame(gui.MainFrame):
                             self.visa.TA5000_Temp_Set(self.Temp_now)
                             time.sleep(1)
                             self.visa.TA5000_Temp_read(self.Temp_now)
-                            Test_Log = (self.m_richText1.Value).strip()
+                            Test_Log = (self.console.GetValue()).strip()
                             time.sleep(1)
                             # Termal instrument delay
                             Temp_Delay = int(self.Termal_Delay.Value)
                             for i in range(Temp_Delay):
                                 time.sleep(1)
                                 # print(f'\bTemperature Delay :{Temp_Delay:>5}', flush=True, end='')
-                                self.m_richText1.Clear()
+                                self.console.Clear()
                                 print(Test_Log, "\n")
                                 print("Test Temperature", (self.Temp_now, "Degree"))
                                 print(
@@ -268,7 +268,7 @@ class MainFrame(gui.MainFrame):
                             ):
                                 self.def_gui(clear_count=0)
 
-                                self.m_richText1.Clear()
+                                self.console.Clear()
                                 self.phy_0.set_input_pin6()
 
                                 self.info_window_wx.Selection = 1
@@ -483,7 +483,7 @@ class MainFrame(gui.MainFrame):
                                     self.Start_Test(run_n=run_n)
                                 else:
                                     # Run Specialized Function
-                                    self.m_richText1.Clear()
+                                    self.console.Clear()
                                     print(f"Test Item : {self.TestItem_full}")
                                     print(
                                         "Test Temperature : ", self.Temp_now, "Degree"
@@ -824,9 +824,8 @@ class MainFrame(gui.MainFrame):
         textfile = open("TestTools/Graph_Eye.txt", "w")
         textfile.write("")
         textfile.close()
-        textfile = open("TestTools/i2c_log.txt", "w")
-        textfile.write("")
-        textfile.close()
+        log_writer(I2C_LOG).truncate()  # after the lines still queued
+        self.phy_0.log_die = None
 
         self.TestItem_Now2_wx.SetBackgroundColour(color)
         self.TestItem_Now_wx.Value = f"{self.Chip_Mode}_{self.TestDataRate}Gbps"
@@ -844,15 +843,14 @@ class MainFrame(gui.MainFrame):
             self.TestResult = ["abp_failed"]
 
         # save test log.txt
-        f = open("TestTools/i2c_log.txt", "r")
-        i2c_log = f.read()
-        f.close()
+        # test item boundary: every line, the head rotated into the log store
+        i2c_log = log_writer(I2C_LOG).read()
 
         print("Elapsed 1 Item : ", datetime.datetime.now() - S_time, flush=True)
         print("\n")
-        self.write_log(self.m_richText1.Value + i2c_log)  # save test Sequence
+        self.write_log(self.console.GetValue() + i2c_log)  # save test Sequence
         self.txt_line = int(self.total_lines(self.save_log)) - 5
-        self.i2c_txt_line = int(self.total_lines("TestTools/i2c_log.txt"))
+        self.i2c_txt_line = len(i2c_log.splitlines())
 
         # if self.bypass_report != 1:
         #     self.xlsx_Report()
@@ -910,7 +908,7 @@ class MainFrame(gui.MainFrame):
         self.TestItem_Init(TestItem=self.TestItem)
 
         print("Elapsed 1 Item : ", datetime.datetime.now() - S_time, flush=True)
-        self.write_log(self.m_richText1.Value)  # save test Sequence
+        self.write_log(self.console.GetValue())  # save test Sequence
 
         self.info_window_wx.Selection = 1
         self.eye_graph_info_wx.SetBitmap(
@@ -979,6 +977,13 @@ class MainFrame(gui.MainFrame):
 
         self.save_log = "Test_Report//Test_Report Log/" + self.Log_Folder_path + ".txt"
         self.log_path = "Test_Report Log/" + self.Log_Folder_path + ".txt"
+        self.log_store.item(
+            self.Log_Folder_path + ".txt",
+            path=self.save_log,  # into the store at the next item
+            item=self.TestItem_full,
+            cycle=self.run_n,
+            temp=self.Temp_now,
+        )
         self.graph_info = f"{self.TestItem_full} {self.chip_version} {self.Temp_now}Degree C {self.TestDataRate}Gb/s {self.Chip_Mode}"
 
         # save all slice eye width
@@ -1008,15 +1013,9 @@ class MainFrame(gui.MainFrame):
     def GUC_chip_rst(self):
         if self.sys_rst_num == 0:  # GPIO Reset
             print("\nGPIO Reset Test Chip Reset\n", flush=True)
-            self.phy_0.pico_gpio_low(6, 1)
-            self.phy_0.pico_gpio_low(6, 0)
-            self.phy_0.pico_gpio_low(6, 1)
-            self.phy_0.pico_gpio_low(7, 1)
-            self.phy_0.pico_gpio_low(7, 0)
-            self.phy_0.pico_gpio_low(7, 1)
-            self.phy_0.pico_gpio_low(8, 1)
-            self.phy_0.pico_gpio_low(8, 0)
-            self.phy_0.pico_gpio_low(8, 1)
+            self.phy_0.pico_gpio_apply(0x1C0, 0)  # GPIO6/7/8 high
+            for pin in [6, 7, 8]:
+                self.phy_0.pico_gpio_apply(0, 1 << pin, pulse_us=CHIP_RST_PULSE_US)
         elif self.sys_rst_num == 1:  # Power Reset
             print("\nPower Cycle Test Chip Reset\n", flush=True)
             self.visa.E36233A_Out_OFF_RST()
@@ -1051,6 +1050,7 @@ class MainFrame(gui.MainFrame):
             # Skip Reset
             print("\nSkip Test Chip Reset\n", flush=True)
             pass
+        self.phy_0.mux_invalidate()  # reselect Die / U142 mux after the reset
         self.phy_0.resetn(abp_en=1)
 
     def read_pll_write_map(self, **kargs):
@@ -1138,7 +1138,7 @@ class MainFrame(gui.MainFrame):
         self.reg_map_load.Label = "Press Load Register Map"
 
     def reg_compare_event(self, event):
-        self.m_richText1.Clear()
+        self.console.Clear()
         self.phy_0.indirect_enable(0, 1)
         self.phy_0.indirect_enable(0, 2)
         self.phy_0.indirect_enable(1, 1)
@@ -1716,7 +1716,7 @@ class MainFrame(gui.MainFrame):
     def register_compare(self):
         ip_num = self.ip_version_wx.GetSelection()
         print(f"< Start Compare Register : {ip_num} >")
-        self.m_richText1.Clear()
+        self.console.Clear()
 
     """"Module Board""" ""
 
@@ -2524,7 +2524,7 @@ class MainFrame(gui.MainFrame):
     """eye scan"""
 
     def eye_scan_even(self, event):
-        self.m_richText1.Clear()
+        self.console.Clear()
         print("\n< Eye Scan Test Start > ")
         if self.eye_scan_en == 0:
             self.TestItem_Now2_wx.SetBackgroundColour("#FF0000")
@@ -2559,7 +2559,7 @@ class MainFrame(gui.MainFrame):
                     # print(w, flush=True)
 
                     self.HW_Training_init()
-                    self.m_richText1.Clear()
+                    self.console.Clear()
 
                     get_scan = self.get_win()
                     if get_scan == False:
@@ -2591,7 +2591,7 @@ class MainFrame(gui.MainFrame):
                     # print(w, flush=True)
 
                     self.HW_Training_init()
-                    self.m_richText1.Clear()
+                    self.console.Clear()
 
                     get_scan = self.get_win()
                     if get_scan == False:
@@ -3061,7 +3061,7 @@ class MainFrame(gui.MainFrame):
         return get_json
 
     def PASS_FAIL_HW_chk(self):
-        buffer = self.m_richText1.Value
+        buffer = self.console.GetValue()
         Test_Log = re.sub("\n", "", buffer)
         if Test_Log.find("MBT Failed") != -1:
             return_val = "FAIL"
@@ -3072,9 +3072,7 @@ class MainFrame(gui.MainFrame):
     def Save_i2cLog(self, **kargs):
         content = kargs.get("log_name", "NA")
 
-        textfile = open("TestTools/i2c_log.txt", "a+")
-        textfile.write(content)
-        textfile.close()
+        log_writer(I2C_LOG).write(content)
 
     def clear_txt(self, file_name, **kargs):
         content = kargs.get("log_name", "NA")
@@ -3093,11 +3091,11 @@ class MainFrame(gui.MainFrame):
         self.TestItem_Now_wx.Value = "( Test Condition )"
         if clear_count:
             self.Step_count.Value = 0
-        self.m_richText1.Clear()
+        self.console.Clear()
         print("( Test Log )")
 
     def total_lines(self, path):
-        with open(path) as myfile:
+        with log_open(path) as myfile:
             total_lines = sum(1 for line in myfile)
         return total_lines
 
@@ -3242,7 +3240,7 @@ class MainFrame(gui.MainFrame):
         import re
 
         # print(f'Program Interface : {self.prog_HW}')
-        buffer = self.m_richText1.Value
+        buffer = self.console.GetValue()
         Test_Log = re.sub("\n", "", buffer)
         if Test_Log.find(find) != -1 or Test_Log.find("Failed") != -1:
             self.pass_fail = "FAIL"
@@ -3260,7 +3258,7 @@ class MainFrame(gui.MainFrame):
         import re
 
         # print(f'Program Interface : {self.prog_HW}')
-        buffer = self.m_richText1.Value
+        buffer = self.console.GetValue()
         Test_Log = re.sub("\n", "", buffer)
         if Test_Log.find(find) != -1:
             self.abp_pass_fail = "failed"
@@ -3299,7 +3297,7 @@ class MainFrame(gui.MainFrame):
         window.mainloop()
 
     def clear_text(self, event):
-        self.m_richText1.Clear()
+        self.console.Clear()
 
     def data_training_event(self, event):
         if self.data_training_en.GetValue() == True:
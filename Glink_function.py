@@ -5,6 +5,7 @@ from tabulate import tabulate
 
 from Glink_run import UCIe_2p5D
 from Instrument import D2D_Subprogram
+from Log_Writer import I2C_LOG, log_writer
 
 
 class UCIe_2p5D:
@@ -1044,13 +1045,12 @@ class UCIe_2p5D:
         if self.show == 1:
             print(label, flush=True)
         self.Save_i2cLog(log_name=f"{label}\n")
+        self.phy.trace_label(label)
 
     def Save_i2cLog(self, **kargs):
         content = kargs.get("log_name", "NA")
 
-        textfile = open("TestTools/i2c_log.txt", "a+")
-        textfile.write(content)
-        textfile.close()
+        log_writer(I2C_LOG).write(content)
 
     def log_info(self, info):
         self.info = info
@@ -1,18 +1,67 @@
 import datetime
+import hashlib
 import logging
+import random
 import time
+from collections import namedtuple
 
 import numpy as np
 from tabulate import tabulate
 
+from Log_Writer import I2C_LOG, log_writer
 from Raspberry_Pico import *
+from Reg_Trace import (
+    OP_DIE,
+    OP_I2C_WRITE,
+    OP_READ,
+    OP_RESET,
+    OP_TOP,
+    OP_USER,
+    OP_WRITE,
+    TraceWriter,
+)
+from Register_Map import REG_MAP_DIR, RegisterMap
+
+APB_VOLATILE = (0x7134, 0x3370, 0x3374, 0x3378)  # BIST_ERR_COUNT, rg_rxpmad_BIST_FAIL_*
+VERIFY_MODES = ("none", "sampled", "deferred", "strict")  # verify_setup(mode=)
+# reg_user_set arguments a compiled plan depends on, with their defaults
+PLAN_ARGS = (
+    ("reg_arr", []),
+    ("mode", "mode"),
+    ("gui_die_sel", 1),
+    ("gui_group_num", 1),
+    ("gui_slice_num", 1),
+    ("die_arr", [0, 1, 2, 3]),
+    ("group_arr", [0, 1, 2, 3]),
+    ("tx_slice", [0, 1, 2, 3]),
+    ("rx_slice", [0, 1, 2, 3]),
+)
+
+# one indirect access of a reg_user_set plan; line: reg_arr index, show: the
+# show=1 print ({value}: read value), die: Die selected when it runs
+PlanOp = namedtuple(
+    "PlanOp",
+    [
+        "line",
+        "die",
+        "slave",
+        "address",
+        "field",
+        "value",
+        "read",
+        "slice_num",
+        "top",
+        "show",
+    ],
+)
+RegPlan = namedtuple("RegPlan", ["ops", "result"])  # result: op index of the return
 
 
 class UCIe_2p5D:
     def __init__(self, gui, i2c, jtag):
         self.jtag = jtag
         self.gui = gui
-        self.i2c = Pico("7-bit")
+        self.i2c = i2c if i2c is not None else Pico("7-bit")
         self.pmic_120 = 0x69
         self.DIE = 4
         self.GROUP = 4
@@ -35,6 +84,20 @@ class UCIe_2p5D:
         ]  # Die3 tport/H/V
         self.GROUP_NUM = {0: "TPORT", 1: "H", 2: "V"}
         self.save_log = 1
+        self.i2c_log = log_writer(I2C_LOG)  # TestTools/i2c_log.txt, buffered
+        self.trace = None  # binary register trace, trace_setup()
+        self.mux_topology = None  # U142 channel -> slaves, filled by mux_scan
+        self.log_die = None  # Die of the last [Die_Select] line in i2c_log.txt
+        self.wc = None  # (0x70 byte, slave, word) -> (mask, value), write_combine_begin
+        self.regmap = None  # RegisterMap of the datasheet, reg_map() loads it
+        self.reg_map_dir = REG_MAP_DIR
+        self.wc_stats = {"fields": 0, "words": 0, "barriers": 0}
+        self.plan_cache = {}  # content hash -> RegPlan, reg_plan()
+        self.plan_cache_size = 64
+        self.plan_stats = {"compiles": 0, "hits": 0}
+        self.cache_setup(cache=0)
+        self.chk_setup(chk=0)
+        self.verify_setup(mode="none")
 
     def log_info(self, info, reg_save):
         self.info = info
@@ -47,9 +110,9 @@ class UCIe_2p5D:
         abp_en = kwargs.get("abp_en", 1)
         if abp_en == 1:
             print(f"all EHOST APB from I2C enable")
-            f = open("TestTools/i2c_log.txt", mode="w")
-            f.write("\n\n\n< Register Information and sequence >\n")
-            f.close()
+            self.i2c_log.truncate("\n\n\n< Register Information and sequence >\n")
+            self._trace(OP_RESET, 0, 0, None, 0)
+            self.log_die = None
 
             # Reset select
 
@@ -61,6 +124,7 @@ class UCIe_2p5D:
 
     def die_sel(self, **kwargs):
         die = kwargs.get("die", 0)
+        force = kwargs.get("force", 0)  # 1: write 0x70 even if the Die is selected
 
         if die == 0:
             setv = 0x01
@@ -84,10 +148,19 @@ class UCIe_2p5D:
         # r_d =  time.perf_counter()
         # now_r = r_d-r_s
 
-        self.i2c.write(0x70, setv, 0, 8, setv)
+        self.i2c.mux_select(0x70, setv, force=force)
         # print(f'Die Select Die{die}')
-        if self.save_log == 1:
-            self.Save_i2cLog(log_name="[Die_Select] : Die" + str(die) + "\n")
+        if die != self.log_die and (self.save_log == 1 or self.trace is not None):
+            if self.save_log == 1:
+                self.Save_i2cLog(log_name="[Die_Select] : Die" + str(die) + "\n")
+            self.log_die = die
+            self._trace(OP_DIE, 0, 0, None, 0)
+
+    def mux_invalidate(self):
+        # chip reset: die / U142 mux selection unknown, next select writes again
+        self.i2c.mux_invalidate()
+        self.cache_invalidate()  # every register is back to default
+        self.log_die = None
 
     def non_i2c_write(self, slave, offset, s_bit, b_len, setv, **kwargs):
         self.i2c.write(slave, offset, s_bit, b_len, setv)
@@ -119,15 +192,28 @@ class UCIe_2p5D:
         )  # EHOST_DISABLE: [0x01] External APB Enable
 
         content = f"< Code > I2C write : slave={hex(self.EHOST[die][group])} , offset=0x02 , s_bit=7, b_len=1, (W) value=0x01\n"
-        textfile = open("TestTools/i2c_log.txt", "a+")
-        textfile.write(content)
-        textfile.close()
+        self.i2c_log.write(content)
+        self._trace(OP_I2C_WRITE, self.EHOST[die][group], 0x02, "7", 0x01)
 
     def indirect_write(self, slave, address, bit, data, **kwargs):
+        # supervised Pico: a W1C / reset / start word is never written twice
+        if (
+            self.i2c.supervised
+            and kwargs.get("top", 0) == 0
+            and "ordered" in (self.reg_kind(address), self.reg_kind(address + 3))
+        ):
+            with self.i2c.once("indirect_write"):
+                return self._indirect_write(slave, address, bit, data, **kwargs)
+        return self._indirect_write(slave, address, bit, data, **kwargs)
+
+    def _indirect_write(self, slave, address, bit, data, **kwargs):
         top = kwargs.get("top", 0)
         dbg = kwargs.get("dbg", 0)
         slice_num = kwargs.get("slice_num", -1)
         reg_source = kwargs.get("reg_source", "< Code >")
+        chk = kwargs.get("chk", self.chk)  # 1: wait for EHOST done, 2: raise if not
+        chk_us = self.chk_deadline if chk else 0
+        timeouts = self.i2c.wait_stats["timeouts"]
 
         if self.save_log == 1:
             if slice_num == -1:
@@ -135,18 +221,25 @@ class UCIe_2p5D:
             else:
                 offset_skip_slice = address - ((int(self.slice_offset)) * slice_num)
                 content = f"{reg_source} Indirect_Write : Slave={hex(slave)} , Slice{slice_num}_Offset={hex(address)}(Offset={hex(offset_skip_slice)}) , Bit={bit} , (W) Value={hex(data)}\n"
-            textfile = open("TestTools/i2c_log.txt", "a+")
-            textfile.write(content)
-            textfile.close()
+            self.i2c_log.write(content)
+        self._trace(OP_WRITE, slave, address, bit, data, slice_num, reg_source, top)
+        self._verify_barrier(address, top)
 
         # Start Bit / Bit Leng
-        if (bit.strip()).find(":") != -1:
-            buffer = bit.split(":")
-            s_bit = int(buffer[1])
-            b_len = abs(int(buffer[0]) - int(buffer[1])) + 1
-        else:
-            s_bit = int(bit)
-            b_len = 1
+        field = bit_field(bit)
+        s_bit = field.lsb
+        b_len = field.width
+
+        combine = self.wc is not None and top == 0 and dbg == 0
+        if combine and "ordered" in (
+            self.reg_kind(address),
+            self.reg_kind(address + 3),  # field into the next word
+        ):
+            self.write_combine_flush()  # barrier, then write in program order
+            self.wc_stats["barriers"] += 1
+            combine = False
+        die_byte = self.i2c.mux_state.get(0x70)
+        combine = combine and die_byte is not None
 
         do_write = 1
         if top == 1:
@@ -175,9 +268,10 @@ class UCIe_2p5D:
                 f"{hex(apb_addr)}  {addr_len} bit  {hex(apb_addr)}",
                 flush=True,
             )
-        self.i2c.write(
-            slave, apb_addr, 0, addr_len, address
-        )  # abp address eHost or Slice function
+        if not self.i2c.agent and not combine:
+            self.i2c.write(
+                slave, apb_addr, 0, addr_len, address
+            )  # abp address eHost or Slice function
 
         if s_bit > 32:
             print(f"no support !! start bit {s_bit} bigger than 32")
@@ -205,16 +299,29 @@ class UCIe_2p5D:
             write_next = 0
             b_len_map_2 = 0
 
-        if do_write == 1:
+        if do_write == 1 and combine:
+            if 0 <= data < 2**b_len:
+                field_map = bit_field((s_bit_map, b_len_map))
+                self._write_combine_put((die_byte, slave, address_map), field_map, data)
+                if write_next == 1:
+                    self._write_combine_put(
+                        (die_byte, slave, address_map + 4),
+                        bit_field((0, b_len_map_2)),
+                        data_2,
+                    )
+            else:
+                print("wrong input value")
+        elif do_write == 1:
             if dbg == 1:
                 print(
                     f"Write_APB address, I2C write {hex(slave)}, "
                     f"{hex(apb_addr)}  {addr_len} bit  {hex(address_map)}",
                     flush=True,
                 )
-            self.i2c.write(
-                slave, apb_addr, 0, addr_len, address_map
-            )  # abp address EHOST/Slice
+            if not self.i2c.agent:
+                self.i2c.write(
+                    slave, apb_addr, 0, addr_len, address_map
+                )  # abp address EHOST/Slice
             val_ok = 1
             if data >= 2**b_len or data < 0:
                 aa = 2**b_len
@@ -222,7 +329,38 @@ class UCIe_2p5D:
                 print(fail_status)
                 val_ok = 0
 
-            if val_ok:
+            field_map = bit_field((s_bit_map, b_len_map))
+            if write_next == 1:
+                field_map_2 = bit_field((0, b_len_map_2))
+            if val_ok and self.i2c.agent:
+                self.i2c.apb_wr(
+                    slave,
+                    address_map,
+                    field_map.mask,
+                    field_map.insert(0, data),
+                    top,
+                    chk_us,
+                )
+                self._cache_put(
+                    slave, address_map, field_map.insert(0, data), top, field_map.mask
+                )
+                if write_next == 1:
+                    self.i2c.apb_wr(
+                        slave,
+                        address_map + 4,
+                        field_map_2.mask,
+                        field_map_2.insert(0, data_2),
+                        top,
+                        chk_us,
+                    )
+                    self._cache_put(
+                        slave,
+                        address_map + 4,
+                        field_map_2.insert(0, data_2),
+                        top,
+                        field_map_2.mask,
+                    )
+            elif val_ok:
                 if (s_bit_map == 0) & (b_len_map == 32):
                     if dbg == 1:
                         print(
@@ -247,31 +385,29 @@ class UCIe_2p5D:
                             flush=True,
                         )
                     self.i2c.write(slave, apb_rwcl, 0, 8, apb_wcmv)  # write command
+                    self._cache_put(slave, address_map, data, top)
                 else:
-                    if dbg == 1:
-                        print(
-                            f"Write_APB rcmd, I2C write {hex(slave)}, "
-                            f"{hex(apb_rwcl)}  8 bit  {hex(apb_rcmv)}",
-                            flush=True,
-                        )
-                    self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
-                    if dbg == 1:
-                        print(f"Write_APB read checking", flush=True)
-                    # self.indirect_read_chk(slave, top=top)
-                    rd_data = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
+                    rd_data = self._cache_get(slave, address_map, top)
+                    if rd_data is None:
+                        if dbg == 1:
+                            print(
+                                f"Write_APB rcmd, I2C write {hex(slave)}, "
+                                f"{hex(apb_rwcl)}  8 bit  {hex(apb_rcmv)}",
+                                flush=True,
+                            )
+                        self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
+                        if dbg == 1:
+                            print(f"Write_APB read checking", flush=True)
+                        if chk:
+                            self.indirect_read_chk(slave, top=top)
+                        rd_data = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
                     if dbg == 1:
                         print(
                             f"Read_APB data , I2C read {hex(slave)}, "
                             f"{hex(apb_rdat)}  {data_len} bit  {hex(rd_data)}",
                             flush=True,
                         )
-                    mask = self.i2c._rol(
-                        (0xFFFFFFFF << b_len_map), s_bit_map, 32
-                    )  # 32-bit mask
-                    rd_data = rd_data & mask  # clear bit-field
-                    wr_data = rd_data | (
-                        self.i2c._truncate(data, b_len_map) << s_bit_map
-                    )  # or bit-field with (data << s_bit)
+                    wr_data = field_map.insert(rd_data, data)  # clear / or bit-field
                     if dbg == 1:
                         print(
                             f"Write_APB data, I2C write {hex(slave)}, "
@@ -286,33 +422,34 @@ class UCIe_2p5D:
                             flush=True,
                         )
                     self.i2c.write(slave, apb_rwcl, 0, 8, apb_wcmv)  # write command
+                    self._cache_put(slave, address_map, wr_data, top)
                 if dbg == 1:
                     print(f"Write_APB Check ", flush=True)
-                # self.indirect_write_chk(slave, top=top)
+                if chk:
+                    self.indirect_write_chk(slave, top=top)
 
                 if write_next == 1:
                     self.i2c.write(
                         slave, apb_addr, 0, addr_len, address_map + 4
                     )  # abp address
-                    self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
-                    if dbg == 1:
-                        print(f"Read_APB Check ", flush=True)
-                    # self.indirect_read_chk(slave, top=top)
-
-                    rd_data = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
+                    rd_data = self._cache_get(slave, address_map + 4, top)
+                    if rd_data is None:
+                        self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
+                        if dbg == 1:
+                            print(f"Read_APB Check ", flush=True)
+                        if chk:
+                            self.indirect_read_chk(slave, top=top)
+
+                        rd_data = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
                     if dbg == 1:
                         print(
                             f"Read_APB data , I2C read {hex(slave)}, "
                             f"{hex(apb_rdat)}  {data_len} bit  {hex(rd_data)}",
                             flush=True,
                         )
-                    mask = self.i2c._rol(
-                        (0xFFFFFFFF << b_len_map_2), 0, 32
-                    )  # 32-bit mask
-                    rd_data = rd_data & mask  # clear bit-field
-                    wr_data = rd_data | (
-                        self.i2c._truncate(data_2, b_len_map_2) << 0
-                    )  # or bit-field with (data << s_bit)
+                    wr_data = field_map_2.insert(
+                        rd_data, data_2
+                    )  # clear / or bit-field
                     if dbg == 1:
                         print(
                             f"Write_APB data2, I2C write {hex(slave)}, "
@@ -327,15 +464,37 @@ class UCIe_2p5D:
                             flush=True,
                         )
                     self.i2c.write(slave, apb_rwcl, 0, 8, apb_wcmv)  # write command
+                    self._cache_put(slave, address_map + 4, wr_data, top)
                     if dbg == 1:
                         print(f"Write_APB Check, ", flush=True)
-                    # self.indirect_write_chk(slave, top=top)
+                    if chk:
+                        self.indirect_write_chk(slave, top=top)
+
+        if self.apb_cache and do_write == 1:
+            if top == 1:
+                self.cache_invalidate(die_byte=self.i2c.mux_state.get(0x70))
+            elif self.reg_kind(address) == "ordered":
+                # resets / re-lock (e.g. cmu_rstn) reload the slave registers
+                self.cache_invalidate(slave, die_byte=self.i2c.mux_state.get(0x70))
+        if do_write == 1 and 0 <= data < 2**b_len:
+            field_map = bit_field((s_bit_map, b_len_map))
+            words = [(address_map, field_map.mask, field_map.insert(0, data))]
+            if write_next == 1:
+                field_map_2 = bit_field((0, b_len_map_2))
+                words.append(
+                    (address_map + 4, field_map_2.mask, field_map_2.insert(0, data_2))
+                )
+            self._verify_write(slave, words, top)
+        self._chk_report(chk, timeouts, "Write", slave, address)
 
     def indirect_read(self, slave, address, bit, **kwargs):  # bit need use string
         top = kwargs.get("top", 0)
         save_i2c_log = kwargs.get("save_i2c_log", 1)
         slice_num = kwargs.get("slice_num", -1)
         reg_source = kwargs.get("reg_source", "< Code >")
+        chk = kwargs.get("chk", self.chk)  # 1: wait for EHOST done, 2: raise if not
+        chk_us = self.chk_deadline if chk else 0
+        timeouts = self.i2c.wait_stats["timeouts"]
 
         do_read = 1
         if top == 1:
@@ -355,13 +514,9 @@ class UCIe_2p5D:
             apb_rcmv = 0x2
 
         # Start Bit / Bit Leng
-        if (bit.strip()).find(":") != -1:
-            buffer = bit.split(":")
-            s_bit = int(buffer[1])
-            b_len = abs(int(buffer[0]) - int(buffer[1])) + 1
-        else:
-            s_bit = int(bit)
-            b_len = 1
+        field = bit_field(bit)
+        s_bit = field.lsb
+        b_len = field.width
 
         # print('Read_APB,  ', slave_hex, ',', address_hex, ',', s_bit, ',', b_len, flush=True)
         if s_bit > 32:
@@ -389,7 +544,36 @@ class UCIe_2p5D:
             read_next = 0
             b_len_map_2 = 0
 
-        if do_read == 1:
+        field_map = bit_field((s_bit_map, b_len_map))
+        if read_next == 1:
+            field_map_2 = bit_field((0, b_len_map_2))
+        if self.wc and do_read == 1:
+            if self.reg_kind(address) or self.reg_kind(address + 3):
+                self.write_combine_flush()  # status may depend on any earlier write
+            else:
+                self.write_combine_flush(
+                    slave=slave, words=[address_map, address_map + 4 * read_next]
+                )
+        cached = [None]
+        if do_read == 1 and self.apb_cache is not None:
+            cached = [
+                self._cache_get(slave, address_map + 4 * i, top)
+                for i in range(read_next + 1)
+            ]
+        if None not in cached:
+            val = field_map.extract(cached[0])
+            if read_next == 1:
+                val = field_map_2.extract(cached[1]) * 2**b_len_map + val
+        elif do_read == 1 and self.i2c.agent:
+            rd_data = self.i2c.apb_rd(slave, address_map, top, chk_us)
+            self._cache_put(slave, address_map, rd_data, top)
+            val = field_map.extract(rd_data)
+            if read_next == 1:
+                rd_data_2 = self.i2c.apb_rd(slave, address_map + 4, top, chk_us)
+                self._cache_put(slave, address_map + 4, rd_data_2, top)
+                rd_data_2 = field_map_2.extract(rd_data_2)
+                val = rd_data_2 * 2**b_len_map + val
+        elif do_read == 1:
             # ccc = self.i2c.read(slave, 0x1, 0, 8)
             self.i2c.write(slave, 0x0, 0, 8, 0x80)
             # gg = self.i2c.read(slave, 0x1, 0, 8)
@@ -398,13 +582,15 @@ class UCIe_2p5D:
             # self.i2c.write(slave, 0x2, 0, 8, 0x21)
             # self.i2c.write(slave, 0x3, 0, 8, 0x00)
             self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
-            # self.indirect_read_chk(slave, top=top)
+            if chk:
+                self.indirect_read_chk(slave, top=top)
 
             rd_data = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
+            self._cache_put(slave, address_map, rd_data, top)
             if b_len_map == 0:
                 rd_data = 0
             else:
-                rd_data = self.i2c._rol(rd_data >> (s_bit_map), 0, b_len_map)
+                rd_data = field_map.extract(rd_data)
 
             val = rd_data
             if read_next == 1:
@@ -412,16 +598,19 @@ class UCIe_2p5D:
                     slave, apb_addr, 0, addr_len, address_map + 4
                 )  # abp address
                 self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
-                # self.indirect_read_chk(slave, top=top)
+                if chk:
+                    self.indirect_read_chk(slave, top=top)
 
                 rd_data_2 = int(self.i2c.read(slave, apb_rdat, 0, data_len), 16)
+                self._cache_put(slave, address_map + 4, rd_data_2, top)
                 if b_len_map_2 == 0:
                     rd_data_2 = 0
                 else:
-                    rd_data_2 = self.i2c._rol(rd_data_2, 0, b_len_map_2)
+                    rd_data_2 = field_map_2.extract(rd_data_2)
                 # mask = self.i2c._rol((0xffffffff << b_len_map_2), 0, 32)  # 32-bit mask
                 # rd_data_2 = rd_data_2 & mask  # clear bit-field
                 val = rd_data_2 * 2**b_len_map + rd_data
+        self._chk_report(chk, timeouts, "Read", slave, address)
 
         if self.save_log == 1:
             if slice_num == -1:
@@ -430,9 +619,9 @@ class UCIe_2p5D:
                 offset_skip_slice = address - ((int(self.slice_offset)) * slice_num)
                 content = f"{reg_source} indirect_read : slave={hex(slave)} , slice{slice_num}_offset={hex(address)}(offset={hex(offset_skip_slice)}), s_bit={bit} , (R) value=0x{val:0{int((b_len - 1) / 4) + 1}x}\n"
             if save_i2c_log:
-                textfile = open("TestTools/i2c_log.txt", "a+")
-                textfile.write(content)
-                textfile.close()
+                self.i2c_log.write(content)
+        if save_i2c_log:
+            self._trace(OP_READ, slave, address, bit, val, slice_num, reg_source, top)
 
         # self.i2c.write(0x01, 0xF, 0, 8, 0x80)  # read command
         # self.i2c.write(0x01, 0x3, 0, 32, 0x13004)  # abp address
@@ -441,49 +630,858 @@ class UCIe_2p5D:
 
         return f"0x{val:0{int((b_len - 1) / 4) + 1}x}"
 
+    def indirect_read_burst(self, slave, addresses, top=0, slice_num=0, **kwargs):
+        # 32-bit APB read of every address as one Pico batch (one exec), same
+        # value and i2c_log line as indirect_read(slave, address, "31:0")
+        die = kwargs.get("die", None)  # select the die once, None: as is
+        save_i2c_log = kwargs.get("save_i2c_log", 1)
+        reg_source = kwargs.get("reg_source", "< Code >")
+        chk = kwargs.get("chk", self.chk)  # 1: wait for EHOST done, 2: raise if not
+        chk_us = self.chk_deadline if chk else 0
+        timeouts = self.i2c.wait_stats["timeouts"]
+
+        if top == 1:
+            addr_len, apb_addr, apb_rdat, apb_rwcl, apb_rcmv = 32, 0x3, 0xB, 0xF, 0x80
+        else:
+            addr_len, apb_addr, apb_rdat, apb_rwcl, apb_rcmv = 32, 0x1, 0x8, 0xC, 0x2
+
+        words = sorted(
+            {a - (a % 4) for a in addresses}
+            | {a - (a % 4) + 4 for a in addresses if a % 4}
+        )
+        if die is not None:
+            self.die_sel(die=die)
+        if self.wc and any(self.reg_kind(word) for word in words):
+            self.write_combine_flush()
+        elif self.wc:
+            self.write_combine_flush(slave=slave, words=words)
+        value = {}
+        if self.apb_cache is not None:
+            for word in words:
+                rd_data = self._cache_get(slave, word, top)
+                if rd_data is not None:
+                    value[word] = rd_data
+        todo = [word for word in words if word not in value]
+        batch = self.i2c.batching and self.i2c.batch is None and todo
+        if batch:
+            self.i2c.begin_batch()
+        raw = []
+        if self.i2c.agent:
+            for word in todo:
+                raw.append(self.i2c.apb_rd(slave, word, top, chk_us))
+        elif todo:
+            self.i2c.write(slave, 0x0, 0, 8, 0x80)
+            for word in todo:
+                self.i2c.write(slave, apb_addr, 0, addr_len, word)  # abp address
+                self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
+                if chk:
+                    self.indirect_read_chk(slave, top=top)
+                raw.append(self.i2c.read(slave, apb_rdat, 0, 32))
+        if batch:
+            self.i2c.commit()
+        self._chk_report(chk, timeouts, "Read", slave, todo[0] if todo else 0)
+
+        for word, rd_data in zip(todo, raw):
+            value[word] = self._word(rd_data)
+            self._cache_put(slave, word, value[word], top)
+        result = {}
+        for address in addresses:
+            shift = (address % 4) * 8
+            word = address - (address % 4)
+            val = value[word] >> shift
+            if shift:
+                val |= self.i2c._truncate(value[word + 4] << (32 - shift), 32)
+            result[address] = val
+
+        if self.save_log == 1 and save_i2c_log:
+            content = ""
+            for address, val in result.items():
+                if slice_num == -1:
+                    content += f"{reg_source} indirect_read : slave={hex(slave)} , offset={hex(address)} , s_bit=31:0 , (R) value=0x{val:08x}\n"
+                else:
+                    offset_skip_slice = address - ((int(self.slice_offset)) * slice_num)
+                    content += f"{reg_source} indirect_read : slave={hex(slave)} , slice{slice_num}_offset={hex(address)}(offset={hex(offset_skip_slice)}), s_bit=31:0 , (R) value=0x{val:08x}\n"
+            self.i2c_log.write(content)
+        if save_i2c_log and self.trace is not None:
+            for address, val in result.items():
+                self._trace(
+                    OP_READ, slave, address, "31:0", val, slice_num, reg_source, top
+                )
+
+        return result
+
+    def slice_access(self, slave, offset, bit, slices, **kwargs):
+        # one field of every slice in slices: write data (None: no write), then
+        # read back if r_bk, as one Pico batch. Same APB values, cache and
+        # i2c_log lines as indirect_write / indirect_read slice by slice.
+        # In a caller's open batch the accesses are queued into it: the read
+        # backs are PicoResults, logged / cached / verified at its commit()
+        data = kwargs.get("data", None)
+        r_bk = kwargs.get("r_bk", 1)
+        before = kwargs.get("before", None)  # dict: slice -> field value before write
+        top = kwargs.get("top", 0)
+        reg_source = kwargs.get("reg_source", "< Code >")
+        chk = kwargs.get("chk", self.chk)  # 1: wait for EHOST done, 2: raise if not
+        chk_us = self.chk_deadline if chk else 0
+        timeouts = self.i2c.wait_stats["timeouts"]
+
+        field = bit_field(bit)
+        field_map = bit_field((field.lsb + (offset % 4) * 8, field.width))
+        outer = self.i2c.batching and self.i2c.batch is not None
+        if outer and (top != 0 or field_map.msb > 31):
+            raise Exception(
+                "slice_access of a TPORT / word-crossing field in an open Pico "
+                "batch, commit() first ..."
+            )
+        wc = self.wc is not None
+        if wc and outer:
+            # the buffered words go into the caller's batch first
+            self.write_combine_flush()
+            self.wc_stats["barriers"] += 1
+            wc = False
+        elif wc and top == 0 and data is not None and r_bk != 1:
+            words = [offset + n * self.slice_offset for n in slices]
+            if "ordered" in [self.reg_kind(w + k) for w in words for k in (0, 3)]:
+                # ordered words are not combined: barrier, then one batch
+                self.write_combine_flush()
+                self.wc_stats["barriers"] += 1
+                wc = False
+        if not self.i2c.batching or wc or top != 0 or field_map.msb > 31:
+            # write combining / TPORT / field into the next word: one by one
+            rbvs = []
+            for slice_n in slices:
+                address = offset + slice_n * self.slice_offset
+                if data is not None and before is not None:
+                    before[slice_n] = self.indirect_read(
+                        slave,
+                        address,
+                        bit,
+                        top=top,
+                        chk=chk,
+                        slice_num=slice_n,
+                        save_i2c_log=0,
+                    )
+                if data is not None:
+                    self.indirect_write(
+                        slave,
+                        address,
+                        bit,
+                        data,
+                        top=top,
+                        chk=chk,
+                        slice_num=slice_n,
+                        reg_source=reg_source,
+                    )
+                if r_bk == 1:
+                    rbv = self.indirect_read(
+                        slave,
+                        address,
+                        bit,
+                        top=top,
+                        chk=chk,
+                        slice_num=slice_n,
+                        reg_source=reg_source,
+                    )
+                    rbvs.append(rbv)
+            return rbvs
+
+        words = [offset - (offset % 4) + n * self.slice_offset for n in slices]
+        write = data is not None and 0 <= data < 2**field.width
+        if write:
+            self._verify_barrier(offset)
+        rd_data = {}
+        if (
+            write
+            and not self.i2c.agent
+            and (field_map.mask != 0xFFFFFFFF or before is not None)
+        ):
+            if outer:
+                # words not cached (None) are read and merged on the board
+                rd_data = {word: self._cache_get(slave, word) for word in words}
+            else:
+                # words to modify: cache, else one batch of reads
+                rd_data = self.indirect_read_burst(
+                    slave, words, save_i2c_log=0, chk=chk
+                )
+        if not outer:
+            self.i2c.begin_batch()
+        raw = []
+        enabled = False
+        for word in words:
+            if write and self.i2c.agent and before is not None:
+                rd = self._cache_get(slave, word)  # read in the same batch
+                rd_data[word] = (
+                    rd if rd is not None else self.i2c.apb_rd(slave, word, 0, chk_us)
+                )
+            if write and self.i2c.agent:
+                wr_data = field_map.insert(0, data)
+                self.i2c.apb_wr(slave, word, field_map.mask, wr_data, 0, chk_us)
+                self._cache_put(slave, word, wr_data, 0, field_map.mask)
+            elif write and word in rd_data and rd_data[word] is None:
+                if not enabled:
+                    self.i2c.write(slave, 0x0, 0, 8, 0x80)
+                    enabled = True
+                self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+                self.i2c.write(slave, 0xC, 0, 8, 0x2)  # read command
+                if chk:
+                    self.indirect_read_chk(slave)
+                if before is not None:
+                    rd_data[word] = self.i2c.read(slave, 0x8, 0, 32)
+                # read data merged into the write data on the board
+                wr_data = field_map.insert(0, data)
+                self.i2c.write_merged(slave, 0x8, 0x4, field_map.mask, wr_data)
+                self.i2c.write(slave, 0xC, 0, 8, 0x1)  # write command
+                if chk:
+                    self.indirect_write_chk(slave)
+            elif write:
+                wr_data = field_map.insert(rd_data.get(word, 0), data)
+                self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+                self.i2c.write(slave, 0x4, 0, 32, wr_data)  # 32bit write
+                self.i2c.write(slave, 0xC, 0, 8, 0x1)  # write command
+                if chk:
+                    self.indirect_write_chk(slave)
+                self._cache_put(slave, word, wr_data)
+            if r_bk != 1:
+                continue
+            rd = self._cache_get(slave, word)
+            if rd is None and self.i2c.agent:
+                rd = self.i2c.apb_rd(slave, word, 0, chk_us)
+            elif rd is None:
+                if not enabled:
+                    self.i2c.write(slave, 0x0, 0, 8, 0x80)
+                    enabled = True
+                self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+                self.i2c.write(slave, 0xC, 0, 8, 0x2)  # read command
+                if chk:
+                    self.indirect_read_chk(slave)
+                rd = self.i2c.read(slave, 0x8, 0, 32)
+            raw.append(rd)
+        if not outer:
+            self.i2c.commit()
+        self._chk_report(
+            chk, timeouts, "Read" if data is None else "Write", slave, offset
+        )
+        die_byte = self.i2c.mux_state.get(0x70)
+
+        def finish():
+            if write and self.apb_cache and self.reg_kind(offset) == "ordered":
+                self.cache_invalidate(slave, die_byte=die_byte)
+            if write:
+                wr_data = field_map.insert(0, data)
+                self._verify_write(slave, [(w, field_map.mask, wr_data) for w in words])
+
+            rbvs = []
+            content = ""
+            for i, slice_n in enumerate(slices):
+                address = offset + slice_n * self.slice_offset
+                if write and before is not None:
+                    rd = self._word(rd_data[words[i]])
+                    before[slice_n] = (
+                        f"0x{field_map.extract(rd):0{int((field.width - 1) / 4) + 1}x}"
+                    )
+                if data is not None:
+                    content += f"{reg_source} Indirect_Write : Slave={hex(slave)} , Slice{slice_n}_Offset={hex(address)}(Offset={hex(offset)}) , Bit={bit} , (W) Value={hex(data)}\n"
+                    self._trace(
+                        OP_WRITE, slave, address, bit, data, slice_n, reg_source
+                    )
+                    if not write:
+                        print("wrong input value")
+                if r_bk != 1:
+                    continue
+                rd = self._word(raw[i])
+                self._cache_put(slave, words[i], rd)
+                rbv = f"0x{field_map.extract(rd):0{int((field.width - 1) / 4) + 1}x}"
+                content += f"{reg_source} indirect_read : slave={hex(slave)} , slice{slice_n}_offset={hex(address)}(offset={hex(offset)}), s_bit={bit} , (R) value={rbv}\n"
+                self._trace(
+                    OP_READ, slave, address, bit, int(rbv, 16), slice_n, reg_source
+                )
+                rbvs.append(rbv)
+            if self.save_log == 1 and content:
+                self.i2c_log.write(content)
+            return rbvs
+
+        if not outer:
+            return finish()
+        results = [PicoResult() for _ in slices] if r_bk == 1 else []
+
+        def done(timeouts):
+            for result, rbv in zip(results, finish()):
+                result.set(rbv)
+
+        self.i2c.on_commit(done)
+        return results
+
+    def broadcast_write(self, slave, address, bit, data, slices, **kwargs):
+        # same field value into address of every slice in slices (+ n *
+        # slice_offset): one burst read, one batch of writes. Returns the field
+        # value of each slice before the write, {slice: "0x.."} ({} if before=0:
+        # the pico_agent masked write then needs no read at all)
+        before = {} if kwargs.pop("before", 1) else None
+        self.slice_access(
+            slave, address, bit, slices, data=data, r_bk=0, before=before, **kwargs
+        )
+        return before or {}
+
+    def slice_field(self, ftn_name, offset, bit, die, group, **kwargs):
+        # body of the per-slice field wrappers (RX_PCS_*, cfg_cck_*, ...)
+        doset = kwargs.get("doset", 1)
+        setv = kwargs.get("setv", "0x1")
+        r_bk = kwargs.get("r_bk", 0)
+        show = kwargs.get("show", 0)
+        slice = kwargs.get("slice", [0, 1, 2, 3])
+        label = kwargs.get("label", self.GROUP_NUM[group])  # group in the prints
+        echo = kwargs.get("echo", 1)  # 0: return the read back without print
+
+        data = None
+        if doset == 1:
+            data = int(setv, 16) if isinstance(setv, str) else setv
+        self.die_sel(die=die)
+        before = None
+        if data is not None and r_bk != 1:
+            before = self.broadcast_write(
+                self.EHOST[die][group], offset, bit, data, slice, before=show
+            )
+            rbvs = []
+        else:
+            rbvs = self.slice_access(
+                self.EHOST[die][group], offset, bit, slice, data=data, r_bk=r_bk
+            )
+        if show == 1:
+            print(
+                f"{ftn_name} set to {setv} for die{die} {label} S#{self.slice_offset} "
+                + (f"(was {list(before.values())})" if before else "")
+            )
+        if r_bk == 1 and echo == 1:
+            print(
+                f"{ftn_name} for die{die} {label} S#{self.slice_offset} = {rbvs}",
+                flush=True,
+            )
+        return rbvs
+
+    def reg_get(self, name, die, group, **kwargs):
+        # register map field by name on every slice (one batch), hex strings
+        slices = kwargs.get("slices", [0, 1, 2, 3])
+        source = kwargs.get("source", None)  # block of a name used twice
+        chk = kwargs.get("chk", self.chk)
+
+        field = self.reg_map().field(name, source)
+        self.die_sel(die=die)
+        return self.slice_access(
+            self.EHOST[die][group], field.address, field.bit, slices, chk=chk
+        )
+
+    def reg_set(self, name, die, group, value, **kwargs):
+        # write a register map field by name on every slice (one batch);
+        # r_bk=1 returns the read back values
+        slices = kwargs.get("slices", [0, 1, 2, 3])
+        source = kwargs.get("source", None)  # block of a name used twice
+        r_bk = kwargs.get("r_bk", 0)
+        chk = kwargs.get("chk", self.chk)
+
+        field = self.reg_map().field(name, source)
+        if field.access == "RO":
+            raise Exception(f"{field.name} is read only")
+        self.die_sel(die=die)
+        return self.slice_access(
+            self.EHOST[die][group],
+            field.address,
+            field.bit,
+            slices,
+            data=value,
+            r_bk=r_bk,
+            chk=chk,
+        )
+
+    def write_combine_begin(self):
+        # buffer top=0 indirect_write fields per (die, slave, word) until a
+        # barrier; returns False if a buffer is already open (caller must not end)
+        if self.wc is not None:
+            return False
+        if not self.reg_map():
+            return False  # no register map, write through
+        self.wc = {}
+        return True
+
+    def write_combine_end(self):
+        self.write_combine_flush()
+        self.wc = None
+
+    def reg_map(self):
+        # RegisterMap of the Slice_Map datasheet, loaded on first use
+        if self.regmap is None:
+            self.regmap = RegisterMap(self.reg_map_dir)
+        return self.regmap
+
+    def reg_kind(self, address):
+        # "ordered": writes stay in program order (W1C/W1S, resets, triggers)
+        # "status": RO fields, a read sees every earlier write; None: plain RW
+        if not self.reg_map():
+            return "ordered"
+        return self.regmap.kind(address)
+
+    def _write_combine_put(self, key, field, data):
+        mask, value = self.wc.get(key, (0, 0))
+        self.wc[key] = (mask | field.mask, field.insert(value, data))
+        self.wc_stats["fields"] += 1
+
+    def write_combine_flush(self, **kwargs):
+        # barrier: one read-modify-write per buffered word, in first-write order;
+        # slave/words: only those words of the selected die (before a read)
+        slave = kwargs.get("slave", None)
+        words = kwargs.get("words", [])
+
+        if not self.wc:
+            return
+        die_byte = self.i2c.mux_state.get(0x70)
+        # selected die first, then die by die: one 0x70 switch and one batch per die
+        dies = {}
+        for key in sorted(self.wc, key=lambda k: (k[0] != die_byte, k[0])):
+            if slave is not None and (
+                key[0] != die_byte or key[1] != slave or key[2] not in words
+            ):
+                continue
+            mask, value = self.wc.pop(key)
+            dies.setdefault(key[0], []).append((key[1], key[2], mask, value))
+        for die, die_words in dies.items():
+            if die != self.i2c.mux_state.get(0x70):
+                self.i2c.mux_select(0x70, die)
+            self._write_combine_words(die_words)
+            self.wc_stats["words"] += len(die_words)
+        if die_byte is not None and die_byte != self.i2c.mux_state.get(0x70):
+            self.i2c.mux_select(0x70, die_byte)
+
+    def _write_combine_words(self, words):
+        # buffered (slave, word, mask, value) of one die as one Pico batch; the
+        # REPL reads the partial words missing from the cache in a batch first
+        if not self.i2c.batching or self.i2c.batch is not None or len(words) == 1:
+            for slave, word, mask, value in words:
+                self._write_combine_word(slave, word, mask, value)
+            return
+        timeouts = self.i2c.wait_stats["timeouts"]
+        chk_us = self.chk_deadline if self.chk else 0
+        rd_data = {}
+        if not self.i2c.agent:
+            for slave, word, mask, value in words:
+                if mask != 0xFFFFFFFF:
+                    rd_data[(slave, word)] = self._cache_get(slave, word)
+            todo = [key for key, rd in rd_data.items() if rd is None]
+            if todo:
+                self.i2c.begin_batch()
+                raw = []
+                for slave, word in todo:
+                    self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+                    self.i2c.write(slave, 0xC, 0, 8, 0x2)  # read command
+                    if self.chk:
+                        self.indirect_read_chk(slave)
+                    raw.append(self.i2c.read(slave, 0x8, 0, 32))
+                self.i2c.commit()
+                rd_data.update(zip(todo, (self._word(rd) for rd in raw)))
+        self.i2c.begin_batch()
+        for slave, word, mask, value in words:
+            if self.i2c.agent:
+                self.i2c.apb_wr(slave, word, mask, value, 0, chk_us)
+                self._cache_put(slave, word, value, 0, mask)
+                continue
+            if mask != 0xFFFFFFFF:
+                value = (rd_data[(slave, word)] & ~mask) | value
+            self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+            self.i2c.write(slave, 0x4, 0, 32, value)  # 32bit write
+            self.i2c.write(slave, 0xC, 0, 8, 0x1)  # write command
+            if self.chk:
+                self.indirect_write_chk(slave)
+            self._cache_put(slave, word, value)
+        self.i2c.commit()
+        self._chk_report(self.chk, timeouts, "Write", words[0][0], words[0][1])
+
+    def _write_combine_word(self, slave, word, mask, value):
+        # same bus sequence as indirect_write for a top=0 word
+        timeouts = self.i2c.wait_stats["timeouts"]
+        if self.i2c.agent:
+            self.i2c.apb_wr(
+                slave, word, mask, value, 0, self.chk_deadline if self.chk else 0
+            )
+            self._cache_put(slave, word, value, 0, mask)
+            self._chk_report(self.chk, timeouts, "Write", slave, word)
+            return
+        self.i2c.write(slave, 0x1, 0, 32, word)  # abp address
+        if mask != 0xFFFFFFFF:
+            rd_data = self._cache_get(slave, word)
+            if rd_data is None:
+                self.i2c.write(slave, 0xC, 0, 8, 0x2)  # read command
+                if self.chk:
+                    self.indirect_read_chk(slave)
+            if rd_data is None and self.i2c.queueing():
+                # caller's batch open: read data merged into the write data on
+                # the board, the word is not known here (not cached)
+                self.i2c.write_merged(slave, 0x8, 0x4, mask, value)
+                self.i2c.write(slave, 0xC, 0, 8, 0x1)  # write command
+                if self.chk:
+                    self.indirect_write_chk(slave)
+                self._chk_report(self.chk, timeouts, "Write", slave, word)
+                return
+            if rd_data is None:
+                rd_data = self._word(self.i2c.read(slave, 0x8, 0, 32))
+            value = (rd_data & ~mask) | value
+        self.i2c.write(slave, 0x4, 0, 32, value)  # 32bit write
+        self.i2c.write(slave, 0xC, 0, 8, 0x1)  # write command
+        if self.chk:
+            self.indirect_write_chk(slave)
+        self._cache_put(slave, word, value)
+        self._chk_report(self.chk, timeouts, "Write", slave, word)
+
+    def cache_setup(self, **kwargs):
+        # shadow of top=0 APB words per (0x70 byte, slave, word); volatile words
+        # (map "ordered" / "status" kinds, volatile offsets) always go to the bus
+        cache = kwargs.get("cache", 1)
+        self.cache_volatile = kwargs.get("volatile", APB_VOLATILE)  # slice offsets
+
+        self.apb_cache = {} if cache else None
+        self.cache_epoch = self.i2c.shadow_epoch
+        self.cache_stats = {"hits": 0, "misses": 0, "bypass": 0, "invalidations": 0}
+        if cache:
+            self.reg_map()
+
+    def cache_invalidate(self, slave=None, **kwargs):
+        # drop cached words: all, or one slave; die_byte: only that 0x70 selection
+        die_byte = kwargs.get("die_byte", None)
+
+        if not self.apb_cache:
+            return
+        for key in list(self.apb_cache):
+            if (slave is None or key[1] == slave) and (
+                die_byte is None or key[0] & die_byte
+            ):
+                del self.apb_cache[key]
+        self.cache_stats["invalidations"] += 1
+
+    def _cache_key(self, slave, word, top=0):
+        # cache key of an APB word, None: not cacheable, read / write the bus
+        if self.apb_cache is None or top != 0:
+            return None
+        if self.cache_epoch != self.i2c.shadow_epoch:
+            self.apb_cache.clear()  # reset pins / reconnect / failed batch
+            self.cache_epoch = self.i2c.shadow_epoch
+        die_byte = self.i2c.mux_state.get(0x70)
+        if die_byte not in (0x01, 0x02, 0x04):
+            return None
+        if self.reg_kind(word) or word % self.slice_offset in self.cache_volatile:
+            return None
+        return (die_byte, slave, word)
+
+    def _cache_get(self, slave, word, top=0):
+        key = self._cache_key(slave, word, top)
+        if key is None:
+            if self.apb_cache is not None:
+                self.cache_stats["bypass"] += 1
+            return None
+        value = self.apb_cache.get(key)
+        self.cache_stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    @staticmethod
+    def _word(value):
+        # APB word of a read: int, hex string or (batched) PicoResult
+        if isinstance(value, PicoResult):
+            value = value.get()
+        return int(value, 16) if isinstance(value, str) else value
+
+    def _cache_put(self, slave, word, value, top=0, mask=0xFFFFFFFF):
+        # word written / read on the bus; a partial write only updates a cached word
+        if self.apb_cache is None:
+            return
+        value = self._word(value)
+        key = self._cache_key(slave, word, top)
+        if key is None:
+            die_byte = self.i2c.mux_state.get(0x70)
+            if top == 0 and die_byte not in (None, 0x01, 0x02, 0x04):
+                self.cache_invalidate(slave, die_byte=die_byte)  # several dies
+            return
+        if mask == 0xFFFFFFFF:
+            self.apb_cache[key] = value
+        elif key in self.apb_cache:
+            self.apb_cache[key] = (self.apb_cache[key] & ~mask) | (value & mask)
+
+    def verify_cache(self, **kwargs):
+        # re-read every cached word and compare, wrong words are dropped;
+        # returns [(die, slave, word, cache, live), ...]
+        show = kwargs.get("show", 1)
+
+        if not self.apb_cache:
+            return []
+        die_byte = self.i2c.mux_state.get(0x70)
+        diff = []
+        for key in sorted(self.apb_cache, key=lambda k: (k[0] != die_byte, k)):
+            if key not in self.apb_cache:
+                continue
+            if key[0] != self.i2c.mux_state.get(0x70):
+                self.i2c.mux_select(0x70, key[0])
+            if self.i2c.agent:
+                live = self.i2c.apb_rd(key[1], key[2], 0)
+            else:
+                self.i2c.write(key[1], 0x1, 0, 32, key[2])  # abp address
+                self.i2c.write(key[1], 0xC, 0, 8, 0x2)  # read command
+                live = int(self.i2c.read(key[1], 0x8, 0, 32), 16)
+            if live != self.apb_cache[key]:
+                die = {0x01: 0, 0x02: 1, 0x04: 2}[key[0]]
+                diff.append((die, key[1], key[2], self.apb_cache.pop(key), live))
+        if die_byte is not None and die_byte != self.i2c.mux_state.get(0x70):
+            self.i2c.mux_select(0x70, die_byte)
+        if show == 1:
+            print(f"APB cache verify : {len(diff)} word(s) differ", flush=True)
+            if diff:
+                table = [
+                    [f"Die{d}", hex(sl), hex(w), f"0x{c:08x}", f"0x{l:08x}"]
+                    for d, sl, w, c, l in diff
+                ]
+                print(
+                    tabulate(
+                        table, headers=["Die", "Slave", "Address", "Cache", "Live"]
+                    ),
+                    flush=True,
+                )
+        return diff
+
+    def chk_setup(self, **kwargs):
+        # EHOST done check after every APB command: the Pico polls the status
+        # byte with backoff until deadline_us, one round trip per check
+        self.chk = kwargs.get("chk", 1)  # 0: off, 1: report a timeout, 2: raise
+        self.chk_deadline = kwargs.get("deadline_us", 2000)
+        self.chk_stats = {"failed": 0}  # accesses with a timed out check
+        self.chk_batch = []  # (chk, op, slave, address) checked in an open batch
+
+    def _chk_report(self, chk, timeouts, op, slave, address):
+        # a check of this access timed out (Pico wait_stats moved past timeouts)
+        if not chk:
+            return
+        if self.i2c.batching and self.i2c.batch is not None:
+            # the waits only run at commit(): one report from the batch's
+            if self._chk_commit not in self.i2c.commit_hooks:
+                self.chk_batch = []  # left by a batch that failed
+                self.i2c.on_commit(self._chk_commit)
+            self.chk_batch.append((chk, op, slave, address))
+            return
+        if self.i2c.wait_stats["timeouts"] == timeouts:
+            return
+        self.chk_stats["failed"] += 1
+        content = (
+            f"{op} APB failed : Slave={hex(slave)} , Offset={hex(address)} not "
+            f"ready in {self.chk_deadline} us"
+        )
+        if chk == 2:
+            raise Exception(content)
+        print(content, flush=True)
+
+    def _chk_commit(self, timeouts):
+        # commit() of a batch with checked accesses: timeouts of its waits
+        accesses, self.chk_batch = self.chk_batch, []
+        if not timeouts:
+            return
+        self.chk_stats["failed"] += min(timeouts, len(accesses))
+        chk, op, slave, address = accesses[0]
+        content = (
+            f"{op} APB failed : {timeouts} check(s) of a {len(accesses)} access "
+            f"batch not ready in {self.chk_deadline} us , first Slave={hex(slave)} "
+            f", Offset={hex(address)}"
+        )
+        if max(a[0] for a in accesses) == 2:
+            raise Exception(content)
+        print(content, flush=True)
+
     def indirect_write_chk(self, slave, **kwargs):
         top = kwargs.get("top", 0)
-        ck_times = kwargs.get("ck_times", 10)
+        deadline_us = kwargs.get("deadline_us", self.chk_deadline)
 
         if top == 1:
             apb_rwcl = 0x10
-            apb_stsb = 0
-            apb_stsl = 2
+            apb_stsm = 0x03  # [0] ready [1] error
+            apb_stsv = 0x01
         else:
             apb_rwcl = 0xC
-            apb_stsb = 6
-            apb_stsl = 1
-        for i in range(ck_times):
-            result = int(self.i2c.read(slave, apb_rwcl, apb_stsb, apb_stsl), 16)
-            if result == 1:
-                break
-            # time.sleep(0.05)
-        if result != 1:  # ready and no error
-            fail_status = "Write APB failed"
-            # print(f'\033{self.Prog_module} write to APB failed! -------------------------------------------------------------------------------------------', flush=True)
-            # sys.stdout.flush()
+            apb_stsm = 0x40  # write done
+            apb_stsv = 0x40
+        return self.i2c.wait_ready(
+            slave, apb_rwcl, apb_stsm, apb_stsv, deadline_us=deadline_us
+        )
 
     def indirect_read_chk(self, slave, **kwargs):
         top = kwargs.get("top", 0)
-        ck_times = kwargs.get("ck_times", 10)
+        deadline_us = kwargs.get("deadline_us", self.chk_deadline)
 
         if top == 1:
-            apb_rwcl = 0x10  #
-            apb_stsb = 0
-            apb_stsl = 2
+            apb_rwcl = 0x10
+            apb_stsm = 0x03  # [0] ready [1] error
+            apb_stsv = 0x01
         else:
             apb_rwcl = 0xC
-            apb_stsb = 7
-            apb_stsl = 1
-        for i in range(ck_times):
-            result = int(self.i2c.read(slave, apb_rwcl, apb_stsb, apb_stsl), 16)
-            if result == 1:
-                break
-            # time.sleep(0.05)
-        if result != 1:  # ready and no error, [0] ready [1] error
-            fail_status = "Read APB failed"
-            # print(f'\033{self.Prog_module} read from APB failed! -------------------------------------------------------------------------------------------', flush=True)
-            # sys.stdout.flush()
+            apb_stsm = 0x80  # read done
+            apb_stsv = 0x80
+        return self.i2c.wait_ready(
+            slave, apb_rwcl, apb_stsm, apb_stsv, deadline_us=deadline_us
+        )
+
+    def verify_setup(self, **kwargs):
+        # read back of APB writes: "none", "sampled" (every Nth write or with
+        # probability p), "deferred" (kept until verify_flush(), reg_user_set
+        # flushes at the end of the sequence) or "strict" (every write)
+        mode = kwargs.get("mode", "strict")
+        if mode not in VERIFY_MODES:
+            raise Exception(f"verify mode {mode} not in {VERIFY_MODES}")
+        self.verify_mode = mode
+        self.verify_every = kwargs.get("every", 10)  # sampled: every Nth write
+        self.verify_p = kwargs.get("p", None)  # sampled: probability, over every
+        self.verify_rng = random.Random(kwargs.get("seed", None))
+        self.verify_fail = kwargs.get("fail", 1)  # 1: report a mismatch, 2: raise
+        self.verify_volatile = kwargs.get("volatile", APB_VOLATILE)  # slice offsets
+        # PG1_SI5396C_Register_Library mode of its own: strict, the read back
+        # it always had, whatever the APB mode
+        self.verify_si5396c = kwargs.get("si5396c", "strict")
+        if self.verify_si5396c not in VERIFY_MODES:
+            raise Exception(f"verify mode {self.verify_si5396c} not in {VERIFY_MODES}")
+        self.verify_pending = {}  # (0x70 byte, slave, word, top) -> (mask, value)
+        self.verify_mismatch = []  # (die, slave, word, mask, expect, live, names)
+        self.verify_stats = {"writes": 0, "checked": 0, "reads": 0, "mismatches": 0}
+        if mode != "none":
+            self.reg_map()
+
+    def _verify_write(self, slave, words, top=0):
+        # words [(word, mask, value), ...] written on the selected die: keep the
+        # ones the mode checks, strict / sampled read them back at once
+        if self.verify_mode == "none":
+            return
+        die_byte = self.i2c.mux_state.get(0x70)
+        if die_byte not in (0x01, 0x02, 0x04):
+            return  # no single die to read back from
+        for word, mask, value in words:
+            if self.reg_kind(word) == "ordered":
+                continue  # W1C / reset / start: the read back differs
+            if top == 0 and word % self.slice_offset in self.verify_volatile:
+                continue
+            if not self._verify_sample():
+                continue
+            key = (die_byte, slave, word, top)
+            pend_mask, pend_value = self.verify_pending.get(key, (0, 0))
+            self.verify_pending[key] = (
+                pend_mask | mask,
+                (pend_value & ~mask) | (value & mask),
+            )
+        if (
+            self.verify_mode != "deferred"
+            and self.verify_pending
+            and self.i2c.batch is None  # in a caller's batch: at the next flush
+        ):
+            self.verify_flush()
+
+    def _verify_sample(self, mode=None):
+        # count one write, True if the mode (default verify_mode) checks it
+        mode = self.verify_mode if mode is None else mode
+        self.verify_stats["writes"] += 1
+        if mode != "sampled":
+            return mode != "none"
+        if self.verify_p is not None:
+            return self.verify_rng.random() < self.verify_p
+        return self.verify_stats["writes"] % self.verify_every == 0
+
+    def _verify_barrier(self, address, top=0):
+        # deferred writes are checked before a write that may change them
+        # (top=1, reset / W1C / start word)
+        if self.verify_pending and (top == 1 or self.reg_kind(address) == "ordered"):
+            self.verify_flush()
+
+    def verify_flush(self, **kwargs):
+        # read back every pending word, one Pico batch per die, and compare the
+        # written bits; returns the mismatches [(die, slave, word, mask, expect,
+        # live, names), ...]
+        show = kwargs.get("show", 1)
+
+        if self.wc:
+            self.write_combine_flush()  # the combined words are not written yet
+        if not self.verify_pending:
+            return []
+        pending, self.verify_pending = self.verify_pending, {}
+        die_byte = self.i2c.mux_state.get(0x70)
+        dies = {}
+        for key in sorted(pending, key=lambda k: (k[0] != die_byte, k)):
+            dies.setdefault(key[0], []).append(key)
+        mismatch = []
+        for die, keys in dies.items():
+            if die != self.i2c.mux_state.get(0x70):
+                self.i2c.mux_select(0x70, die)
+            raw = self._verify_read(keys)
+            for key, rd in zip(keys, raw):
+                live = self._word(rd)
+                self._cache_put(key[1], key[2], live, key[3])
+                mask, expect = pending[key]
+                if live & mask == expect:
+                    continue
+                diff = (live ^ expect) & mask
+                names = self.reg_map().describe(key[2], diff) if not key[3] else "TPORT"
+                mismatch.append(
+                    (
+                        {0x01: 0, 0x02: 1, 0x04: 2}[die],
+                        key[1],
+                        key[2],
+                        mask,
+                        expect,
+                        live & mask,
+                        names,
+                    )
+                )
+        if die_byte is not None and die_byte != self.i2c.mux_state.get(0x70):
+            self.i2c.mux_select(0x70, die_byte)
+        self.verify_stats["checked"] += len(pending)
+        self.verify_stats["mismatches"] += len(mismatch)
+        self.verify_mismatch += mismatch
+        if mismatch and (show == 1 or self.verify_fail == 2):
+            table = [
+                [
+                    f"Die{d}",
+                    hex(sl),
+                    hex(w),
+                    f"0x{m:08x}",
+                    f"0x{e:08x}",
+                    f"0x{l:08x}",
+                    n,
+                ]
+                for d, sl, w, m, e, l, n in mismatch
+            ]
+            content = f"APB write verify : {len(mismatch)} word(s) differ\n" + tabulate(
+                table,
+                headers=["Die", "Slave", "Address", "Mask", "Write", "Read", "Field"],
+            )
+            if self.verify_fail == 2:
+                raise Exception(content)
+            print(content, flush=True)
+        return mismatch
+
+    def _verify_read(self, keys):
+        # 32-bit reads of [(0x70 byte, slave, word, top), ...] on the selected
+        # die as one Pico batch, bypassing the APB cache
+        self.verify_stats["reads"] += len(keys)
+        chk_us = self.chk_deadline if self.chk else 0
+        batch = self.i2c.batching and self.i2c.batch is None
+        if batch:
+            self.i2c.begin_batch()
+        raw = []
+        enabled = set()
+        for _, slave, word, top in keys:
+            if self.i2c.agent:
+                raw.append(self.i2c.apb_rd(slave, word, top, chk_us))
+                continue
+            if top == 1:
+                apb_addr, apb_rdat, apb_rwcl, apb_rcmv = 0x3, 0xB, 0xF, 0x80
+            else:
+                apb_addr, apb_rdat, apb_rwcl, apb_rcmv = 0x1, 0x8, 0xC, 0x2
+                if slave not in enabled:
+                    self.i2c.write(slave, 0x0, 0, 8, 0x80)
+                    enabled.add(slave)
+            self.i2c.write(slave, apb_addr, 0, 32, word)  # abp address
+            self.i2c.write(slave, apb_rwcl, 0, 8, apb_rcmv)  # read command
+            if self.chk:
+                self.indirect_read_chk(slave, top=top)
+            raw.append(self.i2c.read(slave, apb_rdat, 0, 32))
+        if batch:
+            self.i2c.commit()
+        return raw
 
     def reg_map_set(self, die, group, slices, **kwargs):
         reg_arr = kwargs.get("reg_arr", [])
@@ -627,9 +1625,51 @@ class UCIe_2p5D:
                                 )
 
     def reg_user_set(self, **kwargs):
+        combine = kwargs.get("combine", 1)  # 1: one RMW per APB word of the sequence
+        chk = kwargs.get("chk", self.chk)  # EHOST done check for the whole sequence
+        show = kwargs.get("show", 1)
+        verify = kwargs.get("verify", self.verify_mode)  # write read back mode
+
+        if verify not in VERIFY_MODES:
+            raise Exception(f"verify mode {verify} not in {VERIFY_MODES}")
+        plan = self.reg_plan(**kwargs)
+        chk_prev, self.chk = self.chk, chk
+        verify_prev, self.verify_mode = self.verify_mode, verify
+        opened = combine == 1 and self.write_combine_begin()
+        try:
+            rd_value = self.reg_plan_run(plan, show=show)
+            if opened:
+                self.write_combine_end()
+                opened = False
+            if verify == "deferred":
+                self.verify_flush()  # one read-compare batch per die
+            return rd_value
+        finally:
+            if opened:
+                self.write_combine_end()
+            self.chk = chk_prev
+            self.verify_mode = verify_prev
+
+    def reg_plan(self, **kwargs):
+        # compiled reg_user_set sequence, cached by a hash of reg_arr and the
+        # die / group / slice arguments (show / combine / chk are run options)
+        key = hashlib.sha1(
+            repr([kwargs.get(name, default) for name, default in PLAN_ARGS]).encode()
+        ).hexdigest()
+        plan = self.plan_cache.get(key)
+        if plan is not None:
+            self.plan_stats["hits"] += 1
+            return plan
+        plan = self._reg_plan_compile(**kwargs)
+        if len(self.plan_cache) >= self.plan_cache_size:
+            del self.plan_cache[next(iter(self.plan_cache))]  # oldest plan
+        self.plan_cache[key] = plan
+        self.plan_stats["compiles"] += 1
+        return plan
+
+    def _reg_plan_compile(self, **kwargs):
         reg_arr = kwargs.get("reg_arr", [])
         mode = kwargs.get("mode", "mode")
-        show = kwargs.get("show", 1)
         gui_die_sel = kwargs.get("gui_die_sel", 1)
         gui_group_num = kwargs.get("gui_group_num", 1)
         gui_slice_num = kwargs.get("gui_slice_num", 1)
@@ -638,217 +1678,223 @@ class UCIe_2p5D:
         tx_slice = kwargs.get("tx_slice", [0, 1, 2, 3])
         rx_slice = kwargs.get("rx_slice", [0, 1, 2, 3])
 
-        for i in range(len(reg_arr)):
-            reg_list = (reg_arr[i]).split(",")
+        ops = []
+        setv = None  # a "nan" value keeps the value of the line before
+        for line, reg in enumerate(reg_arr):
+            reg_list = reg.split(",")
             offset = int(reg_list[0], 16)
             bit = (reg_list[1]).strip()
-            if (reg_list[2]).strip() == "nan":
-                pass
-            else:
+            field = bit_field(bit)
+            if (reg_list[2]).strip() != "nan":
                 setv = int((reg_list[2]).strip(), 16)
             edit_log = reg_list[3]
             TPORT = (reg_list[4]).strip()
-            write_en = (reg_list[5]).strip()
-            read_en = (reg_list[6]).strip()
+            write_en = (reg_list[5]).strip().find("nan") == -1
+            read_en = (reg_list[6]).strip().find("nan") == -1
             die_list = (reg_list[7]).split("/")
             V_list = (reg_list[8]).split("/")
             slice_list = (reg_list[9]).split("/")
-
-            rd_value = "na"
-            if write_en.find("nan") == -1 or read_en.find("nan") == -1:
-                if mode == "gui_tree":
-                    die_list = [gui_die_sel]
-                    if gui_group_num == "TPORT":
-                        V_list = [0]
-                    elif gui_group_num == "H":
-                        V_list = [1]
-                    elif gui_group_num == "V":
-                        V_list = [2]
-                    else:
-                        pass
-                    slice_list = [gui_slice_num]
-                else:
-                    die_list = list(map(int, die_list))
-                    V_list = list(map(int, V_list))
-                    slice_list = list(map(int, slice_list))
-                    if (
-                        mode == "USER_mode" or offset == 16
-                    ):  # reg=0x10 only init Die1 V and H
-                        die_list = list(map(int, die_list))
-                        V_list = list(map(int, V_list))
-                        slice_list = list(map(int, slice_list))
-                    else:
-                        die_list = die_arr
-                        V_list = group_arr
-                        slice_list = slice
-
-            for s in range(len(die_list)):
-                # print(s,flush=True)
-                die = die_list[s]
-                self.die_sel(die=die)
-                if (
-                    mode == "USER_mode" or offset == 16 or mode == "gui_tree"
-                ):  # reg=0x10 only init Die1 V and H
-                    pass
-                else:
+            text = edit_log.find("nan") == -1  # print the line when show=1
+            if not write_en and not read_en:
+                continue
+            if write_en and setv is None:
+                raise Exception(f"reg_user_set : no value for line {line} : {reg}")
+
+            if mode == "gui_tree":
+                die_list = [gui_die_sel]
+                V_list = {"TPORT": [0], "H": [1], "V": [2]}.get(gui_group_num, V_list)
+                slice_list = [gui_slice_num]
+            elif mode == "USER_mode" or offset == 16:  # reg=0x10 only init Die1 V and H
+                die_list = list(map(int, die_list))
+                V_list = list(map(int, V_list))
+                slice_list = list(map(int, slice_list))
+            else:
+                die_list = die_arr
+                V_list = group_arr
+
+            def op(die, slave, address, read, slice_num=-1, top=0, show=None):
+                ops.append(
+                    PlanOp(
+                        line,
+                        die,
+                        slave,
+                        address,
+                        field,
+                        setv,
+                        read,
+                        slice_num,
+                        top,
+                        show if text else None,
+                    )
+                )
+
+            for s, die in enumerate(die_list):
+                selected = die  # die_sel of the loop, rg0010 switches to Die1
+                if mode not in ("USER_mode", "gui_tree") and offset != 16:
                     slice_list = tx_slice if s == 0 else rx_slice
-                if len(V_list) == 1:
-                    group = V_list[0]
-                else:
-                    group = V_list[0] if s == 0 else V_list[1]
+                group = V_list[0] if len(V_list) == 1 or s == 0 else V_list[1]
+                v_name = self.GROUP_NUM.get(group, "failed")
 
                 # TPORT reigster set
                 if TPORT.find("nan") == -1:
                     slave = self.EHOST[die][0]
                     info = f"Die{die}"
-                    if write_en.find("nan") == -1:
-                        self.indirect_write(
+                    if write_en:
+                        op(
+                            die,
                             slave,
                             offset,
-                            bit,
-                            setv,
-                            slice_num=-1,
+                            False,
                             top=1,
-                            reg_source="< User_Define >",
+                            show=f"({edit_log} {info} ) Indirect Write , offset={hex(offset)} [{bit}] , Register Value={hex(setv)}",
                         )
-                        if show == 1 and edit_log.find("nan") == -1:
-                            print(
-                                f"({edit_log} {info} ) Indirect Write , offset={hex(offset)} [{bit}] , Register Value={hex(setv)}"
-                            )
-                    else:
-                        pass
-                    if read_en.find("nan") == -1:
-                        rd_value = self.indirect_read(
+                    if read_en:
+                        op(
+                            die,
                             slave,
                             offset,
-                            bit,
-                            slice_num=-1,
+                            True,
                             top=1,
-                            reg_source="< User_Define >",
+                            show=f"({edit_log} {info} ) Indirect Read , offset={hex(offset)} [{bit}] , Register Value={{value}}",
                         )
-                        if show == 1 and edit_log.find("nan") == -1:
-                            print(
-                                f"({edit_log} {info} ) Indirect Read , offset={hex(offset)} [{bit}] , Register Value={(rd_value)}"
-                            )
-                    else:
-                        pass
-                # pll/slice register write
+                # pll register write, read back
+                elif self.pll_offset_min <= int(offset) < self.pll_offset_max:
+                    slave = self.EHOST[die][group]
+                    info = f"Die{die} {v_name}"
+                    if write_en:
+                        op(die, slave, offset, False)
+                        op(
+                            die,
+                            slave,
+                            offset,
+                            True,
+                            show=f"({edit_log} {info} ) Indirect Write , offset={hex(offset)} [{bit}] , Register Value={hex(setv)}",
+                        )
+                    elif read_en:
+                        op(
+                            die,
+                            slave,
+                            offset,
+                            True,
+                            show=f"({edit_log} {info} ) Indirect Read , offset={hex(offset)} [{bit}] , Register Value={{value}}",
+                        )
+                # slice register write
                 else:
-                    # pll register write
-                    if self.pll_offset_min <= int(offset) < self.pll_offset_max:
-                        if group == 0:
-                            v_name = "TPORT"
-                        elif group == 1:
-                            v_name = "H"
-                        elif group == 2:
-                            v_name = "V"
-                        else:
-                            v_name = "failed"
+                    for slice_num in map(int, slice_list):
+                        base = slice_num * self.slice_offset
                         slave = self.EHOST[die][group]
                         info = f"Die{die} {v_name}"
-                        if write_en.find("nan") == -1:
-                            self.indirect_write(
-                                slave,
-                                offset,
-                                bit,
-                                setv,
-                                slice_num=-1,
-                                reg_source="< User_Define >",
-                            )
-                            rd_value = self.indirect_read(
+                        show = (
+                            f"({edit_log} {info} ) Indirect Write = offset={hex(offset)} [{bit}] , Register Value={hex(setv)}"
+                            if write_en
+                            else None
+                        )
+                        if write_en and offset == 16 and bit == "10":
+                            # rg0010_start_link_training: Die1 H and V
+                            selected = 1
+                            op(1, 0x2, offset + base, False, slice_num)
+                            op(1, 0x3, offset + base, False, slice_num, show=show)
+                        elif write_en:
+                            op(
+                                selected,
                                 slave,
-                                offset,
-                                bit,
-                                slice_num=-1,
-                                reg_source="< User_Define >",
+                                offset + base,
+                                False,
+                                slice_num,
+                                show=show,
                             )
-                            if show == 1 and edit_log.find("nan") == -1:
-                                print(
-                                    f"({edit_log} {info} ) Indirect Write , offset={hex(offset)} [{bit}] , Register Value={hex(setv)}"
-                                )
-                        elif read_en.find("nan") == -1:
-                            rd_value = self.indirect_read(
+                        if read_en:
+                            op(
+                                selected,
                                 slave,
-                                offset,
-                                bit,
-                                slice_num=-1,
-                                reg_source="< User_Define >",
+                                offset + base,
+                                True,
+                                slice_num,
+                                show=f"({edit_log} {info} ) Indirect Read , offset={hex(offset + base)} [{bit}] , Register Value={{value}} Slice Number={slice_num}",
                             )
-                            if show == 1 and edit_log.find("nan") == -1:
-                                print(
-                                    f"({edit_log} {info} ) Indirect Read , offset={hex(offset)} [{bit}] , Register Value={(rd_value)}"
-                                )
-                        else:
-                            pass
-                    # slice register write
-                    else:
-                        if group == 0:
-                            v_name = "TPORT"
-                        elif group == 1:
-                            v_name = "H"
-                        elif group == 2:
-                            v_name = "V"
-                        else:
-                            v_name = "failed"
-                        for s in range(len(slice_list)):
-                            slice_num = int(slice_list[s])
-                            base = slice_num * self.slice_offset
-                            slave = self.EHOST[die][group]
-                            info = f"Die{die} {v_name}"
-                            if write_en.find("nan") == -1:
-                                if (
-                                    offset == 16 and bit == "10"
-                                ):  # rg0010_start_link_training
-                                    self.die_sel(die=1)
-                                    self.indirect_write(
-                                        0x2,
-                                        offset + base,
-                                        bit,
-                                        setv,
-                                        slice_num=slice_num,
-                                        reg_source="< User_Define >",
-                                    )
-                                    self.indirect_write(
-                                        0x3,
-                                        offset + base,
-                                        bit,
-                                        setv,
-                                        slice_num=slice_num,
-                                        reg_source="< User_Define >",
-                                    )
-                                else:
-                                    self.indirect_write(
-                                        slave,
-                                        offset + base,
-                                        bit,
-                                        setv,
-                                        slice_num=slice_num,
-                                        reg_source="< User_Define >",
-                                    )
-                                if show == 1 and edit_log.find("nan") == -1:
-                                    print(
-                                        f"({edit_log} {info} ) Indirect Write = offset={hex(offset)} [{bit}] , Register Value={hex(setv)}"
-                                    )
-                            else:
-                                pass
-                            if read_en.find("nan") == -1:
-                                rd_value = self.indirect_read(
-                                    slave,
-                                    offset + base,
-                                    bit,
-                                    slice_num=slice_num,
-                                    reg_source="< User_Define >",
-                                )
-                                if show == 1 and edit_log.find("nan") == -1:
-                                    print(
-                                        f"({edit_log} {info} ) Indirect Read , offset={hex(offset + base)} [{bit}] , Register Value={(rd_value)} Slice Number={slice_num}"
-                                    )
-                            else:
-                                pass
-                        else:
-                            pass
+
+        # plain RW writes between two barriers (read, TPORT, W1C / reset /
+        # start word) commute: group them by die and slave, one die_sel each
+        plan, run = [], []
+        for o in ops + [None]:
+            if o is not None and not (
+                o.read
+                or o.top
+                or "ordered" in (self.reg_kind(o.address), self.reg_kind(o.address + 3))
+            ):
+                run.append(o)
+                continue
+            plan += sorted(run, key=lambda o: (o.die, o.slave))
+            run = []
+            if o is not None:
+                plan.append(o)
+        last = [n for n, o in enumerate(plan) if o.read and o.line == len(reg_arr) - 1]
+        return RegPlan(tuple(plan), last[-1] if last else None)
+
+    def reg_plan_run(self, plan, **kwargs):
+        # run a compiled reg_user_set plan; returns the last read value of the
+        # last line, "na" if it has no read
+        show = kwargs.get("show", 1)
+
+        rd_value = "na"
+        die = None
+        slices = []  # slices of the broadcast_write the op is in
+        for n, op in enumerate(plan.ops):
+            if op.die != die:
+                self.die_sel(die=op.die)
+                die = op.die
+            if slices:
+                pass  # written with the first op of the broadcast
+            elif not op.read and op.slice_num >= 0 and not op.top:
+                # the field on the following slices: one broadcast_write (into
+                # the write combine buffer, or one batch for ordered words)
+                base = op.address - op.slice_num * self.slice_offset
+                slices = [op.slice_num]
+                for o in plan.ops[n + 1 :]:
+                    if (
+                        o.read
+                        or o.slice_num in slices
+                        or o.slice_num < 0
+                        or o.top
+                        or (o.die, o.slave, o.field, o.value)
+                        != (op.die, op.slave, op.field, op.value)
+                        or o.address - o.slice_num * self.slice_offset != base
+                    ):
+                        break
+                    slices.append(o.slice_num)
+                self.broadcast_write(
+                    op.slave,
+                    base,
+                    op.field,
+                    op.value,
+                    slices,
+                    before=0,
+                    reg_source="< User_Define >",
+                )
+            elif op.read:
+                value = self.indirect_read(
+                    op.slave,
+                    op.address,
+                    op.field,
+                    slice_num=op.slice_num,
+                    top=op.top,
+                    reg_source="< User_Define >",
+                )
+                if n == plan.result:
+                    rd_value = value
             else:
-                pass
+                self.indirect_write(
+                    op.slave,
+                    op.address,
+                    op.field,
+                    op.value,
+                    slice_num=op.slice_num,
+                    top=op.top,
+                    reg_source="< User_Define >",
+                )
+            if show == 1 and op.show is not None:
+                print(op.show.replace("{value}", value) if op.read else op.show)
+            slices = slices[1:]
         return rd_value
 
     def check_vco(self, die, group, group_name, **kwargs):
@@ -883,7 +1929,7 @@ class UCIe_2p5D:
     def check_msd_lol(self):
         for i in range(3):
             mux_arr = [0x20, 0x40, 0x80]
-            self.i2c.write(0x71, mux_arr[i], 0, 8, mux_arr[i])  # U142 i2c mux switch
+            self.i2c.mux_select(0x71, mux_arr[i])  # U142 i2c mux switch
 
             lol = self.i2c.read(0x50, 0xC, 0, 8)
 
@@ -932,13 +1978,46 @@ class UCIe_2p5D:
     def Save_i2cLog(self, **kargs):
         content = kargs.get("log_name", "NA")
 
-        textfile = open("TestTools/i2c_log.txt", "a+")
-        textfile.write(content)
-        textfile.close()
+        self.i2c_log.write(content)
+
+    def trace_setup(self, **kwargs):
+        # binary register trace (Reg_Trace) of every access with an i2c_log
+        # line, path=None stops it; decode with python Reg_Trace.py <path>
+        path = kwargs.get("path", None)
+
+        if self.trace is not None:
+            self.trace.close()
+        self.trace = TraceWriter(path) if path else None
+        self.log_die = None  # the trace starts with a [Die_Select]
+
+    def trace_label(self, label):
+        # log label ([Sequence] ...) into the trace, Reg_Replay phases
+        if self.trace is not None:
+            self.trace.label(label, self.log_die)
+
+    def _trace(
+        self, op, slave, address, bit, value, slice_num=-1, reg_source="", top=0
+    ):
+        # one trace record; die: the 0x70 selection (None for OP_DIE: log_die)
+        if self.trace is None:
+            return
+        if top:
+            op |= OP_TOP
+        if op == OP_DIE:
+            die = self.log_die
+        else:
+            die = {0x01: 0, 0x02: 1, 0x04: 2}.get(self.i2c.mux_state.get(0x70))
+        if reg_source == "< User_Define >":
+            op |= OP_USER
+        mask = 0 if bit is None else bit_field(bit).mask
+        self.trace.record(op, die, slave, slice_num, address, mask, value)
 
     def pico_gpio_low(self, pin, H_L):  # gpio number , 0:pull low 1:pull high
         self.i2c.GPIO_Set(pin, H_L)
 
+    def pico_gpio_apply(self, mask_high, mask_low, pulse_us=None):  # pin bit masks
+        self.i2c.gpio_apply(mask_high, mask_low, pulse_us)
+
     def set_input_pin6(self):
         self.i2c.default_high_pin6()
 
@@ -946,7 +2025,7 @@ class UCIe_2p5D:
         for i in range(3):
             mux_arr = [0x20, 0x40, 0x80]
 
-            self.i2c.write(0x71, mux_arr[i], 0, 8, mux_arr[i])  # U142 i2c mux switch
+            self.i2c.mux_select(0x71, mux_arr[i])  # U142 i2c mux switch
             self.i2c.write(0x50, 0xA, 0, 8, 0x0)
             self.i2c.write(0x50, 0xB, 0, 8, 0x0)
             self.i2c.write(0x50, 0xE, 0, 8, 0xA)
@@ -1491,80 +2570,24 @@ class UCIe_2p5D:
         self.vref_p = (str((self.vref_size / self.vef_num) * 100))[0:4]
 
     def read_deskew_tx(self, slave, base_addr):
-        self.cfg_deskew_sel_txd00_03 = str(
-            self.indirect_read(slave, 0x3464 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd04_07 = str(
-            self.indirect_read(slave, 0x3468 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd08_11 = str(
-            self.indirect_read(slave, 0x346C + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd12_15 = str(
-            self.indirect_read(slave, 0x3470 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd16_19 = str(
-            self.indirect_read(slave, 0x3474 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd20_23 = str(
-            self.indirect_read(slave, 0x3478 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd24_27 = str(
-            self.indirect_read(slave, 0x347C + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd28_31 = str(
-            self.indirect_read(slave, 0x3480 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd32_35 = str(
-            self.indirect_read(slave, 0x3484 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd36_39 = str(
-            self.indirect_read(slave, 0x3488 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd40_43 = str(
-            self.indirect_read(slave, 0x348C + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd44_47 = str(
-            self.indirect_read(slave, 0x3490 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd48_51 = str(
-            self.indirect_read(slave, 0x3494 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd52_55 = str(
-            self.indirect_read(slave, 0x3498 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd56_59 = str(
-            self.indirect_read(slave, 0x349C + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_deskew_sel_txd60_63 = str(
-            self.indirect_read(slave, 0x34A0 + base_addr, "31:0", slice_num=-1)
-        )
+        addresses = [0x3464 + base_addr + 4 * i for i in range(16)]
+        words = self.indirect_read_burst(slave, addresses, slice_num=-1)
+        for i, address in enumerate(addresses):  # cfg_deskew_sel_txd00_03 .. 60_63
+            setattr(
+                self,
+                f"cfg_deskew_sel_txd{4 * i:02d}_{4 * i + 3:02d}",
+                f"0x{words[address]:08x}",
+            )
 
     def read_offset_rx(self, slave, base_addr):
-        self.cfg_rx_ofs_rxd00_07 = str(
-            self.indirect_read(slave, 0x34B4 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd08_15 = str(
-            self.indirect_read(slave, 0x34B8 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd16_23 = str(
-            self.indirect_read(slave, 0x34BC + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd24_31 = str(
-            self.indirect_read(slave, 0x34C0 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd32_39 = str(
-            self.indirect_read(slave, 0x34C4 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd40_47 = str(
-            self.indirect_read(slave, 0x34C8 + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd48_55 = str(
-            self.indirect_read(slave, 0x34CC + base_addr, "31:0", slice_num=-1)
-        )
-        self.cfg_rx_ofs_rxd56_63 = str(
-            self.indirect_read(slave, 0x34D0 + base_addr, "31:0", slice_num=-1)
-        )
+        addresses = [0x34B4 + base_addr + 4 * i for i in range(8)]
+        words = self.indirect_read_burst(slave, addresses, slice_num=-1)
+        for i, address in enumerate(addresses):  # cfg_rx_ofs_rxd00_07 .. 56_63
+            setattr(
+                self,
+                f"cfg_rx_ofs_rxd{8 * i:02d}_{8 * i + 7:02d}",
+                f"0x{words[address]:08x}",
+            )
 
     def read_dvs_dck_cck_rx_pi(self, slave, base_addr):
         self.rpt_dvs_pi_vld = str(
@@ -1593,19 +2616,93 @@ class UCIe_2p5D:
         )
 
     def rg_vref_range_start(self, die, group, group_name, **kwargs):
+        kwargs = {"setv": 0, "r_bk": 1, **kwargs}
+        self.slice_field(
+            "rg_vref_range_start",
+            0x32E0,
+            "13:8",
+            die,
+            group,
+            label=f"GROUP_NUM{group_name}",
+            **kwargs,
+        )
+
+    def rg_vref_range_num(self, die, group, group_name, **kwargs):
+        kwargs = {"setv": 0, "r_bk": 1, **kwargs}
+        self.slice_field(
+            "rg_vref_range_num",
+            0x32E0,
+            "21:16",
+            die,
+            group,
+            label=f"GROUP_NUM{group_name}",
+            **kwargs,
+        )
+
+    def rg_half_window(self, die, group, group_name, **kwargs):
+        kwargs = {"setv": 0, "r_bk": 1, **kwargs}
+        self.slice_field(
+            "rg_half_window",
+            0x3300,
+            "5:0",
+            die,
+            group,
+            label=f"GROUP_NUM{group_name}",
+            **kwargs,
+        )
+
+    def eye_setup_info(self, die, group, group_n, **kwargs):
+        slave = self.EHOST[die][group]
+        self.die_sel(die=die)
+        rg_vref_range_start = hex(
+            int(self.indirect_read(slave, 0x32E0, "13:8", slice_num=-1), 16)
+        )
+        rg_vref_range_num = hex(
+            int(self.indirect_read(slave, 0x32E0, "21:16", slice_num=-1), 16)
+        )
+        rg_half_window = hex(
+            int(self.indirect_read(slave, 0x3300, "5:0", slice_num=-1), 16)
+        )
+        print(
+            f"Die{die}{group_n} Eye_Register_Setup_Info : rg_vref_range_start={rg_vref_range_start} , rg_vref_range_num={rg_vref_range_num} , rg_half_window={rg_half_window}"
+        )
+
+    def scu_cti(self, die, group, **kwargs):
         doset = kwargs.get("doset", 1)
         setv = kwargs.get("setv", 0)
-        r_bk = kwargs.get("r_bk", 1)
+        r_bk = kwargs.get("r_bk", 0)
         show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
 
-        ftn_name = "rg_vref_range_start"
-        offset = 0x32E0
-        bit = "13:8"
+        ftn_name = "rg_vref_range_num"
+        offset = 0x1300C
+        bit = "9:0"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
         rbvs = []
+        if doset == 1:
+            self.indirect_write(slave, offset, bit, int(setv, 16), top=1)
+        if r_bk == 1:
+            rbv = self.indirect_read(slave, offset, bit, top=1)
+            rbvs.append(rbv)
+        if show == 1:
+            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]}")
+        if r_bk == 1:
+            print(f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbvs}")
+
+    def start_link_training(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 1)
+        setv = kwargs.get("setv", 0)
+        r_bk = kwargs.get("r_bk", 0)
+        show = kwargs.get("show", 0)
+
+        ftn_name = "start_link_training"
+        offset = 0x0010
+        bit = "10"
+
+        slave = self.EHOST[1][group]
+        self.die_sel(die=1)
+        rbvs = []
         for slice_n in slice:
             base = slice_n * self.slice_offset
             if doset == 1:
@@ -1617,145 +2714,11 @@ class UCIe_2p5D:
                 rbvs.append(rbv)
         if show == 1:
             print(
-                f"{ftn_name} set to {setv} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} "
+                f"{ftn_name} set to {setv} for die{1} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
         if r_bk == 1:
             print(
-                f"{ftn_name} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_vref_range_num(self, die, group, group_name, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", 0)
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_vref_range_num"
-        offset = 0x32E0
-        bit = "21:16"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_half_window(self, die, group, group_name, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", 0)
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_half_window"
-        offset = 0x3300
-        bit = "5:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} GROUP_NUM{group_name} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def eye_setup_info(self, die, group, group_n, **kwargs):
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rg_vref_range_start = hex(
-            int(self.indirect_read(slave, 0x32E0, "13:8", slice_num=-1), 16)
-        )
-        rg_vref_range_num = hex(
-            int(self.indirect_read(slave, 0x32E0, "21:16", slice_num=-1), 16)
-        )
-        rg_half_window = hex(
-            int(self.indirect_read(slave, 0x3300, "5:0", slice_num=-1), 16)
-        )
-        print(
-            f"Die{die}{group_n} Eye_Register_Setup_Info : rg_vref_range_start={rg_vref_range_start} , rg_vref_range_num={rg_vref_range_num} , rg_half_window={rg_half_window}"
-        )
-
-    def scu_cti(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", 0)
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-
-        ftn_name = "rg_vref_range_num"
-        offset = 0x1300C
-        bit = "9:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        if doset == 1:
-            self.indirect_write(slave, offset, bit, int(setv, 16), top=1)
-        if r_bk == 1:
-            rbv = self.indirect_read(slave, offset, bit, top=1)
-            rbvs.append(rbv)
-        if show == 1:
-            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]}")
-        if r_bk == 1:
-            print(f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbvs}")
-
-    def start_link_training(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", 0)
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-
-        ftn_name = "start_link_training"
-        offset = 0x0010
-        bit = "10"
-
-        slave = self.EHOST[1][group]
-        self.die_sel(die=1)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{1} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{1} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
+                f"{ftn_name} for die{1} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
             )
 
     def BIST_ERR_COUNT(self, die, group, **kwargs):
@@ -1788,143 +2751,131 @@ class UCIe_2p5D:
         slice = kwargs.get("slice", [0, 1, 2, 3])
 
     def RX_PCS_ERR_INJECT(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
+        self.slice_field("RX_PCS_ERR_INJECT", 0x7184, "0", die, group, **kwargs)
 
-        ftn_name = "RX_PCS_ERR_INJECT"
-        offset = 0x7184
-        bit = "0"
+    def RX_PCS_RPLY_en(self, die, group, **kwargs):
+        self.slice_field("RX_PCS_RPLY_en", 0x7140, "0", die, group, **kwargs)
 
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
+    def TX_PCS_RPLY_en(self, die, group, **kwargs):
+        self.slice_field("TX_PCS_RPLY_en", 0x7040, "0", die, group, **kwargs)
 
-    def RX_PCS_RPLY_en(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
+    def cfg_vref_sel_rxgp(self, die, group, **kwargs):
+        kwargs = {"r_bk": 1, **kwargs}
+        return self.slice_field(
+            "cfg_vref_sel_rxgp", 0x3450, "21:16", die, group, echo=0, **kwargs
+        )
+
+    def rs_vref_center(self, die, group, **kwargs):
+        kwargs = {"r_bk": 1, **kwargs}
+        return self.slice_field(
+            "rs_vref_center", 0x32E4, "7:2", die, group, echo=0, **kwargs
+        )
+
+    def cfg_cck_offset_dn(self, die, group, **kwargs):
+        self.slice_field("cfg_cck_offset_dn", 0x3628, "18", die, group, **kwargs)
+
+    def cfg_cck_offset(self, die, group, **kwargs):
+        self.slice_field("cfg_cck_offset", 0x3628, "14:8", die, group, **kwargs)
+
+    def cfg_cck_offset_set(self, die, group, **kwargs):
+        self.slice_field("RX_PCS_ERR_INJECT", 0x3628, "19", die, group, **kwargs)
+
+    def cfg_rpt_cck_phase(self, die, group, **kwargs):
+        self.slice_field("cfg_rpt_cck_phase", 0x3624, "0", die, group, **kwargs)
+
+    def cck_rpt_code_i_reg(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
+        r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
 
-        ftn_name = "RX_PCS_RPLY_en"
-        offset = 0x7140
-        bit = "0"
+        ftn_name = "cck_rpt_code_i"
+        offset = 0x3630
+        bit = "10:4"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
         rbvs = []
+        rbvs_Dec = []
         for slice_n in slice:
             base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
+            # if doset == 1:
+            #     self.indirect_write(slave, offset + base, bit, int(setv, 16), slice_num=slice_n)
             if r_bk == 1:
                 rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv2 = int(rbv, 16)
                 rbvs.append(rbv)
+                rbvs_Dec.append(rbv2)
         if show == 1:
             print(
                 f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
         if r_bk == 1:
             print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
+                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}(Hex){rbvs_Dec}(Dec)",
+                flush=True,
             )
 
-    def TX_PCS_RPLY_en(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
+    def cck_up_dn_flag(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
+        r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
 
-        ftn_name = "TX_PCS_RPLY_en"
-        offset = 0x7040
-        bit = "0"
+        ftn_name = "cck_up_dn_flag"
+        offset = 0x362C
+        bit = "20"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
         rbvs = []
+        rbvs_Dec = []
         for slice_n in slice:
             base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
+            # if doset == 1:
+            #     self.indirect_write(slave, offset + base, bit, int(setv, 16), slice_num=slice_n)
             if r_bk == 1:
                 rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv2 = int(rbv, 16)
                 rbvs.append(rbv)
+                rbvs_Dec.append(rbv2)
         if show == 1:
             print(
                 f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
         if r_bk == 1:
             print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
+                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}(Hex){rbvs_Dec}(Dec)",
+                flush=True,
             )
 
-    def cfg_vref_sel_rxgp(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
+    def RX_PCS_BIST_MODE(self, die, group, **kwargs):
+        self.slice_field("RX_PCS_BIST_MODE", 0x7100, "0", die, group, **kwargs)
 
-        ftn_name = "cfg_vref_sel_rxgp"
-        offset = 0x3450
-        bit = "21:16"
+    def RX_PCS_BIST_COMPARE(self, die, group, **kwargs):
+        self.slice_field("RX_PCS_BIST_COMPARE", 0x7104, "0", die, group, **kwargs)
 
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}',flush=True)
+    def TX_PCS_BIST_MODE(self, die, group, **kwargs):
+        self.slice_field("TX_PCS_BIST_MODE", 0x7000, "0", die, group, **kwargs)
 
-        return rbvs
+    def TX_PCS_BIST_RUN(self, die, group, **kwargs):
+        self.slice_field("TX_PCS_BIST_RUN", 0x7004, "0", die, group, **kwargs)
 
-    def rs_vref_center(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
+    def MONITOR_CLR(self, die, group, **kwargs):
+        self.slice_field("MONITOR_CLR", 0x7120, "0", die, group, **kwargs)
+
+    def rs_rxpmad_BIST_FAIL_OR_sync(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
         r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
 
-        ftn_name = "rs_vref_center"
-        offset = 0x32E4
-        bit = "7:2"
+        ftn_name = "rs_rxpmad_BIST_FAIL_OR_sync"
+        offset = 0x3360
+        bit = "10"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
@@ -1936,2061 +2887,9 @@ class UCIe_2p5D:
                     slave, offset + base, bit, int(setv, 16), slice_num=slice_n
                 )
             if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}',flush=True)
-
-        return rbvs
-
-    def cfg_cck_offset_dn(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_cck_offset_dn"
-        offset = 0x3628
-        bit = "18"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_cck_offset(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_cck_offset"
-        offset = 0x3628
-        bit = "14:8"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_cck_offset_set(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "RX_PCS_ERR_INJECT"
-        offset = 0x3628
-        bit = "19"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_rpt_cck_phase(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_rpt_cck_phase"
-        offset = 0x3624
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cck_rpt_code_i_reg(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cck_rpt_code_i"
-        offset = 0x3630
-        bit = "10:4"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        rbvs_Dec = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            # if doset == 1:
-            #     self.indirect_write(slave, offset + base, bit, int(setv, 16), slice_num=slice_n)
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbv2 = int(rbv, 16)
-                rbvs.append(rbv)
-                rbvs_Dec.append(rbv2)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}(Hex){rbvs_Dec}(Dec)",
-                flush=True,
-            )
-
-    def cck_up_dn_flag(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cck_up_dn_flag"
-        offset = 0x362C
-        bit = "20"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        rbvs_Dec = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            # if doset == 1:
-            #     self.indirect_write(slave, offset + base, bit, int(setv, 16), slice_num=slice_n)
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbv2 = int(rbv, 16)
-                rbvs.append(rbv)
-                rbvs_Dec.append(rbv2)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}(Hex){rbvs_Dec}(Dec)",
-                flush=True,
-            )
-
-    def RX_PCS_BIST_MODE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "RX_PCS_BIST_MODE"
-        offset = 0x7100
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def RX_PCS_BIST_COMPARE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "RX_PCS_BIST_COMPARE"
-        offset = 0x7104
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def TX_PCS_BIST_MODE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "TX_PCS_BIST_MODE"
-        offset = 0x7000
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def TX_PCS_BIST_RUN(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "TX_PCS_BIST_RUN"
-        offset = 0x7004
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def MONITOR_CLR(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "MONITOR_CLR"
-        offset = 0x7120
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rs_rxpmad_BIST_FAIL_OR_sync(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rs_rxpmad_BIST_FAIL_OR_sync"
-        offset = 0x3360
-        bit = "10"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = int(
-                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
-                )
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-        buffer = str(sum(rbvs))
-        return buffer
-
-    def rg_rxpmad_BIST_FAIL_31_00(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_31_00"
-        offset = 0x3370
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}')
-        return rbvs
-
-    def rg_rxpmad_BIST_FAIL_63_32(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_63_32"
-        offset = 0x3374
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}')
-        return rbvs
-
-    def rg_rxpmad_BIST_FAIL_69_64(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_69_64"
-        offset = 0x3378
-        bit = "5:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}')
-        return rbvs
-
-    def rg_rxpmad_BIST_FAIL_31_00_1bit(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-        bit = kwargs.get("bit", "0")
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_31_00"
-        offset = 0x3370
-        bit = bit
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = int(
-                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
-                )
-                rbv_str = self.indirect_read(
-                    slave, offset + base, bit, slice_num=slice_n
-                )
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
-        buffer = str(sum(rbvs))
-        return buffer
-
-    def rg_rxpmad_BIST_FAIL_63_32_1bit(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-        bit = kwargs.get("bit", "0")
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_63_32"
-        offset = 0x3374
-        bit = bit
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = int(
-                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
-                )
-                rbv_str = self.indirect_read(
-                    slave, offset + base, bit, slice_num=slice_n
-                )
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
-        buffer = str(sum(rbvs))
-        return buffer
-
-    def rg_rxpmad_BIST_FAIL_69_64_1bit(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 0)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 1)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-        bit = kwargs.get("bit", "0")
-
-        ftn_name = "rg_rxpmad_BIST_FAIL_69_64"
-        offset = 0x3378
-        bit = bit
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = int(
-                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
-                )
-                rbv_str = (
-                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n),
-                    16,
-                )
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
-        buffer = str(sum(rbvs))
-        return buffer
-
-    def RX_PMAD_BIST_COMPARE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "RX_PMAD_BIST_COMPARE"
-        offset = 0x3360
-        bit = "8"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg0010_start_link_training(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg0010_start_link_training"
-        offset = 0x10
-        bit = "10"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_cck_ini_offset(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_cck_ini_offset"
-        offset = 0x3628
-        bit = "4:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_load_pll_target(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_load_pll_target"
-        offset = 0x215C
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}",
-                flush=True,
-            )
-
-    def rg_pmaa_MODE_8_target(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_MODE_8_target"
-        offset = 0x215C
-        bit = "1"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset}"
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}",
-                flush=True,
-            )
-
-        return rbvs
-
-    def cfg_sel_div_target(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_sel_div_target"
-        offset = 0x215C
-        bit = "11:2"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}",
-                flush=True,
-            )
-
-        return rbvs
-
-    def cfg_vco_div_mode_target(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_vco_div_mode_target"
-        offset = 0x215C
-        bit = "14:12"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}",
-                flush=True,
-            )
-
-        return rbvs
-
-    def cmu_rstn(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-
-        ftn_name = "cmu_rstn"
-        offset = 0x2100
-        bit = "0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        if doset == 1:
-            self.indirect_write(slave, offset, bit, int(setv, 16), slice_num=-1)
-        if r_bk == 1:
-            rbv = self.indirect_read(slave, offset, bit, slice_num=-1)
-        if show == 1:
-            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} ")
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbv}", flush=True
-            )
-
-    def rg_rxpmad_BIST_MASK_31_00(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_MASK_31_00"
-        offset = 0x3364
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_rxpmad_BIST_MASK_63_32(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_MASK_63_32"
-        offset = 0x3368
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_rxpmad_BIST_MASK_69_64(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_rxpmad_BIST_MASK_69_64"
-        offset = 0x336C
-        bit = "5:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_en_clk_bias(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_en_clk_bias"
-        offset = 0x3504
-        bit = "2"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def TOP_CTRL_0000(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-
-        ftn_name = "cmu_rstn"
-        offset = 0x2000
-        bit = "7:4"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        if doset == 1:
-            self.indirect_write(slave, offset, bit, int(setv, 16), slice_num=-1)
-        if r_bk == 1:
-            rbv = self.indirect_read(slave, offset, bit, slice_num=-1)
-        if show == 1:
-            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} ")
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbv}", flush=True
-            )
-
-    def cfg_err_th(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_err_th"
-        offset = 0x3628
-        bit = "27:24"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00C0_07_00(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00C0_07_00"
-        offset = 0x30C0
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00C4_15_08(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00C4_15_08"
-        offset = 0x30C4
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00C8_23_16(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00C8_23_16"
-        offset = 0x30C8
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00CC_31_24(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00CC_31_24"
-        offset = 0x30CC
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00D0_39_32(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00D0_39_32"
-        offset = 0x30D0
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00D4_47_40(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00D4_47_40"
-        offset = 0x30D4
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00D8_55_48(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00D8_55_48"
-        offset = 0x30D8
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00DC_63_56(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00DC_63_56"
-        offset = 0x30DC
-        bit = "31:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_00E0_rd3_rd0(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_00E0_rd3_rd0"
-        offset = 0x30E0
-        bit = "15:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_3350_vldrd_vld(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_3350_vldrd_vld"
-        offset = 0x3350
-        bit = "7:0"
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0100_07_00(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0100_07_00"
-        offset = 0x3100
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0104_15_08(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0104_15_08"
-        offset = 0x3104
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0108_23_16(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "slice"
-        offset = 0x3108
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_010C_31_24(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_010C_31_24"
-        offset = 0x310C
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0110_39_32(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0110_39_32"
-        offset = 0x3110
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0114_47_40(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0114_47_40"
-        offset = 0x3114
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0118_55_48(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0118_55_48"
-        offset = 0x3118
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_011C_63_56(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_011C_63_56"
-        offset = 0x311C
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0120_rd3_rd0(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0120_rd3_rd0"
-        offset = 0x3120
-        bit = "15:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def SLICE_CTRL_0360_vldrd_vld(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "SLICE_CTRL_0120_rd3_rd0"
-        offset = 0x3360
-        bit = "7:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_TX_OE_l(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_TX_OE_l"
-        offset = 0x3408
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_TX_OE_h(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_TX_OE_h"
-        offset = 0x340C
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RDTX_OE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RDTX_OE"
-        offset = 0x340C
-        bit = "3:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_TVLD_OE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_TVLD_OE"
-        offset = 0x3400
-        bit = "4"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_TRDVLD_OE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_TRDVLD_OE"
-        offset = 0x3400
-        bit = "5"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RX_IE_l(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RX_IE_l"
-        offset = 0x3414
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RX_IE_h(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RX_IE_h"
-        offset = 0x3418
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RDRX_IE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RDRX_IE"
-        offset = 0x341C
-        bit = "3:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RVLD_IE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RVLD_IE"
-        offset = 0x3404
-        bit = "4"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def rg_pmaa_RRDVLD_IE(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "rg_pmaa_RRDVLD_IE"
-        offset = 0x3404
-        bit = "5"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_en_clk_txd_l(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_en_clk_txd_l"
-        offset = 0x3438
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
-
-    def cfg_en_clk_txd_h(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_en_clk_txd_h"
-        offset = 0x343C
-        bit = "31:0"
-
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv = int(
+                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
+                )
                 rbvs.append(rbv)
         if show == 1:
             print(
@@ -4000,49 +2899,38 @@ class UCIe_2p5D:
             print(
                 f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
             )
+        buffer = str(sum(rbvs))
+        return buffer
 
-    def cfg_en_clk_txdrd(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
-        setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
-        show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
-
-        ftn_name = "cfg_en_clk_txdrd"
-        offset = 0x3440
-        bit = "3:0"
+    def rg_rxpmad_BIST_FAIL_31_00(self, die, group, **kwargs):
+        kwargs = {"doset": 0, "r_bk": 1, **kwargs}
+        return self.slice_field(
+            "rg_rxpmad_BIST_FAIL_31_00", 0x3370, "31:0", die, group, echo=0, **kwargs
+        )
 
-        slave = self.EHOST[die][group]
-        self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
-        if show == 1:
-            print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
-            )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
+    def rg_rxpmad_BIST_FAIL_63_32(self, die, group, **kwargs):
+        kwargs = {"doset": 0, "r_bk": 1, **kwargs}
+        return self.slice_field(
+            "rg_rxpmad_BIST_FAIL_63_32", 0x3374, "31:0", die, group, echo=0, **kwargs
+        )
 
-    def cfg_en_clk_txvld(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
+    def rg_rxpmad_BIST_FAIL_69_64(self, die, group, **kwargs):
+        kwargs = {"doset": 0, "r_bk": 1, **kwargs}
+        return self.slice_field(
+            "rg_rxpmad_BIST_FAIL_69_64", 0x3378, "5:0", die, group, echo=0, **kwargs
+        )
+
+    def rg_rxpmad_BIST_FAIL_31_00_1bit(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
+        r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
+        bit = kwargs.get("bit", "0")
 
-        ftn_name = "cfg_en_clk_txvld"
-        offset = 0x3444
-        bit = "0"
+        ftn_name = "rg_rxpmad_BIST_FAIL_31_00"
+        offset = 0x3370
+        bit = bit
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
@@ -4054,27 +2942,33 @@ class UCIe_2p5D:
                     slave, offset + base, bit, int(setv, 16), slice_num=slice_n
                 )
             if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv = int(
+                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
+                )
+                rbv_str = self.indirect_read(
+                    slave, offset + base, bit, slice_num=slice_n
+                )
                 rbvs.append(rbv)
         if show == 1:
             print(
                 f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
+        # if r_bk == 1:
+        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
+        buffer = str(sum(rbvs))
+        return buffer
 
-    def cfg_en_clk_txvldrd(self, die, group, **kwargs):
-        doset = kwargs.get("doset", 1)
+    def rg_rxpmad_BIST_FAIL_63_32_1bit(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
-        r_bk = kwargs.get("r_bk", 0)
+        r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
+        bit = kwargs.get("bit", "0")
 
-        ftn_name = "cfg_en_clk_txvld"
-        offset = 0x3444
-        bit = "1"
+        ftn_name = "rg_rxpmad_BIST_FAIL_63_32"
+        offset = 0x3374
+        bit = bit
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
@@ -4086,27 +2980,33 @@ class UCIe_2p5D:
                     slave, offset + base, bit, int(setv, 16), slice_num=slice_n
                 )
             if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv = int(
+                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
+                )
+                rbv_str = self.indirect_read(
+                    slave, offset + base, bit, slice_num=slice_n
+                )
                 rbvs.append(rbv)
         if show == 1:
             print(
                 f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
-        if r_bk == 1:
-            print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
-            )
+        # if r_bk == 1:
+        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
+        buffer = str(sum(rbvs))
+        return buffer
 
-    def rg_rxpmad_BIST_FAIL_69_64_valid(self, die, group, **kwargs):
+    def rg_rxpmad_BIST_FAIL_69_64_1bit(self, die, group, **kwargs):
         doset = kwargs.get("doset", 0)
         setv = kwargs.get("setv", "0x1")
         r_bk = kwargs.get("r_bk", 1)
         show = kwargs.get("show", 0)
         slice = kwargs.get("slice", [0, 1, 2, 3])
+        bit = kwargs.get("bit", "0")
 
         ftn_name = "rg_rxpmad_BIST_FAIL_69_64"
         offset = 0x3378
-        bit = "4"
+        bit = bit
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
@@ -4118,73 +3018,262 @@ class UCIe_2p5D:
                     slave, offset + base, bit, int(setv, 16), slice_num=slice_n
                 )
             if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
+                rbv = int(
+                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n), 16
+                )
+                rbv_str = (
+                    self.indirect_read(slave, offset + base, bit, slice_num=slice_n),
+                    16,
+                )
                 rbvs.append(rbv)
         if show == 1:
             print(
                 f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
             )
         # if r_bk == 1:
-        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}')
-        return rbvs
+        #     print(f'{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbv_str}')
+        buffer = str(sum(rbvs))
+        return buffer
 
-    def cfg_rext_mode(self, die, group, **kwargs):
+    def RX_PMAD_BIST_COMPARE(self, die, group, **kwargs):
+        self.slice_field("RX_PMAD_BIST_COMPARE", 0x3360, "8", die, group, **kwargs)
+
+    def rg0010_start_link_training(self, die, group, **kwargs):
+        self.slice_field("rg0010_start_link_training", 0x10, "10", die, group, **kwargs)
+
+    def cfg_cck_ini_offset(self, die, group, **kwargs):
+        self.slice_field("cfg_cck_ini_offset", 0x3628, "4:0", die, group, **kwargs)
+
+    def rg_load_pll_target(self, die, group, **kwargs):
+        self.slice_field("rg_load_pll_target", 0x215C, "0", die, group, **kwargs)
+
+    def rg_pmaa_MODE_8_target(self, die, group, **kwargs):
+        return self.slice_field(
+            "rg_pmaa_MODE_8_target", 0x215C, "1", die, group, **kwargs
+        )
+
+    def cfg_sel_div_target(self, die, group, **kwargs):
+        return self.slice_field(
+            "cfg_sel_div_target", 0x215C, "11:2", die, group, **kwargs
+        )
+
+    def cfg_vco_div_mode_target(self, die, group, **kwargs):
+        return self.slice_field(
+            "cfg_vco_div_mode_target", 0x215C, "14:12", die, group, **kwargs
+        )
+
+    def cmu_rstn(self, die, group, **kwargs):
         doset = kwargs.get("doset", 1)
         setv = kwargs.get("setv", "0x1")
         r_bk = kwargs.get("r_bk", 0)
         show = kwargs.get("show", 0)
 
-        ftn_name = "cfg_rext_mode"
-        offset = 0x2124
-        bit = "16:14"
+        ftn_name = "cmu_rstn"
+        offset = 0x2100
+        bit = "0"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
-        rbvs = []
         if doset == 1:
-            self.indirect_write(slave, offset, bit, int(setv, 16))
+            self.indirect_write(slave, offset, bit, int(setv, 16), slice_num=-1)
         if r_bk == 1:
-            rbv = self.indirect_read(slave, offset, bit)
-            rbvs.append(rbv)
+            rbv = self.indirect_read(slave, offset, bit, slice_num=-1)
         if show == 1:
-            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]}")
+            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} ")
         if r_bk == 1:
             print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbvs}", flush=True
+                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbv}", flush=True
             )
 
-    def cfg_tp_sel(self, die, group, **kwargs):
+    def rg_rxpmad_BIST_MASK_31_00(self, die, group, **kwargs):
+        self.slice_field(
+            "rg_rxpmad_BIST_MASK_31_00", 0x3364, "31:0", die, group, **kwargs
+        )
+
+    def rg_rxpmad_BIST_MASK_63_32(self, die, group, **kwargs):
+        self.slice_field(
+            "rg_rxpmad_BIST_MASK_63_32", 0x3368, "31:0", die, group, **kwargs
+        )
+
+    def rg_rxpmad_BIST_MASK_69_64(self, die, group, **kwargs):
+        self.slice_field(
+            "rg_rxpmad_BIST_MASK_69_64", 0x336C, "5:0", die, group, **kwargs
+        )
+
+    def cfg_en_clk_bias(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_bias", 0x3504, "2", die, group, **kwargs)
+
+    def TOP_CTRL_0000(self, die, group, **kwargs):
         doset = kwargs.get("doset", 1)
         setv = kwargs.get("setv", "0x1")
         r_bk = kwargs.get("r_bk", 0)
         show = kwargs.get("show", 0)
-        slice = kwargs.get("slice", [0, 1, 2, 3])
 
-        ftn_name = "cfg_tp_sel"
-        offset = 0x3450
-        bit = "6:4"
+        ftn_name = "cmu_rstn"
+        offset = 0x2000
+        bit = "7:4"
 
         slave = self.EHOST[die][group]
         self.die_sel(die=die)
-        rbvs = []
-        for slice_n in slice:
-            base = slice_n * self.slice_offset
-            if doset == 1:
-                self.indirect_write(
-                    slave, offset + base, bit, int(setv, 16), slice_num=slice_n
-                )
-            if r_bk == 1:
-                rbv = self.indirect_read(slave, offset + base, bit, slice_num=slice_n)
-                rbvs.append(rbv)
+        if doset == 1:
+            self.indirect_write(slave, offset, bit, int(setv, 16), slice_num=-1)
+        if r_bk == 1:
+            rbv = self.indirect_read(slave, offset, bit, slice_num=-1)
         if show == 1:
+            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} ")
+        if r_bk == 1:
             print(
-                f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} "
+                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbv}", flush=True
             )
+
+    def cfg_err_th(self, die, group, **kwargs):
+        self.slice_field("cfg_err_th", 0x3628, "27:24", die, group, **kwargs)
+
+    def SLICE_CTRL_00C0_07_00(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00C0_07_00", 0x30C0, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00C4_15_08(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00C4_15_08", 0x30C4, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00C8_23_16(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00C8_23_16", 0x30C8, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00CC_31_24(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00CC_31_24", 0x30CC, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00D0_39_32(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00D0_39_32", 0x30D0, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00D4_47_40(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00D4_47_40", 0x30D4, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00D8_55_48(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00D8_55_48", 0x30D8, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00DC_63_56(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_00DC_63_56", 0x30DC, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_00E0_rd3_rd0(self, die, group, **kwargs):
+        self.slice_field(
+            "SLICE_CTRL_00E0_rd3_rd0", 0x30E0, "15:0", die, group, **kwargs
+        )
+
+    def SLICE_CTRL_3350_vldrd_vld(self, die, group, **kwargs):
+        self.slice_field(
+            "SLICE_CTRL_3350_vldrd_vld", 0x3350, "7:0", die, group, **kwargs
+        )
+
+    def SLICE_CTRL_0100_07_00(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0100_07_00", 0x3100, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0104_15_08(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0104_15_08", 0x3104, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0108_23_16(self, die, group, **kwargs):
+        self.slice_field("slice", 0x3108, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_010C_31_24(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_010C_31_24", 0x310C, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0110_39_32(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0110_39_32", 0x3110, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0114_47_40(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0114_47_40", 0x3114, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0118_55_48(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0118_55_48", 0x3118, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_011C_63_56(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_011C_63_56", 0x311C, "31:0", die, group, **kwargs)
+
+    def SLICE_CTRL_0120_rd3_rd0(self, die, group, **kwargs):
+        self.slice_field(
+            "SLICE_CTRL_0120_rd3_rd0", 0x3120, "15:0", die, group, **kwargs
+        )
+
+    def SLICE_CTRL_0360_vldrd_vld(self, die, group, **kwargs):
+        self.slice_field("SLICE_CTRL_0120_rd3_rd0", 0x3360, "7:0", die, group, **kwargs)
+
+    def rg_pmaa_TX_OE_l(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_TX_OE_l", 0x3408, "31:0", die, group, **kwargs)
+
+    def rg_pmaa_TX_OE_h(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_TX_OE_h", 0x340C, "31:0", die, group, **kwargs)
+
+    def rg_pmaa_RDTX_OE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RDTX_OE", 0x340C, "3:0", die, group, **kwargs)
+
+    def rg_pmaa_TVLD_OE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_TVLD_OE", 0x3400, "4", die, group, **kwargs)
+
+    def rg_pmaa_TRDVLD_OE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_TRDVLD_OE", 0x3400, "5", die, group, **kwargs)
+
+    def rg_pmaa_RX_IE_l(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RX_IE_l", 0x3414, "31:0", die, group, **kwargs)
+
+    def rg_pmaa_RX_IE_h(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RX_IE_h", 0x3418, "31:0", die, group, **kwargs)
+
+    def rg_pmaa_RDRX_IE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RDRX_IE", 0x341C, "3:0", die, group, **kwargs)
+
+    def rg_pmaa_RVLD_IE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RVLD_IE", 0x3404, "4", die, group, **kwargs)
+
+    def rg_pmaa_RRDVLD_IE(self, die, group, **kwargs):
+        self.slice_field("rg_pmaa_RRDVLD_IE", 0x3404, "5", die, group, **kwargs)
+
+    def cfg_en_clk_txd_l(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_txd_l", 0x3438, "31:0", die, group, **kwargs)
+
+    def cfg_en_clk_txd_h(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_txd_h", 0x343C, "31:0", die, group, **kwargs)
+
+    def cfg_en_clk_txdrd(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_txdrd", 0x3440, "3:0", die, group, **kwargs)
+
+    def cfg_en_clk_txvld(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_txvld", 0x3444, "0", die, group, **kwargs)
+
+    def cfg_en_clk_txvldrd(self, die, group, **kwargs):
+        self.slice_field("cfg_en_clk_txvld", 0x3444, "1", die, group, **kwargs)
+
+    def rg_rxpmad_BIST_FAIL_69_64_valid(self, die, group, **kwargs):
+        kwargs = {"doset": 0, "r_bk": 1, **kwargs}
+        return self.slice_field(
+            "rg_rxpmad_BIST_FAIL_69_64", 0x3378, "4", die, group, echo=0, **kwargs
+        )
+
+    def cfg_rext_mode(self, die, group, **kwargs):
+        doset = kwargs.get("doset", 1)
+        setv = kwargs.get("setv", "0x1")
+        r_bk = kwargs.get("r_bk", 0)
+        show = kwargs.get("show", 0)
+
+        ftn_name = "cfg_rext_mode"
+        offset = 0x2124
+        bit = "16:14"
+
+        slave = self.EHOST[die][group]
+        self.die_sel(die=die)
+        rbvs = []
+        if doset == 1:
+            self.indirect_write(slave, offset, bit, int(setv, 16))
+        if r_bk == 1:
+            rbv = self.indirect_read(slave, offset, bit)
+            rbvs.append(rbv)
+        if show == 1:
+            print(f"{ftn_name} set to {setv} for die{die} {self.GROUP_NUM[group]}")
         if r_bk == 1:
             print(
-                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} S#{self.slice_offset} = {rbvs}"
+                f"{ftn_name} for die{die} {self.GROUP_NUM[group]} = {rbvs}", flush=True
             )
 
+    def cfg_tp_sel(self, die, group, **kwargs):
+        self.slice_field("cfg_tp_sel", 0x3450, "6:4", die, group, **kwargs)
+
     """'Module CTL"""
 
     def slave_scan(self):
@@ -4196,72 +3285,61 @@ class UCIe_2p5D:
         self.i2c.default_high()
         self.i2c.pull_low()
 
-    def mux_scan(self):
-        mux_offset = 0x01
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x02
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x04
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x08
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x10
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x20
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x40
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
-        mux_offset = 0x80
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
-        self.i2c.scan()
+    def mux_scan(self, **kwargs):
+        rescan = kwargs.get("rescan", 0)  # 1: scan the board again
+
+        if self.mux_topology is None or rescan == 1:
+            self.mux_topology = self.i2c.scan_all_mux_channels(
+                0x71, [0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80]
+            )  # U142 i2c mux switch
+        for mux_offset, slave in self.mux_topology.items():
+            print(
+                f"U142 mux {hex(mux_offset)} , i2c slave address scan : "
+                f"{list(map(hex, slave))}",
+                flush=True,
+            )
+        return self.mux_topology
 
     def VDD(self, mux, ch_select, volt):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         self.TPSM831D31_VoltageSet_eprom(ch_select, volt)
-        self.i2c.write(0x71, 0x00, 0, 8, 0x00)  # channel open
+        self.i2c.mux_select(0x71, 0x00)  # channel open
 
     def IOVDD(self, mux, ch_select, volt):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         self.TPSM831D31_VoltageSet_eprom(ch_select, volt)
-        self.i2c.write(0x71, 0x00, 0, 8, 0x00)  # channel open
+        self.i2c.mux_select(0x71, 0x00)  # channel open
 
     def D0_AVDD_V2_D0_AVDD12_V2(self, CHA_Volt, CHB_Volt):
         mux_offset = 0x02
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux_offset)  # U142 i2c mux switch
         # self.i2c.scan()
         self.TPSM831D31_VoltageSet(CHA_Volt, CHB_Volt)
         # self.i2c.write(0x71, 0x00, 0, 8, 0x00) # channel open
 
     def D0_AVDD_V1_D1_V1_D0_AVDD12_V1_D1_V1(self, CHA_Volt, CHB_Volt):
         mux_offset = 0x04
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux_offset)  # U142 i2c mux switch
         # self.i2c.scan()
         self.TPSM831D31_VoltageSet(CHA_Volt, CHB_Volt)
         # self.i2c.write(0x71, 0x00, 0, 8, 0x00) # channel open
 
     def D1_AVDD_V2_D2_V1_D1_AVDD12_V2_D2_V1(self, CHA_Volt, CHB_Volt):
         mux_offset = 0x08
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux_offset)  # U142 i2c mux switch
         # self.i2c.scan()
         self.TPSM831D31_VoltageSet(CHA_Volt, CHB_Volt)
         # self.i2c.write(0x71, 0x00, 0, 8, 0x00) # channel open
 
     def D2_AVDD_V2_D2_AVDD12_V2(self, CHA_Volt, CHB_Volt):
         mux_offset = 0x10
-        self.i2c.write(0x71, mux_offset, 0, 8, mux_offset)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux_offset)  # U142 i2c mux switch
         # self.i2c.scan()
         self.TPSM831D31_VoltageSet(CHA_Volt, CHB_Volt)
         # self.i2c.write(0x71, 0x00, 0, 8, 0x00) # channel open
 
     def TPSM831D31_VoltageSet(self, mux, ch_select, volt):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
 
         if volt == 0:
             Vout_command = 0
@@ -4291,8 +3369,8 @@ class UCIe_2p5D:
         # self.i2c.write(self.pmic_120, 0x11, 0, 16, 0x00)
 
     def TPSM831D31_Output_Disable(self, mux, ch_select):
-        self.i2c.write(0x71, 0x0, 0, 8, 0x0)  # U142 i2c mux switch
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, 0x0)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         if ch_select == "CHA":
             self.i2c.write(self.pmic_120, 0x00, 0, 8, 0x0)  # 切 CH_A
             self.i2c.write(self.pmic_120, 0x01, 0, 8, 0x00)
@@ -4304,8 +3382,8 @@ class UCIe_2p5D:
         # self.i2c.write(self.pmic_120, 0x11, 0, 16, 0x00)
 
     def TPSM831D31_Output_Enable(self, mux, ch_select):
-        self.i2c.write(0x71, 0x0, 0, 8, 0x0)  # U142 i2c mux switch
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, 0x0)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         if ch_select == "CHA":
             self.i2c.write(self.pmic_120, 0x00, 0, 8, 0x0)  # 切 CH_A
             self.i2c.write(self.pmic_120, 0x01, 0, 8, 0x80)
@@ -4317,7 +3395,7 @@ class UCIe_2p5D:
         # self.i2c.write(self.pmic_120, 0x11, 0, 16, 0x00)
 
     def TPSM831D31_VoltageSet_eprom(self, mux, ch_select):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         if ch_select == "CHA":
             self.i2c.write(self.pmic_120, 0x00, 0, 8, 0x0)  # 切 CH_A
             self.i2c.write(self.pmic_120, 0x11, 0, 8, 0x01)
@@ -4328,7 +3406,7 @@ class UCIe_2p5D:
             pass
 
     def TPSM831D31_CurrentRead(self, mux, ch_select):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
 
         if ch_select == "CHA":
             self.i2c.write(self.pmic_120, 0x00, 0, 8, 0x0)  # 切 CH_A
@@ -4366,7 +3444,7 @@ class UCIe_2p5D:
         self.i2c.write(0x60, 0x16, 0, 1, 0x01)
 
     def THM_Check(self, mux):
-        self.i2c.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        self.i2c.mux_select(0x71, mux)  # U142 i2c mux switch
         self.i2c.write(0x50, 0x1, 1, 1, 0x1)
         self.i2c.write(0x50, 0x1, 2, 1, 0x1)
         self.i2c.write(0x50, 0x3, 4, 3, 0x5)
@@ -4377,12 +3455,16 @@ class UCIe_2p5D:
         Reg_path = kargs.get("Reg_path", 0)
         MUX_slave = kargs.get("MUX_slave", 0xE0)
         MUX_offset = kargs.get("MUX_offset", 0x20)
+        verify = kargs.get("verify", self.verify_si5396c)  # read back mode
 
+        if verify not in VERIFY_MODES:
+            raise Exception(f"verify mode {verify} not in {VERIFY_MODES}")
         self.esp32.read(MUX_slave, MUX_offset, 0, 8)  # Do not skip(YQ)
         self.esp32.write(MUX_slave, MUX_offset, 0, 8, MUX_offset)
         # print(self.esp32.read(MUX_slave, MUX_offset, 0, 8))
 
         slave = int("0xD8", 16)
+        pending = []  # written registers to read back
         with open(Reg_path, "r") as f:
             PG_Register_list = f.readlines()
             for i in range(len(PG_Register_list)):
@@ -4402,23 +3484,31 @@ class UCIe_2p5D:
                     new_register_value = int(register_value, 16)
 
                     self.esp32.write(slave, 0x01, 0, 8, page)  # set page
-                    old_register_value = self.esp32.read(
-                        slave, offset, 0, 8
-                    )  # read old register value  Check Register flow use
                     self.esp32.write(
                         slave, offset, 0, 8, new_register_value
                     )  # write new register value
-                    Now_Value = self.esp32.read(
-                        slave, offset, 0, 8
-                    )  # read old register value  Check Register flow use
-
-                    if int(old_register_value, 16) == int(
-                        hex(new_register_value), 16
-                    ) and int(old_register_value, 16) == int(
-                        Now_Value, 16
-                    ):  # Check Register flow use
-                        pass  # Check Register flow use
-                    else:  # Check Register flow use
-                        print(register_list)  # Check Register flow use
-                        # print(page, old_register_value, hex(new_register_value), Now_Value)
-                        pass
+                    if self._verify_sample(verify):
+                        pending.append((register_list, page, offset))
+                    if verify != "deferred":
+                        self._si5396c_verify(slave, pending)
+                        pending = []
+        self._si5396c_verify(slave, pending)
+
+    def _si5396c_verify(self, slave, pending):
+        # read back [(register_list, page, offset), ...] written by
+        # PG1_SI5396C_Register_Library, one page write per page change
+        page_now = None
+        mismatch = []
+        for register_list, page, offset in pending:
+            if page != page_now:
+                self.esp32.write(slave, 0x01, 0, 8, page)  # set page
+                page_now = page
+            Now_Value = self.esp32.read(slave, offset, 0, 8)
+            self.verify_stats["checked"] += 1
+            if int(Now_Value, 16) != int(register_list[1], 16):
+                mismatch.append(register_list + [f"read {Now_Value}"])
+        self.verify_stats["mismatches"] += len(mismatch)
+        for register_list in mismatch:
+            if self.verify_fail == 2:
+                raise Exception(f"SI5396C write verify : {register_list}")
+            print(register_list)  # Check Register flow use
@@ -7,6 +7,7 @@ import wx  # D2D use
 
 import gui
 from Instrument import D2D_Subprogram
+from Log_Writer import I2C_LOG, log_writer
 
 
 class UCIe_2p5D:
@@ -1148,6 +1149,7 @@ class UCIe_2p5D:
         if self.show == 1:
             print(label, flush=True)
         self.Save_i2cLog(log_name=f"{label}\n")
+        self.phy.trace_label(label)
 
     def avdd_voltage_sense(self, **kargs):
         mode = kargs.get("mode", "")
@@ -1389,9 +1391,7 @@ class UCIe_2p5D:
     def Save_i2cLog(self, **kargs):
         content = kargs.get("log_name", "NA")
 
-        textfile = open("TestTools/i2c_log.txt", "a+")
-        textfile.write(content)
-        textfile.close()
+        log_writer(I2C_LOG).write(content)
 
     def log_info(self, info):
         self.info = info
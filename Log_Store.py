@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Size-capped store of the test item logs (Test_Report/Test_Report Log).
+
+Usage:
+    python Log_Store.py                              # logs in the store
+    python Log_Store.py --item PCS --temp 25          # filter: item / temperature
+    python Log_Store.py --cat "<log name>.txt"         # text of one log
+"""
+
+import argparse
+import atexit
+import gzip
+import io
+import json
+import os
+import queue
+import shutil
+import threading
+
+from tabulate import tabulate
+
+LOG_STORE = "Test_Report/Test_Report Log/log_store"
+INDEX = "index.json"
+STORE_DIR = os.path.basename(LOG_STORE)  # next to the Report.py log paths
+
+
+class LogStore:
+    """Append-only test log store, capped at max_bytes on disk.
+
+    item() starts the log of a test item (name: the Test_Report Log file name,
+    with test item, cycle and temperature). path: the item .txt the test
+    writes itself (the Excel report links to it); the store takes its text at
+    the next item() or close(). write() appends text to the current item, or
+    with name= to a log of that name until end(name) (i2c_log.txt rotation).
+    Text goes into segment files (segment_000001.log); a segment is closed
+    once it holds segment_bytes (rotate="size") or at the next item
+    (rotate="item"), and a background thread gzips it (.log.gz).
+
+    The cap counts the segments and the item .txt files taken in. Over
+    max_bytes, the oldest item .txt files are deleted first (their text stays
+    in the store, log_open() reads it there), then the oldest segments with
+    their logs.
+
+    index.json maps every log to its (segment, byte offset, length) parts,
+    offsets in the uncompressed segment; read() / log_open() read through it.
+    The index is written on item(), rotation, compression and flush(), so
+    another process sees a log up to the last of those; log_open() in this
+    process reads the store's own index.
+    """
+
+    def __init__(self, folder=LOG_STORE, **kwargs) -> None:
+        self.folder = folder
+        self.max_bytes = kwargs.get("max_bytes", 1 << 30)
+        self.segment_bytes = kwargs.get("segment_bytes", 16 << 20)
+        self.rotate = kwargs.get("rotate", "size")  # "size" / "item"
+        self.compresslevel = kwargs.get("compresslevel", 6)
+        if self.rotate not in ("size", "item"):
+            raise Exception(f"rotate={self.rotate}, use size / item")
+        if self.max_bytes < 4 * self.segment_bytes:
+            raise Exception("max_bytes must hold 4 segments (segment_bytes)")
+        self.lock = threading.RLock()
+        self.queue = queue.Queue()  # segments to compress
+        self.backlog = kwargs.get("backlog", 2)  # segments queued: write() waits
+        self.stats = {"bytes": 0, "segments": 0, "compressed": 0, "evicted": 0}
+        self.stats.update({"stored": 0, "raw": 0, "waits": 0, "files": 0})
+        self.thread = None
+        os.makedirs(folder, exist_ok=True)
+        self.index = load_index(folder)
+        self.current = None  # log entry of the item being written
+        self.open = {}  # name -> log entry of write(name=) until end(name)
+        self.active = None  # segment name being appended to
+        self.active_bytes = 0
+        for name, seg in self.index["segments"].items():
+            if not seg["gz"]:
+                self._compress(name)  # left open / uncompressed by a last run
+        self._save()
+        _stores[os.path.abspath(folder)] = self
+        atexit.register(self.close)  # last item file, index of the last writes
+
+    def item(self, name, **kwargs) -> dict:
+        # start a test item log; item / cycle / temp go into the index
+        with self.lock:
+            self._take(self.current)
+            self.current = self._log(name, **kwargs)
+            if self.rotate == "item" and self.active_bytes:
+                self._rotate()
+            self._save()
+            return self.current
+
+    def write(self, text, **kwargs) -> None:
+        # append to the current item log, or to the open log called name
+        name = kwargs.get("name", None)
+        data = text.encode(errors="replace")
+        if self.queue.unfinished_tasks >= self.backlog:
+            self.stats["waits"] += 1
+            self.queue.join()  # compression behind: keep the raw bytes capped
+        with self.lock:
+            if name is not None and name not in self.open:
+                item = self.current or {}
+                self.open[name] = self._log(
+                    name, item=item.get("item"), cycle=item.get("cycle")
+                )
+            elif name is None and self.current is None:
+                self.current = self._log("log.txt")
+            self._append(self.current if name is None else self.open[name], data)
+
+    def opened(self, name) -> str:
+        # text of the log write(name=) appends to, "" if none is open
+        with self.lock:
+            log = self.open.get(name)
+            return "" if log is None else self._read(log)
+
+    def end(self, name) -> None:
+        # next write(name=) starts a new log
+        with self.lock:
+            self.open.pop(name, None)
+
+    def read(self, name) -> str:
+        with self.lock:
+            return read_log(self.folder, name, self.index)
+
+    def find(self, **kwargs) -> list:
+        return find_logs(self.index, **kwargs)
+
+    def disk_bytes(self) -> int:
+        # segment bytes on disk (active / uncompressed raw, gz compressed) and
+        # the item .txt files taken in
+        with self.lock:
+            return sum(
+                seg["stored"] if seg["gz"] else seg["raw"]
+                for seg in self.index["segments"].values()
+            ) + sum(log.get("file_bytes", 0) for log in self.index["logs"])
+
+    def flush(self) -> None:
+        # compress every closed segment, then write the index
+        if self.thread is not None and self.thread.is_alive():
+            self.queue.join()
+        with self.lock:
+            self._evict()
+            self._save()
+
+    def close(self) -> None:
+        with self.lock:
+            self._take(self.current)
+            self.current = None
+            if self.active is not None:
+                active, self.active, self.active_bytes = self.active, None, 0
+                self._compress(active)
+        self.flush()
+        atexit.unregister(self.close)
+        _stores.pop(os.path.abspath(self.folder), None)
+
+    def _log(self, name, **kwargs):
+        log = {
+            "name": name,
+            "item": kwargs.get("item", None),
+            "cycle": kwargs.get("cycle", None),
+            "temp": kwargs.get("temp", None),
+            "bytes": 0,
+            "parts": [],
+        }
+        if kwargs.get("path", None) is not None:
+            log["path"] = kwargs["path"]
+            log["file_bytes"] = 0
+        self.index["logs"].append(log)
+        return log
+
+    def _append(self, log, data):
+        while data:
+            if self.active is None or self.active_bytes >= self.segment_bytes:
+                self._rotate()
+            part = data[: self.segment_bytes - self.active_bytes]
+            data = data[len(part) :]
+            with open(os.path.join(self.folder, self.active), "ab") as f:
+                f.write(part)
+            parts = log["parts"]
+            if parts and parts[-1][0] == self.active:
+                parts[-1][2] += len(part)  # contiguous with the last part
+            else:
+                parts.append([self.active, self.active_bytes, len(part)])
+            log["bytes"] += len(part)
+            self.active_bytes += len(part)
+            self.index["segments"][self.active]["raw"] = self.active_bytes
+            self.stats["bytes"] += len(part)
+
+    def _take(self, log):
+        # text of a finished item .txt into the store; the file stays until
+        # the cap needs its bytes
+        if log is None or "path" not in log:
+            return
+        try:
+            with open(log["path"], "rb") as f:
+                while True:
+                    data = f.read(self.segment_bytes)
+                    if not data:
+                        break
+                    self._append(log, data)
+        except FileNotFoundError:
+            pass  # no test log written for the item
+        else:
+            log["file_bytes"] = os.path.getsize(log["path"])
+        self._evict()
+
+    def _read(self, log):
+        data = []
+        for segment, offset, length in log["parts"]:
+            data.append(read_part(self.folder, segment, offset, length))
+        return b"".join(data).decode(errors="replace")
+
+    def _rotate(self):
+        # close the active segment (compressed in the background), open a new one
+        if self.active is not None:
+            closed, self.active = self.active, None
+            self._compress(closed)
+        self.index["next"] += 1
+        self.active = f"segment_{self.index['next']:06d}.log"
+        self.active_bytes = 0
+        self.index["segments"][self.active] = {"raw": 0, "stored": 0, "gz": False}
+        self.stats["segments"] += 1
+        self._evict()
+        self._save()
+
+    def _compress(self, name):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(
+                target=self._run, name=f"LogStore {self.folder}", daemon=True
+            )
+            self.thread.start()
+        self.queue.put(name)
+
+    def _run(self):
+        while True:
+            name = self.queue.get()
+            try:
+                self._gzip(name)
+            except OSError as e:
+                print(f"{name} not compressed : {e}", flush=True)
+            finally:
+                self.queue.task_done()
+
+    def _gzip(self, name):
+        path = os.path.join(self.folder, name)
+        if not os.path.exists(path):
+            return
+        with open(path, "rb") as src, gzip.open(
+            path + ".tmp", "wb", compresslevel=self.compresslevel
+        ) as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        with self.lock:  # readers choose .log / .log.gz under the lock
+            os.replace(path + ".tmp", path + ".gz")
+            os.remove(path)
+            seg = self.index["segments"].get(name)
+            if seg is not None:
+                seg["gz"] = True
+                seg["stored"] = os.path.getsize(path + ".gz")
+                self.stats["compressed"] += 1
+                self.stats["raw"] += seg["raw"]
+                self.stats["stored"] += seg["stored"]
+            self._evict()
+            self._save()
+
+    def _evict(self):
+        # oldest item .txt files, then oldest compressed segments out until the
+        # store fits max_bytes with a full active segment
+        segments = self.index["segments"]
+        over = self.disk_bytes() + self.segment_bytes - self.max_bytes
+        writing = (self.current or {}).get("path")  # item .txt still written
+        for log in self.index["logs"]:
+            if over <= 0:
+                break
+            if log.get("file_bytes") and log["path"] != writing:
+                try:
+                    os.remove(log["path"])
+                except OSError:
+                    pass
+                over -= log["file_bytes"]
+                log["file_bytes"] = 0
+                self.stats["files"] += 1
+        for name in list(segments):
+            if over <= 0:
+                break
+            seg = segments[name]
+            if not seg["gz"]:
+                continue  # active, or waiting for the compress thread
+            try:
+                os.remove(os.path.join(self.folder, name + ".gz"))
+            except OSError:
+                pass
+            del segments[name]
+            over -= seg["stored"]
+            self.stats["evicted"] += 1
+            logs = []
+            for log in self.index["logs"]:
+                kept = [p for p in log["parts"] if p[0] != name]
+                if len(kept) != len(log["parts"]):
+                    log["parts"] = kept
+                    log["partial"] = True  # head of the log deleted
+                if kept or log is self.current or log in self.open.values():
+                    logs.append(log)
+            self.index["logs"] = logs
+
+    def _save(self):
+        path = os.path.join(self.folder, INDEX)
+        with open(path + ".tmp", "w") as f:
+            json.dump(self.index, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+
+_stores = {}  # abspath of the folder -> LogStore of this process
+
+
+def load_index(folder) -> dict:
+    # index.json of a store folder, empty index if there is none
+    try:
+        with open(os.path.join(folder, INDEX), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"next": 0, "segments": {}, "logs": []}
+
+
+def find_logs(index, **kwargs) -> list:
+    # index entries by name / item (substring) / cycle / temp, oldest first
+    name = kwargs.get("name", None)
+    item = kwargs.get("item", None)
+    cycle = kwargs.get("cycle", None)
+    temp = kwargs.get("temp", None)
+    return [
+        log
+        for log in index["logs"]
+        if (name is None or log["name"] == name)
+        and (item is None or str(item) in str(log["item"]))
+        and (cycle is None or log["cycle"] == cycle)
+        and (temp is None or str(log["temp"]) == str(temp))
+    ]
+
+
+def read_log(folder, name, index=None) -> str:
+    # text of the last log called name, through the parts in the index
+    index = load_index(folder) if index is None else index
+    found = find_logs(index, name=name)
+    if not found:
+        raise FileNotFoundError(f"{name} not in {folder}")
+    data = []
+    for segment, offset, length in found[-1]["parts"]:
+        data.append(read_part(folder, segment, offset, length))
+    return b"".join(data).decode(errors="replace")
+
+
+def read_part(folder, segment, offset, length) -> bytes:
+    path = os.path.join(folder, segment)
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        f = gzip.open(path + ".gz")  # compressed since
+    with f:
+        f.seek(offset)  # gzip: decompresses up to offset
+        return f.read(length)
+
+
+def log_open(path):
+    # open(path, "r") of a test log, or its text from the log_store folder
+    # next to it once the file is only in the store
+    if os.path.exists(path):
+        return open(path, "r")
+    folder = os.path.join(os.path.dirname(path), STORE_DIR)
+    store = _stores.get(os.path.abspath(folder))
+    if store is not None:
+        text = store.read(os.path.basename(path))
+    else:
+        text = read_log(folder, os.path.basename(path))
+    return io.StringIO(text, newline=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--store", default=LOG_STORE, help="store folder")
+    parser.add_argument("--item", help="test item (substring)")
+    parser.add_argument("--cycle", type=int, help="test cycle")
+    parser.add_argument("--temp", help="temperature")
+    parser.add_argument("--cat", metavar="NAME", help="print the text of a log")
+    args = parser.parse_args()
+
+    if args.cat:
+        print(read_log(args.store, args.cat), end="")
+        return
+    index = load_index(args.store)
+    logs = find_logs(index, item=args.item, cycle=args.cycle, temp=args.temp)
+    rows = [
+        [
+            log["name"],
+            log["item"],
+            log["cycle"],
+            log["temp"],
+            log["bytes"],
+            " ".join(f"{s}@{o}" for s, o, _ in log["parts"][:2])
+            + (" ..." if len(log["parts"]) > 2 else ""),
+            "partial" if log.get("partial") else "",
+            log["path"] if log.get("file_bytes") else "",
+        ]
+        for log in logs
+    ]
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "log",
+                "item",
+                "cycle",
+                "temp",
+                "bytes",
+                "segment@offset",
+                "",
+                ".txt",
+            ],
+        ),
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+
+I2C_LOG = "TestTools/i2c_log.txt"
+
+_FLUSH = object()  # queue marker: write what is buffered, then set the event
+
+
+class LogWriter:
+    """Buffered appender of one text log file (TestTools/i2c_log.txt).
+
+    write() puts the text on a bounded queue and returns; a background thread
+    appends it to the file once flush_bytes are buffered or interval seconds
+    have passed, opening the file once per flush. A full queue blocks the
+    caller until the thread catches up. flush() returns when everything
+    written before it is in the file: call it before the file is read (test
+    item end). truncate() replaces the content in queue order. Every writer is
+    flushed at exit and before an uncaught exception is printed.
+
+    buffered=False writes through (open, append, close on every write()), the
+    behaviour before the queue. rotate_setup(store) caps the file: once it
+    holds max_bytes its text moves to a Log_Store log of the file name;
+    read() is that text + the file, truncate() starts a new one.
+    """
+
+    def __init__(self, path, **kwargs) -> None:
+        self.path = path
+        self.buffered = kwargs.get("buffered", True)
+        self.flush_bytes = kwargs.get("flush_bytes", 1 << 16)
+        self.interval = kwargs.get("interval", 0.5)  # s
+        self.queue = queue.Queue(kwargs.get("maxsize", 1 << 16))
+        self.lock = threading.Lock()  # one file writer: thread or a drain
+        self.stats = {"writes": 0, "flushes": 0, "bytes": 0, "blocked": 0}
+        self.stats["rotations"] = 0
+        self.thread = None
+        self.store = None  # Log_Store.LogStore, rotate_setup()
+        self.max_bytes = 0
+
+    def rotate_setup(self, store=None, max_bytes=8 << 20) -> None:
+        # store=None: the file grows until truncate()
+        self.store = store
+        self.max_bytes = max_bytes
+
+    def write(self, text) -> None:
+        self.stats["writes"] += 1
+        if not self.buffered:
+            self._append([text])
+            return
+        self._start()
+        try:
+            self.queue.put_nowait(text)
+        except queue.Full:
+            self.stats["blocked"] += 1
+            self.queue.put(text)
+
+    def truncate(self, text="") -> None:
+        # file content becomes text, after every line written before
+        self.flush()
+        with self.lock:
+            with open(self.path, "w") as f:
+                f.write(text)
+            if self.store is not None:
+                self.store.end(os.path.basename(self.path))
+
+    def read(self) -> str:
+        # every line since truncate(): rotated into the store, then the file
+        self.flush()
+        with self.lock:
+            head = ""
+            if self.store is not None:
+                head = self.store.opened(os.path.basename(self.path))
+            with open(self.path, "r") as f:
+                return head + f.read()
+
+    def flush(self, timeout=10.0) -> bool:
+        # True once everything written before is in the file
+        if self.thread is None or not self.thread.is_alive():
+            self._drain()
+            return True
+        done = threading.Event()
+        self.queue.put((_FLUSH, done))
+        if done.wait(timeout):
+            return True
+        self._drain()  # writer thread stuck (exiting interpreter)
+        return False
+
+    def _start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(
+                target=self._run, name=f"LogWriter {self.path}", daemon=True
+            )
+            self.thread.start()
+
+    def _run(self):
+        chunks, size, events = [], 0, []
+        deadline = time.monotonic() + self.interval
+        while True:
+            try:
+                item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple) and item[0] is _FLUSH:
+                events.append(item[1])
+            elif item is not None:
+                chunks.append(item)
+                size += len(item)
+            if events or size >= self.flush_bytes or time.monotonic() >= deadline:
+                with self.lock:
+                    self._append(chunks)
+                chunks, size = [], 0
+                for done in events:
+                    done.set()
+                events = []
+                deadline = time.monotonic() + self.interval
+
+    def _drain(self):
+        # write the queued text from the calling thread
+        chunks = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, tuple) and item[0] is _FLUSH:
+                item[1].set()
+            else:
+                chunks.append(item)
+        with self.lock:
+            self._append(chunks)
+
+    def _append(self, chunks):
+        if not chunks:
+            return
+        text = "".join(chunks)
+        try:
+            with open(self.path, "a+") as f:
+                f.write(text)
+        except OSError as e:
+            print(f"{self.path} not written : {e}", flush=True)
+            return
+        self.stats["flushes"] += 1
+        self.stats["bytes"] += len(text)
+        if self.store is not None and os.path.getsize(self.path) >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        # file text to the store (log of the file name), file starts empty
+        with open(self.path, "r") as f:
+            text = f.read()
+        self.store.write(text, name=os.path.basename(self.path))
+        with open(self.path, "w"):
+            pass
+        self.stats["rotations"] += 1
+
+
+_writers = {}  # path -> LogWriter
+
+
+def log_writer(path=I2C_LOG, **kwargs) -> LogWriter:
+    # shared LogWriter of a file, kwargs only apply when it is created
+    writer = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = LogWriter(path, **kwargs)
+    return writer
+
+
+def flush_all() -> None:
+    for writer in list(_writers.values()):
+        writer.flush()
+
+
+def _excepthook(hook):
+    def flush_then(*args):
+        flush_all()
+        hook(*args)
+
+    return flush_then
+
+
+atexit.register(flush_all)
+sys.excepthook = _excepthook(sys.excepthook)  # wx prints handler errors with it
+threading.excepthook = _excepthook(threading.excepthook)
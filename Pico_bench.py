@@ -0,0 +1,1743 @@
+#!/usr/bin/env python3
+"""
+Host-side benchmarks for the Raspberry Pico register-access paths.
+
+Runs the real Raspberry_Pico / Glink_phy code against Pico_sim boards, so the
+numbers reflect REPL round trips and host CPU cost, not silicon timing.
+The "same ..." columns are self-checks against the reference path: the run
+exits 1 if any of them is False.
+
+Usage:
+    python Pico_bench.py agent                     # REPL vs pico_agent APB access
+    python Pico_bench.py agent --latency 0.004     # per-exec latency in seconds
+    python Pico_bench.py batch                     # Pico.begin_batch()/commit()
+    python Pico_bench.py binary                    # REPL text vs pico_binary frames
+    python Pico_bench.py sim --nack-rate 0.001     # chip simulator, NACK injection
+    python Pico_bench.py supervise --fault-rate 0.01  # USB faults + reconnect/replay
+    python Pico_bench.py broadcast                 # 4-slice writes, indirect_write vs broadcast_write
+    python Pico_bench.py bits                      # cached BitField vs bit-string parse
+    python Pico_bench.py burst                     # indirect_read vs indirect_read_burst
+    python Pico_bench.py cache                     # UCIe_2p5D APB shadow cache, verify_cache
+    python Pico_bench.py console --lines 20000     # m_richText1 sink, RedirectText vs throttled ConsoleSink
+    python Pico_bench.py combine                   # reg_user_set write combining per APB word
+    python Pico_bench.py die                       # die_sel 0x70 writes, tracked vs every call
+    python Pico_bench.py gpio                      # GUC_chip_rst GPIO pulses
+    python Pico_bench.py log                       # i2c_log.txt, write-through vs LogWriter queue
+    python Pico_bench.py logstore --log-gb 2       # capped Log_Store, rotation / gzip / index
+    python Pico_bench.py mux                       # U142 mux_scan, per-channel vs 1 exec
+    python Pico_bench.py plan                      # reg_user_set plan compile / run, Test Report sheet
+    python Pico_bench.py pipeline --service-time 0.002  # PipelinedPico overlap
+    python Pico_bench.py qualify --f-max 0.5e6      # Pico.qualify_bus() clock ladder
+    python Pico_bench.py ready --ready-delay 5e-3  # EHOST done check, host vs on-device poll
+    python Pico_bench.py regmap                    # field wrappers, slice by slice vs one batch
+    python Pico_bench.py verify                    # reg_user_set write read back: none / sampled / deferred / strict
+    python Pico_bench.py trace                     # binary Reg_Trace vs i2c_log.txt text, round trip
+    python Pico_bench.py replay                    # Reg_Replay of a recorded log / trace, per-phase speedup
+    python Pico_bench.py shadow                    # Pico.write RMW with shadow cache
+"""
+
+import argparse
+import ast
+import contextlib
+import io
+import json
+import os
+import queue
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+import Reg_Replay
+from Console_Sink import ConsoleSink
+from Glink_phy import UCIe_2p5D
+from Log_Store import STORE_DIR as LOG_STORE_DIR
+from Log_Store import LogStore, log_open
+from Log_Writer import LogWriter
+from Pico_binary import PicoBinaryTransport
+from Pico_pipeline import PipelinedPico
+from Pico_sim import FakePyboard, SimulatedPyboard, binary_loopback, repl_pyboard
+from Raspberry_Pico import (
+    PROJECT_JSON,
+    QUALIFY_KEY,
+    Pico,
+    _bit_field,
+    bit_field,
+    extract,
+)
+from Reg_Trace import load, select, write_csv, write_text
+from TestTools.pico_python_library.mpremote import pyboard
+
+SEQUENCE_XLS = "Test_Report/Test Report EZ0005A.xlsx"
+SEQUENCE_SECTIONS = [  # (PLL2) / (HW2) have no default column values
+    ("PLL", "HW1"),
+    ("HW1", "PLL2"),
+    ("PCS1", "PMAD1"),
+    ("PMAD1", "USER1"),
+]
+
+FAILED = []  # names of the self-checks that came out False in this run
+
+
+def check(name, ok):
+    # bench self-check: ok stays in the table, a False one fails the run
+    # ("" is a row the check does not apply to)
+    if not ok and ok != "":
+        FAILED.append(name)
+    return ok
+
+
+def make_phy(board, **kwargs):
+    pico = Pico("7-bit", pyb=board, **kwargs)
+    phy = UCIe_2p5D(None, pico, None)
+    phy.save_log = 0
+    return phy
+
+
+def register_sequences(path=SEQUENCE_XLS, column=10):
+    # Register_init sections of the "Register Sequence-1" sheet as reg_user_set
+    # reg_arr lists (Glink_Top.pll_seach_xls_str), column: value column
+    df = pd.ExcelFile(path).parse(1)
+    marks = [str(name) for name in df.iloc[:, 0]]
+    sections = {}
+    for start, end in SEQUENCE_SECTIONS:
+        r0 = next(r for r, name in enumerate(marks) if start in name)
+        reg_arr = []
+        for r in range(r0 + 1, len(df)):
+            row = df.iloc[r]
+            if str(row.iloc[1]) not in ("nan", ""):
+                fields = [row.iloc[1], row.iloc[2], row.iloc[column]]
+                reg_arr.append(", ".join(map(str, fields + list(row.iloc[3:10]))))
+            if end in marks[r]:
+                break
+        sections[start] = reg_arr
+    return sections
+
+
+def bench_agent(args):
+    rows = []
+    for agent in (0, 1):
+        board = FakePyboard(latency=args.latency)
+        phy = make_phy(board, agent=agent)
+        execs = board.execs
+        start = time.perf_counter()
+        for i in range(args.ops):
+            address = 0x3300 + 4 * (i % 16) + 0x10000 * (i % 4)
+            phy.indirect_write(0x2, address, "13:8", i & 0x3F)
+            phy.indirect_read(0x2, address, "13:8")
+        elapsed = time.perf_counter() - start
+        ops = 2 * args.ops
+        rows.append(
+            [
+                "pico_agent" if agent else "REPL",
+                ops,
+                (board.execs - execs) / ops,
+                f"{elapsed:.3f}",
+                f"{ops / elapsed:.1f}",
+            ]
+        )
+    print(
+        tabulate(rows, headers=["path", "APB ops", "execs/op", "time (s)", "ops/s"]),
+        flush=True,
+    )
+
+
+def bench_batch(args):
+    rows = []
+    expect = None
+    for batch in (0, 1):
+        board = FakePyboard(latency=args.latency)
+        pico = Pico("7-bit", pyb=board)
+        execs = board.execs
+        start = time.perf_counter()
+        if batch:
+            pico.begin_batch()
+        reads = []
+        for i in range(args.ops):
+            pico.write(0x2, 0x40 + 4 * (i % 16), 4, 6, i & 0x3F)
+            reads.append(pico.read(0x2, 0x40 + 4 * (i % 16), 0, 32))
+        if batch:
+            reads = pico.commit()
+        elapsed = time.perf_counter() - start
+        expect = reads if expect is None else expect
+        ops = 2 * args.ops
+        rows.append(
+            [
+                "batch" if batch else "single",
+                ops,
+                board.execs - execs,
+                f"{elapsed:.3f}",
+                f"{ops / elapsed:.1f}",
+                check("batch same reads", reads == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=["path", "I2C ops", "execs", "time (s)", "ops/s", "same reads"],
+        ),
+        flush=True,
+    )
+
+
+def bench_binary(args):
+    # pty loopback has no USB latency; compare wire bytes and host CPU per op
+    rows = []
+    expect = None
+    for binary in (0, 1):
+        if binary:
+            ser, thread = binary_loopback()
+            pico = PicoBinaryTransport("7-bit", serial=ser)
+            link = pico
+        else:
+            link = FakePyboard()
+            pico = Pico("7-bit", pyb=link, agent=0)
+        tx, rx = link.tx_bytes, link.rx_bytes
+        start = time.perf_counter()
+        reads = []
+        for i in range(args.ops):
+            pico.write(0x2, 0x40 + 4 * (i % 16), 0, 32, 0x01030000 + i)
+            reads.append(pico.read(0x2, 0x40 + 4 * (i % 16), 0, 32))
+        elapsed = time.perf_counter() - start
+        expect = reads if expect is None else expect
+        ops = 2 * args.ops
+        rows.append(
+            [
+                "pico_binary" if binary else "REPL",
+                ops,
+                (link.tx_bytes - tx) / ops,
+                (link.rx_bytes - rx) / ops,
+                f"{ops / elapsed:.1f}",
+                check("binary same reads", reads == expect),
+            ]
+        )
+        if binary:
+            pico.close()
+            thread.join(2)
+    print(
+        tabulate(
+            rows,
+            headers=["path", "I2C ops", "tx B/op", "rx B/op", "ops/s", "same reads"],
+        ),
+        flush=True,
+    )
+
+
+def bench_sim(args):
+    # register wrappers on the chip model: throughput and NACK robustness
+    rows = []
+    for agent in (0, 1):
+        board = SimulatedPyboard(
+            latency=args.latency,
+            i2c_latency=args.i2c_latency,
+            nack_rate=args.nack_rate,
+            seed=1,
+        )
+        phy = make_phy(board, agent=agent)
+        bus = board.bus
+        failed = 0
+        transactions = bus.transactions
+        start = time.perf_counter()
+        for i in range(args.ops):
+            try:
+                phy.rg_vref_range_start(i % 3, 2, "V", setv=hex(i & 0x3F), r_bk=1)
+            except pyboard.PyboardError:
+                failed += 1
+        elapsed = time.perf_counter() - start
+        rows.append(
+            [
+                "pico_agent" if agent else "REPL",
+                args.ops,
+                failed,
+                bus.nacks,
+                (bus.transactions - transactions) / args.ops,
+                f"{args.ops / elapsed:.1f}",
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=["path", "calls", "failed", "NACKs", "I2C/call", "calls/s"],
+        ),
+        flush=True,
+    )
+
+
+def bench_bits(args):
+    # bit-string parse + mask per call vs the cached BitField descriptors
+    bits = ["13:8", "31:0", "7", "23:16", "4:1", "0"] * 16
+
+    def legacy(bit, word):
+        if bit.find(":") != -1:
+            parts = bit.split(":")
+            lsb, width = int(parts[1]), abs(int(parts[0]) - int(parts[1])) + 1
+        else:
+            lsb, width = int(bit), 1
+        return (word >> lsb) & int("1" * width, 2)
+
+    words = np.random.default_rng(1).integers(0, 1 << 32, 4096, dtype=np.uint64)
+    n = args.ops * len(bits)
+    rows = []
+    expect = None
+    for path in ("parse", "BitField"):
+        start = time.perf_counter()
+        for _ in range(args.ops):
+            if path == "parse":
+                out = [legacy(bit, 0xDEADBEEF) for bit in bits]
+            else:
+                out = [bit_field(bit).extract(0xDEADBEEF) for bit in bits]
+        elapsed = time.perf_counter() - start
+        expect = out if expect is None else expect
+        rows.append(
+            [path, n, f"{1e6 * elapsed / n:.3f}", check("bits same", out == expect)]
+        )
+    start = time.perf_counter()
+    out = [legacy("13:8", int(w)) for w in words]
+    elapsed = time.perf_counter() - start
+    rows.append(
+        ["parse, 4096 words", len(words), f"{1e6 * elapsed / len(words):.3f}", True]
+    )
+    start = time.perf_counter()
+    vec = extract(words, "13:8")
+    elapsed = time.perf_counter() - start
+    rows.append(
+        [
+            "extract(ndarray)",
+            len(words),
+            f"{1e6 * elapsed / len(words):.3f}",
+            check("bits extract same", out == vec.tolist()),
+        ]
+    )
+    for agent in (0, 1):
+        expect = None
+        for path in ("cold", "warm"):
+            phy = make_phy(FakePyboard(latency=0), agent=agent)
+            start = time.perf_counter()
+            reads = []
+            for i in range(args.ops):
+                bit = bits[i % len(bits)]
+                if path == "cold":
+                    _bit_field.cache_clear()
+                phy.indirect_write(0x2, 0x3300 + 4 * (i % 16), bit, i & 1)
+                reads.append(phy.indirect_read(0x2, 0x3300 + 4 * (i % 16), bit))
+            elapsed = time.perf_counter() - start
+            expect = reads if expect is None else expect
+            rows.append(
+                [
+                    f"{'pico_agent' if agent else 'REPL'} indirect_*, {path} cache",
+                    2 * args.ops,
+                    f"{1e6 * elapsed / (2 * args.ops):.3f}",
+                    check("bits cached same", reads == expect),
+                ]
+            )
+    print(
+        tabulate(rows, headers=["path", "calls", "us/call", "same"]),
+        flush=True,
+    )
+
+
+def bench_broadcast(args):
+    # same field value on 4 slices, no read back: indirect_write slice by slice
+    # (with an indirect_read for the value before) vs one broadcast_write
+    fields = [
+        (0x3450, "6:4"),
+        (0x3628, "27:24"),
+        (0x3408, "31:0"),
+        (0x7100, "0"),
+    ]
+    slices = [0, 1, 2, 3]
+    rows = []
+    for agent in (0, 1):
+        expect = None
+        for path in ("per slice", "broadcast", "broadcast, before=0"):
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            phy.die_sel(die=1)
+            bus = board.bus
+            runs = max(1, args.ops // len(fields))
+            befores = []
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            for i in range(runs):
+                for offset, bit in fields:
+                    value = (i * 0x9E3779B1) & bit_field(bit).extract(0xFFFFFFFF)
+                    if path == "per slice":
+                        for n in slices:
+                            address = offset + n * phy.slice_offset
+                            befores.append(
+                                phy.indirect_read(0x2, address, bit, slice_num=n)
+                            )
+                            phy.indirect_write(0x2, address, bit, value, slice_num=n)
+                    else:
+                        before = phy.broadcast_write(
+                            0x2, offset, bit, value, slices, before=path == "broadcast"
+                        )
+                        befores += before.values()
+            elapsed = time.perf_counter() - start
+            apb = dict(bus.apb)
+            expect = (befores, apb) if expect is None else expect
+            n = runs * len(fields)
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    path,
+                    (bus.transactions - transactions) / n,
+                    (board.execs - execs) / n,
+                    f"{n / elapsed:.1f}",
+                    check("broadcast same APB", apb == expect[1]),
+                    (
+                        check("broadcast same before", befores == expect[0])
+                        if befores
+                        else ""
+                    ),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "API",
+                "I2C/call",
+                "execs/call",
+                "calls/s",
+                "same APB",
+                "same before",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_burst(args):
+    # read_deskew_tx's 16 words: one indirect_read per word vs one burst
+    addresses = [0x3464 + 0x10000 + 4 * i for i in range(16)]
+    rows = []
+    for agent in (0, 1):
+        expect = None
+        for path in ("indirect_read", "burst"):
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            bus = board.bus
+            for i, address in enumerate(addresses):
+                bus.apb[(1, 0x2, address)] = 0x01010101 * i
+            phy.die_sel(die=1)
+            runs = max(1, args.ops // 16)
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            for _ in range(runs):
+                if path == "burst":
+                    words = phy.indirect_read_burst(0x2, addresses, slice_num=-1)
+                else:
+                    words = {
+                        a: int(phy.indirect_read(0x2, a, "31:0", slice_num=-1), 16)
+                        for a in addresses
+                    }
+            elapsed = time.perf_counter() - start
+            expect = words if expect is None else expect
+            n = runs * len(addresses)
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    path,
+                    (bus.transactions - transactions) / n,
+                    (board.execs - execs) / n,
+                    f"{n / elapsed:.1f}",
+                    check("burst same", words == expect),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=["path", "API", "I2C/word", "execs/word", "words/s", "same"],
+        ),
+        flush=True,
+    )
+
+
+def bench_cache(args):
+    # monitor loop: config words re-read every pass plus volatile BIST words
+    # that the chip changes behind the host, APB cache off vs on
+    config = [(0x2114, "15:0"), (0x3458, "21:8"), (0x3460, "5:0"), (0x3450, "29:24")]
+    volatile = [(0x7134, "31:0"), (0x3370, "31:0"), (0x3378, "5:0")]
+    rows = []
+    expect = None
+    for cache in (0, 1):
+        board = SimulatedPyboard(latency=args.latency)
+        phy = make_phy(board)
+        phy.cache_setup(cache=cache)  # register map loaded untimed
+        bus = board.bus
+        phy.die_sel(die=0)
+        for address, bit in config:
+            phy.indirect_write(0x2, address, bit, 0x15)
+        runs = max(1, args.ops // 10)
+        transactions, execs = bus.transactions, board.execs
+        start = time.perf_counter()
+        reads = []
+        for i in range(runs):
+            bus.apb[(0, 0x2, 0x7134)] = i  # BIST_ERR_COUNT counts on the chip
+            bus.apb[(0, 0x2, 0x3370)] = i << 4
+            for address, bit in config + volatile:
+                reads.append(phy.indirect_read(0x2, address, bit))
+        elapsed = time.perf_counter() - start
+        expect = reads if expect is None else expect
+        diff = len(phy.verify_cache(show=0))
+        bus.apb[(0, 0x2, 0x3460)] = 0x3F  # changed behind the host
+        stale = len(phy.verify_cache(show=0))
+        phy.mux_invalidate()  # chip reset
+        stats = phy.cache_stats
+        rows.append(
+            [
+                "cached" if cache else "no cache",
+                len(reads),
+                (bus.transactions - transactions) / len(reads),
+                (board.execs - execs) / len(reads),
+                stats["hits"],
+                stats["misses"],
+                stats["bypass"],
+                f"{diff}/{stale}",
+                len(phy.apb_cache or {}),
+                f"{len(reads) / elapsed:.1f}",
+                check("cache same reads", reads == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "reads",
+                "I2C/read",
+                "execs/read",
+                "hits",
+                "misses",
+                "bypass",
+                "verify diff",
+                "after reset",
+                "reads/s",
+                "same reads",
+            ],
+        ),
+        flush=True,
+    )
+
+
+class FakeRichText:
+    # wx.richtext.RichTextCtrl calls of ConsoleSink; every call busy-waits
+    # call_cost s (layout / repaint of the real control)
+    def __init__(self, call_cost) -> None:
+        self.call_cost = call_cost
+        self.text = ""
+        self.calls = 0
+        self.peak_lines = 0
+
+    def _call(self):
+        self.calls += 1
+        end = time.perf_counter() + self.call_cost
+        while time.perf_counter() < end:
+            pass
+
+    def MoveEnd(self):
+        self._call()
+
+    def MoveUp(self):
+        self._call()
+
+    def BeginTextColour(self, colour):
+        self._call()
+
+    def EndTextColour(self):
+        self._call()
+
+    def ScrollPages(self, pages):
+        self._call()
+
+    def WriteText(self, text):
+        self._call()
+        self.text += text
+        self.peak_lines = max(self.peak_lines, self.GetNumberOfLines())
+
+    def GetNumberOfLines(self):
+        return self.text.count("\n") + 1
+
+    def XYToPosition(self, x, y):
+        pos = 0
+        for _ in range(y):
+            pos = self.text.index("\n", pos) + 1
+        return pos + x
+
+    def GetRange(self, start, end):
+        return self.text[start:end]
+
+    def Remove(self, start, end):
+        self._call()
+        self.text = self.text[:start] + self.text[end:]
+
+    def GetValue(self):
+        return self.text
+
+    def Clear(self):
+        self._call()
+        self.text = ""
+
+
+def bench_console(args):
+    # --lines print() lines (every 20th cyan, every 50th red) into the
+    # m_richText1 sink on a FakeRichText: old RedirectText (control calls per
+    # write, unbounded) vs ConsoleSink ring drained by a fake wx.CallAfter
+    # thread at 30 Hz, 5000 visible lines
+    lines = [
+        ("\033 BIST FAIL" if i % 50 == 0 else "\034 PLL lock" if i % 20 == 0 else "")
+        + f" line {i} : slice{i % 4} eye width = {i % 64}"
+        for i in range(args.lines)
+    ]
+    expect = "".join(line + "\n" for line in lines)
+    folder = tempfile.mkdtemp()
+    rows = []
+    for path in ("RedirectText", "ConsoleSink"):
+        control = FakeRichText(args.call_cost)
+        spill = LogWriter(os.path.join(folder, f"{path}.txt"))
+        gui_queue = queue.Queue()
+        gui = threading.Thread(
+            target=lambda: [f() for f in iter(gui_queue.get, None)], daemon=True
+        )
+        gui.start()
+        if path == "RedirectText":
+            sink = ConsoleSink(control, max_lines=0, spill=spill)
+        else:
+            sink = ConsoleSink(
+                control, call_after=gui_queue.put, spill=spill, gui_thread=gui
+            )
+        start = time.perf_counter()
+        for line in lines:
+            print(line, file=sink)
+        printed = time.perf_counter() - start
+        while sink.ring or (sink.call_after and not sink.drained.is_set()):
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - start
+        gui_queue.put(None)
+        gui.join()
+        rows.append(
+            [
+                path,
+                f"{args.lines / printed:.0f}",
+                f"{args.lines / elapsed:.0f}",
+                control.calls,
+                sink.stats["drains"],
+                f"{sink.stats['drains'] / elapsed:.1f}",
+                control.peak_lines,
+                sink.stats["spilled"],
+                check("console same text", sink.GetValue() == expect),
+            ]
+        )
+    shutil.rmtree(folder)
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "sink",
+                "print lines/s",
+                "shown lines/s",
+                "control calls",
+                "drains",
+                "drains/s",
+                "peak lines",
+                "spilled",
+                "same text",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_combine(args):
+    # Register Sequence style reg_user_set: several fields per APB word, each
+    # an indirect_write RMW vs one RMW per word (write_combine_*)
+    fields = [
+        ("0x2000", "7:0", "0xf1"),
+        ("0x2114", "15:0", "0x30a0"),
+        ("0x2100", "0", "0x0"),  # cmu_rstn: ordered
+        ("0x2100", "0", "0x1"),
+        ("0x32e0", "13:8", "0x0"),
+        ("0x32e0", "21:16", "0x3f"),
+        ("0x3300", "5:0", "0x10"),
+        ("0x3504", "2", "0x1"),
+        ("0x3504", "5", "0x0"),
+        ("0x3450", "29:24", "0x20"),
+        ("0x3450", "7:0", "0x11"),
+        ("0x3458", "29:28", "0x0"),
+        ("0x3458", "3:0", "0x5"),
+        ("0x3600", "26:24", "0x1"),
+    ]
+    reg_arr = [
+        f"{offset},{bit},{value},nan,nan,V,nan,0/1/2,1/2,0/1/2/3"
+        for offset, bit, value in fields
+    ]
+    reg_arr.append("0x2158,9:4,nan,nan,nan,nan,V,0/1/2,1/2,0/1/2/3")  # status read
+    rows = []
+    for agent in (0, 1):
+        expect = None
+        for combine in (0, 1):
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            phy.reg_map()  # load untimed
+            bus = board.bus
+            runs = max(1, args.ops // 50)
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            for _ in range(runs):
+                phy.reg_user_set(
+                    reg_arr=reg_arr, mode="USER_mode", show=0, combine=combine
+                )
+            elapsed = time.perf_counter() - start
+            expect = bus.apb if expect is None else expect
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    "combined" if combine else "per field",
+                    (bus.transactions - transactions) / runs,
+                    (board.execs - execs) / runs,
+                    phy.wc_stats["fields"] // runs,
+                    phy.wc_stats["words"] // runs,
+                    f"{1000 * elapsed / runs:.1f}",
+                    check("combine same APB", bus.apb == expect),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "writes",
+                "I2C/seq",
+                "execs/seq",
+                "fields",
+                "RMW words",
+                "ms/seq",
+                "same APB",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_die(args):
+    # GUI-style access, die_sel before every register: 0x70 written every call
+    # vs tracked; the simulator fails any EHOST access on the wrong Die
+    rng = random.Random(1)
+    plan = []
+    die = 0
+    for i in range(args.ops):
+        if rng.random() < 0.1:
+            die = rng.choice([0, 1, 2])
+        event = None
+        if i % 100 == 75:
+            event = "reset"
+        elif i % 50 == 25:
+            event = "direct"  # Glink_run style i2c.write(0x70, ...)
+        plan.append((die, event, 0x3300 + 4 * (i % 16), i & 0x3F))
+    rows = []
+    expect = None
+    for track in (0, 1):
+        board = SimulatedPyboard(latency=args.latency)
+        phy = make_phy(board, mux_track=track)
+        bus = board.bus
+        execs = board.execs
+        start = time.perf_counter()
+        reads = []
+        for die, event, address, value in plan:
+            if event == "direct":
+                phy.non_i2c_write(0x70, 0x04, 0, 8, 0x04)
+            elif event == "reset":
+                phy.mux_invalidate()
+            bus.expect_die = None
+            phy.die_sel(die=die)
+            bus.expect_die = die
+            phy.indirect_write(0x2, address, "13:8", value)
+            reads.append(phy.indirect_read(0x2, address, "13:8"))
+        bus.expect_die = None
+        elapsed = time.perf_counter() - start
+        expect = reads if expect is None else expect
+        stats = phy.i2c.mux_stats
+        rows.append(
+            [
+                "tracked" if track else "every call",
+                len(plan),
+                bus.mux_writes,
+                stats["suppressed"],
+                bus.wrong_die,
+                (board.execs - execs) / len(plan),
+                f"{len(plan) / elapsed:.1f}",
+                check("die same reads", reads == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "die_sel",
+                "accesses",
+                "0x70 writes",
+                "suppressed",
+                "wrong Die",
+                "execs/access",
+                "accesses/s",
+                "same reads",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_gpio(args):
+    # GUC_chip_rst GPIO6/7/8 reset: GPIO_Set per edge vs gpio_apply pulses
+    rows = []
+    expect = None
+    for path in ("GPIO_Set", "gpio_apply"):
+        board = FakePyboard(latency=args.latency)
+        pico = Pico("7-bit", pyb=board)
+        execs = board.execs
+        mark = len(board.pin_log)
+        start = time.perf_counter()
+        if path == "GPIO_Set":
+            for pin in [6, 7, 8]:
+                pico.GPIO_Set(pin, 1)
+                pico.GPIO_Set(pin, 0)
+                pico.GPIO_Set(pin, 1)
+        else:
+            pico.gpio_apply(0x1C0, 0)
+            for pin in [6, 7, 8]:
+                pico.gpio_apply(0, 1 << pin, pulse_us=10000)
+        elapsed = time.perf_counter() - start
+        log = board.pin_log[mark:]
+        final = [board.pins[pin] for pin in [6, 7, 8]]
+        widths = [
+            1000 * (t1 - t0)
+            for (t0, p0, l0), (t1, p1, l1) in zip(log, log[1:])
+            if p0 == p1 and (l0, l1) == (0, 1)
+        ]
+        expect = final if expect is None else expect
+        rows.append(
+            [
+                path,
+                board.execs - execs,
+                f"{1000 * elapsed:.1f}",
+                " / ".join(f"{w:.2f}" for w in widths),
+                check("gpio same pins", final == expect),
+            ]
+        )
+    # GPIO_Set shows extra short pulses: Pin(n, Pin.OUT) drives the old low
+    # level for one exec before rst.value(1)
+    print(
+        tabulate(
+            rows,
+            headers=["path", "execs", "reset (ms)", "low pulses (ms)", "same pins"],
+        ),
+        flush=True,
+    )
+
+
+def bench_log(args):
+    # save_log=1 register accesses (indirect_write / indirect_read pairs, no
+    # exec latency: host cost only) with i2c_log.txt written through (open /
+    # append / close per access) vs queued to the LogWriter thread
+    folder = tempfile.mkdtemp()
+    rows = []
+    expect = None  # write-through file content
+    for path in ("no log", "write-through", "LogWriter"):
+        phy = make_phy(SimulatedPyboard(latency=0.0))
+        log = os.path.join(folder, f"{path}.txt")
+        phy.i2c_log = LogWriter(log, buffered=path == "LogWriter")
+        phy.save_log = 0 if path == "no log" else 1
+        phy.die_sel(die=1)
+        start = time.perf_counter()
+        for i in range(args.accesses // 2):
+            address = 0x3628 + (i % 4) * phy.slice_offset
+            phy.indirect_write(0x2, address, "27:24", i % 16, slice_num=i % 4)
+            phy.indirect_read(0x2, address, "27:24", slice_num=i % 4)
+        elapsed = time.perf_counter() - start
+        phy.i2c_log.flush()
+        flushed = time.perf_counter() - start
+        content = open(log).read() if os.path.exists(log) else ""
+        expect = content if path == "write-through" else expect
+        rows.append(
+            [
+                path,
+                f"{1e6 * elapsed / args.accesses:.1f}",
+                f"{1e6 * flushed / args.accesses:.1f}",
+                phy.i2c_log.stats["flushes"],
+                len(content),
+                check("log same", content == expect) if content else "",
+            ]
+        )
+    shutil.rmtree(folder)
+    print(
+        tabulate(
+            rows,
+            headers=["i2c_log", "us/access", "+flush", "file writes", "bytes", "same"],
+        ),
+        flush=True,
+    )
+
+
+def store_item_text(block, n, size):
+    # synthetic log text n: register lines of block from a per-n start
+    start = n * 7919 % len(block)
+    body = (block[start:] + block) * (size // len(block) + 1)
+    return body[:size]
+
+
+def bench_logstore(args):
+    # --log-gb of test items through a LogStore capped at 8 segments, each
+    # item as Start_Test writes it: 6 MiB of i2c_log.txt lines (rotated into
+    # the store at 4 MiB), then write_log of 2 MiB console text + the whole
+    # i2c_log into the item .txt, taken into the store at the next item.
+    # Peak disk bytes (store + .txt files), index, read back through log_open
+    rng = random.Random(1)
+    block = "".join(
+        f"< Code > indirect_read : slave=0x2 , offset={hex(0x3000 + 4 * rng.randrange(1024))}"
+        f" , s_bit=31:0 , (R) value=0x{rng.getrandbits(32):08x}\n"
+        for _ in range(12000)
+    )
+    folder = tempfile.mkdtemp()
+    report_log = os.path.join(folder, "Test_Report Log")
+    segment = 16 << 20
+    store = LogStore(
+        os.path.join(report_log, LOG_STORE_DIR),
+        max_bytes=8 * segment,
+        segment_bytes=segment,
+    )
+    i2c_path = os.path.join(folder, "i2c_log.txt")
+    i2c_log = LogWriter(i2c_path)
+    i2c_log.rotate_setup(store, max_bytes=4 << 20)
+    peak = [0]
+    done = threading.Event()
+
+    def sample():
+        while not done.wait(0.02):
+            size = 0
+            for path in (store.folder, report_log):
+                for entry in os.scandir(path):
+                    with contextlib.suppress(FileNotFoundError):  # rotated away
+                        if entry.is_file():
+                            size += entry.stat().st_size
+            peak[0] = max(peak[0], size)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    item_bytes = 8 << 20
+    items = {}
+    total = 0
+    start = time.perf_counter()
+    for n in range(int(args.log_gb * (1 << 30)) // item_bytes):
+        name = f"PCS_BIST_{n}.txt"
+        store.item(
+            name,
+            path=os.path.join(report_log, name),
+            item="PCS_BIST",
+            cycle=n // 12,
+            temp=(25, 85, -40)[n % 3],
+        )
+        i2c = store_item_text(block, 2 * n, 6 << 20)
+        console = f"< Start Test > item {n}\n" + store_item_text(
+            block, 2 * n + 1, 2 << 20
+        )
+        for i in range(0, len(i2c), 1 << 18):
+            i2c_log.write(i2c[i : i + (1 << 18)])
+        items[name] = console + i2c_log.read()  # Start_Test: test item end
+        with open(os.path.join(report_log, name), "a+") as f:  # write_log
+            f.write(items[name])
+        i2c_log.truncate()
+        total += len(items[name])
+    store.flush()
+    files = [name for name in items if os.path.exists(os.path.join(report_log, name))]
+    elapsed = time.perf_counter() - start
+    done.set()
+    sampler.join()
+
+    kept = [log["name"] for log in store.find() if not log.get("partial")]
+    kept = [name for name in kept if name in items]  # not the i2c_log.txt logs
+    same = check(
+        "logstore read back same",
+        all(
+            log_open(os.path.join(report_log, name)).read() == items[name]
+            for name in kept[:2] + kept[-2:] + files[:1]
+        ),
+    )
+    n = int(kept[0][len("PCS_BIST_") : -len(".txt")])
+    i2c_same = items[kept[0]].endswith(store_item_text(block, 2 * n, 6 << 20))
+    lines = sum(1 for _ in log_open(os.path.join(report_log, kept[-1])))
+    index = os.path.getsize(os.path.join(store.folder, "index.json"))
+    rows = [
+        ["written", f"{total / (1 << 30):.2f} GiB in {len(items)} items"],
+        ["MiB/s", f"{total / (1 << 20) / elapsed:.0f}"],
+        [
+            "segments / compressed / evicted",
+            f"{store.stats['segments']} / {store.stats['compressed']} / {store.stats['evicted']}",
+        ],
+        ["compression", f"{store.stats['raw'] / max(1, store.stats['stored']):.1f}x"],
+        ["i2c_log rotations", i2c_log.stats["rotations"]],
+        ["write waits (compress behind)", store.stats["waits"]],
+        [
+            "peak disk MiB / cap MiB",
+            f"{peak[0] / (1 << 20):.0f} / {store.max_bytes >> 20}",
+        ],
+        ["store MiB at end", f"{store.disk_bytes() / (1 << 20):.0f}"],
+        ["index bytes", index],
+        ["logs in index (items kept whole)", f"{len(store.find())} ({len(kept)})"],
+        [".txt files left / deleted", f"{len(files)} / {store.stats['files']}"],
+        ["i2c after console", check("logstore i2c after console", i2c_same)],
+        ["25 Degree logs", len(store.find(temp=25))],
+        ["read back same / lines", f"{same} / {lines}"],
+    ]
+    store.close()
+    shutil.rmtree(folder)
+    print(tabulate(rows, headers=["log store", ""]), flush=True)
+
+
+def bench_mux(args):
+    # 8-channel U142 scan: old mux write + Pico.scan per channel vs one exec
+    channels = [0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80]
+    rows = []
+    expect = None
+    for path in ("per channel", "one exec", "cached"):
+        board = SimulatedPyboard(latency=args.latency, i2c_latency=args.i2c_latency)
+        phy = make_phy(board)
+        pico = phy.i2c
+        runs = max(1, args.ops // 20)
+        execs = board.execs
+        start = time.perf_counter()
+        for _ in range(runs):
+            if path == "per channel":
+                topology = {}
+                for mux_offset in channels:
+                    pico.write(0x71, mux_offset, 0, 8, mux_offset)
+                    topology[mux_offset] = pico.to_list(pico.pyb.eval("i2c.scan()"))
+                    pico.GP25_high()
+            else:
+                topology = phy.mux_scan(rescan=int(path == "one exec"))
+        elapsed = time.perf_counter() - start
+        expect = topology if expect is None else expect
+        rows.append(
+            [
+                path,
+                runs,
+                (board.execs - execs) / runs,
+                f"{1000 * elapsed / runs:.2f}",
+                check("mux same topology", topology == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=["path", "scans", "execs/scan", "ms/scan", "same topology"],
+        ),
+        flush=True,
+    )
+
+
+def bench_pipeline(args):
+    # raw REPL device that needs --service-time per command; the host spends
+    # --host-time per op on its own work (logging / formatting the results)
+    rows = []
+    for scale in (0.5, 1, 2, 4):
+        service = args.service_time * scale
+        expect = None
+        for cls in (Pico, PipelinedPico):
+            board = SimulatedPyboard()
+            pico = cls("7-bit", pyb=repl_pyboard(board, service_time=service))
+            pico.write(0x70, 0x01, 0, 8, 0x01)  # Die0
+            latency = []
+            start = time.perf_counter()
+            reads = []
+            for i in range(args.ops):
+                pico.write(0x2, 0x40 + 4 * (i % 16), 0, 32, 0x01030000 + i)
+                t0 = time.perf_counter()
+                read = pico.read_async if cls is PipelinedPico else pico.read
+                reads.append(read(0x2, 0x40 + 4 * (i % 16), 0, 32))
+                latency.append(time.perf_counter() - t0)
+                end = time.perf_counter() + args.host_time
+                while time.perf_counter() < end:
+                    pass
+            if cls is PipelinedPico:
+                pico.flush()
+                latency = [r.t_done - r.t_issue for r in reads]  # issue to reply
+                reads = [r.get() for r in reads]
+            elapsed = time.perf_counter() - start
+            expect = reads if expect is None else expect
+            rows.append(
+                [
+                    f"{1000 * service:.1f}",
+                    cls.__name__,
+                    f"{1000 * sum(latency) / len(latency):.2f}",
+                    f"{2 * args.ops / elapsed:.1f}",
+                    check("pipeline same reads", reads == expect),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=["service (ms)", "path", "latency (ms)", "ops/s", "same reads"],
+        ),
+        flush=True,
+    )
+
+
+def host_poll_chk(phy, mask):
+    # legacy indirect_*_chk: one REPL read of the status byte per poll
+    def chk(slave, **kwargs):
+        for _ in range(100):
+            if int(phy.i2c.read(slave, 0xC, 0, 8), 16) & mask:
+                return True
+        return False
+
+    return chk
+
+
+def bench_ready(args):
+    # chip model completes every EHOST command ready_delay after it is written:
+    # no check (stale data), host-side status polls, on-device polls
+    plan = [(0x3300 + 4 * (i % 16), i & 0x3F) for i in range(args.ops)]
+    ready_us = int(args.ready_delay * 1e6)
+    rows = []
+    for path, agent, chk, deadline_us in (
+        ("REPL no check", 0, 0, 0),
+        ("REPL host poll", 0, 1, 0),
+        ("REPL on-device", 0, 1, 4 * ready_us),
+        ("agent no check", 1, 0, 0),
+        ("agent on-device", 1, 1, 4 * ready_us),
+        ("agent short deadline", 1, 1, ready_us // 4),
+    ):
+        board = SimulatedPyboard(latency=args.latency, ready_delay=args.ready_delay)
+        phy = make_phy(board, agent=agent)
+        phy.chk_setup(chk=chk, deadline_us=deadline_us)
+        if not deadline_us:
+            phy.indirect_write_chk = host_poll_chk(phy, 0x40)
+            phy.indirect_read_chk = host_poll_chk(phy, 0x80)
+        phy.die_sel(die=0)
+        execs = board.execs
+        stale = 0
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # APB failed lines
+            for address, value in plan:
+                phy.indirect_write(0x2, address, "13:8", value)
+                stale += int(phy.indirect_read(0x2, address, "13:8"), 16) != value
+        elapsed = time.perf_counter() - start
+        if chk and deadline_us != ready_us // 4:
+            check(f"ready {path} no stale reads", stale == 0)
+        stats = phy.i2c.wait_stats
+        waits = max(1, stats["waits"])
+        rows.append(
+            [
+                path,
+                2 * len(plan),
+                (board.execs - execs) / (2 * len(plan)),
+                stale,
+                stats["waits"],
+                f"{stats['polls'] / waits:.1f}",
+                f"{stats['us'] / waits:.0f}",
+                stats["us_max"],
+                stats["timeouts"],
+                f"{2 * len(plan) / elapsed:.1f}",
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "check",
+                "accesses",
+                "execs/access",
+                "stale reads",
+                "waits",
+                "polls/wait",
+                "us/wait",
+                "us max",
+                "timeouts",
+                "accesses/s",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_plan(args):
+    # Test Report register sequences, PLL_Checking style (one reg_user_set per
+    # die / group): plan compile cold / cached, run per field vs combined
+    sections = register_sequences()
+    calls = [
+        dict(die_arr=[die], group_arr=[group], reg_arr=reg_arr, mode="M1_mode")
+        for reg_arr in sections.values()
+        for die in (0, 1, 2)
+        for group in (1, 2)
+    ]
+    rows = []
+    for agent in (0, 1):
+        expect = None
+        for combine in (0, 1):
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            phy.reg_map()  # load untimed
+            bus = board.bus
+            if combine == 0:
+                for cache in ("cold", "cached"):
+                    start = time.perf_counter()
+                    for kwargs in calls:
+                        phy.reg_plan(**kwargs)
+                    elapsed = time.perf_counter() - start
+                    rows.append(
+                        [
+                            "pico_agent" if agent else "REPL",
+                            f"compile ({cache})",
+                            sum(len(phy.reg_plan(**kwargs).ops) for kwargs in calls),
+                            "",
+                            "",
+                            f"{1000 * elapsed / len(calls):.3f}",
+                            "",
+                        ]
+                    )
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            for kwargs in calls:
+                phy.reg_user_set(show=0, combine=combine, **kwargs)
+            elapsed = time.perf_counter() - start
+            expect = bus.apb if expect is None else expect
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    "run combined" if combine else "run per field",
+                    "",
+                    (bus.transactions - transactions) / len(calls),
+                    (board.execs - execs) / len(calls),
+                    f"{1000 * elapsed / len(calls):.1f}",
+                    check("plan same APB", bus.apb == expect),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "step",
+                "ops",
+                "I2C/seq",
+                "execs/seq",
+                "ms/seq",
+                "same APB",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_qualify(args):
+    # qualify_bus() on a simulated board that corrupts data above --f-max;
+    # results go to a copy of project.json, the repo file is left alone
+    board = SimulatedPyboard(latency=args.latency, f_max=args.f_max, seed=1)
+    pico = Pico("7-bit", pyb=board)
+    path = os.path.join(tempfile.mkdtemp(), "project.json")
+    shutil.copy(PROJECT_JSON, path)
+    start = time.perf_counter()
+    best = pico.qualify_bus(path=path)
+    elapsed = time.perf_counter() - start
+    with open(path) as f:
+        saved = json.load(f)[QUALIFY_KEY][pico.serial_id]
+    with open(path, newline="") as f, open(PROJECT_JSON, newline="") as g:
+        text, orig = f.read(), g.read()
+    kept = check(
+        "qualify project.json lines kept",
+        text.count(chr(10)) == orig.count(chr(10)) + 1,
+    )
+    rows = [
+        [f"{int(f) / 1e6:.1f}", e, "<-" if int(f) == best else ""]
+        for f, e in saved["errors"].items()
+    ]
+    print(tabulate(rows, headers=["MHz", "error rate", "chosen"]), flush=True)
+    print(
+        f"{elapsed:.3f} s, {board.bus.bit_errors} bit errors injected, "
+        f"reloaded freq {Pico('7-bit', pyb=board).qualified_freq(path)} Hz, "
+        f"other project.json lines kept: {kept}",
+        flush=True,
+    )
+
+
+def bench_regmap(args):
+    # field wrappers on 4 slices with read back: indirect_write / indirect_read
+    # slice by slice (old wrapper body) vs one batch (wrapper shim / reg_set)
+    fields = [
+        ("cfg_tp_sel", 0x3450, "6:4"),
+        ("cfg_err_th", 0x3628, "27:24"),
+        ("cfg_cck_ini_offset", 0x3628, "4:0"),
+        ("rg_pmaa_TX_OE_l", 0x3408, "31:0"),
+        ("RX_PCS_BIST_MODE", 0x7100, "0"),
+    ]
+    slices = [0, 1, 2, 3]
+    rows = []
+    for agent in (0, 1):
+        expect = None
+        for path in ("per slice", "wrapper", "reg_set"):
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            phy.reg_map()  # load untimed
+            bus = board.bus
+            runs = max(1, args.ops // len(fields))
+            reads = []
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            for i in range(runs):
+                for name, offset, bit in fields:
+                    value = (i * 0x9E3779B1) & bit_field(bit).extract(0xFFFFFFFF)
+                    if path == "reg_set":
+                        reads += phy.reg_set(name, 1, 1, value, slices=slices, r_bk=1)
+                    elif path == "wrapper":
+                        out = io.StringIO()  # the wrapper prints the read back
+                        with contextlib.redirect_stdout(out):
+                            getattr(phy, name)(
+                                1, 1, setv=hex(value), r_bk=1, slice=slices
+                            )
+                        reads += ast.literal_eval(out.getvalue().split(" = ")[-1])
+                    else:
+                        phy.die_sel(die=1)
+                        for n in slices:
+                            address = offset + n * phy.slice_offset
+                            phy.indirect_write(0x2, address, bit, value, slice_num=n)
+                            reads.append(
+                                phy.indirect_read(0x2, address, bit, slice_num=n)
+                            )
+            elapsed = time.perf_counter() - start
+            apb = dict(bus.apb)
+            expect = (reads, apb) if expect is None else expect
+            n = runs * len(fields)
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    path,
+                    (bus.transactions - transactions) / n,
+                    (board.execs - execs) / n,
+                    f"{n / elapsed:.1f}",
+                    check("regmap same", (reads, apb) == expect),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=["path", "API", "I2C/call", "execs/call", "calls/s", "same"],
+        ),
+        flush=True,
+    )
+
+
+def trace_workload(phy, sections):
+    # register accesses of every i2c_log line kind: resetn, reg_user_set
+    # (User_Define, slices, TPORT), slice wrappers, burst reads, broadcast
+    phy.resetn()
+    for reg_arr in sections.values():
+        phy.reg_user_set(die_arr=[1], group_arr=[1], reg_arr=reg_arr, show=0)
+    for die in (0, 1, 2):
+        phy.cfg_err_th(die, 1, setv="0x3", r_bk=1, echo=0)
+        phy.broadcast_write(phy.EHOST[die][2], 0x3628, "4:0", 0x11, [0, 1, 2, 3])
+        phy.indirect_read_burst(phy.EHOST[die][2], [0x3450, 0x3628], die=die)
+        phy.indirect_read(phy.EHOST[die][0], 0x10, "7:0", top=1)
+
+
+def bench_trace(args):
+    # same accesses logged as i2c_log.txt text and / or as a Reg_Trace binary
+    # trace; the decoded trace must equal the text log line for line
+    sections = register_sequences()
+    folder = tempfile.mkdtemp()
+    rows = []
+    for path in ("no log", "text", "trace", "text + trace"):
+        phy = make_phy(SimulatedPyboard(latency=0.0), agent=1)
+        phy.reg_map()  # load untimed
+        text = os.path.join(folder, f"{path}.txt")
+        trace = os.path.join(folder, f"{path}.bin")
+        phy.i2c_log = LogWriter(text)
+        phy.save_log = int("text" in path)
+        if "trace" in path:
+            phy.trace_setup(path=trace)
+        start = time.perf_counter()
+        trace_workload(phy, sections)
+        phy.i2c_log.flush()
+        if phy.trace is not None:
+            phy.trace.flush()
+        elapsed = time.perf_counter() - start
+        size = [os.path.getsize(f) if os.path.exists(f) else 0 for f in (text, trace)]
+        same = ""
+        start = time.perf_counter()
+        if path == "text + trace":
+            records = load(trace)
+            out = io.StringIO()
+            write_text(records, out)
+            same = out.getvalue() == open(text).read()
+            die1 = select(records, die=1, address=(0x3000, 0x3FFF))
+            same &= set(die1["die"]) == {1} and len(die1) > 0
+            csv_out = io.StringIO()
+            write_csv(records, csv_out)
+            same &= csv_out.getvalue().count("\n") == len(records) + 1
+        decode = time.perf_counter() - start
+        phy.trace_setup(path=None)
+        rows.append(
+            [
+                path,
+                f"{1000 * elapsed:.0f}",
+                size[0],
+                size[1],
+                f"{1000 * decode:.1f}" if same != "" else "",
+                check("trace same", same),
+            ]
+        )
+    shutil.rmtree(folder)
+    print(
+        tabulate(
+            rows,
+            headers=["log", "ms", "text bytes", "trace bytes", "decode ms", "same"],
+        ),
+        flush=True,
+    )
+
+
+def bench_replay(args):
+    # Test Report sequences recorded over REPL (text log + labelled trace), the
+    # first one run again at the end (a phase of its own), replayed on a fresh
+    # simulator: reads must match, per-phase speedup
+    sections = register_sequences()
+    folder = tempfile.mkdtemp()
+    text = os.path.join(folder, "i2c_log.txt")
+    trace = os.path.join(folder, "trace.bin")
+    phy = make_phy(SimulatedPyboard(latency=args.latency), agent=0)
+    phy.reg_map()  # load untimed
+    phy.i2c_log = LogWriter(text)
+    phy.save_log = 1
+    phy.trace_setup(path=trace)
+    phy.resetn()
+    for name, reg_arr in list(sections.items()) + list(sections.items())[:1]:
+        label = f"[Sequence] {name}"
+        phy.Save_i2cLog(log_name=label + "\n")
+        phy.trace_label(label)
+        phy.reg_user_set(die_arr=[0, 1], group_arr=[1], reg_arr=reg_arr, show=0)
+        phy.cfg_err_th(1, 1, setv="0x3", r_bk=1, echo=0)
+        phy.indirect_read(phy.EHOST[1][0], 0x10, "7:0", top=1)
+    phy.i2c_log.flush()
+    phy.trace_setup(path=None)
+
+    rows = []
+    for source, agent, timing in (
+        ("text", 0, False),
+        ("text", 1, False),
+        ("trace", 1, False),
+        ("trace", 1, True),
+    ):
+        steps = Reg_Replay.read(text if source == "text" else trace)
+        phy = make_phy(SimulatedPyboard(latency=args.latency), agent=agent)
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = Reg_Replay.replay(phy, steps, timing=timing)
+        mode = f"{source}, {'agent' if agent else 'REPL'}{', timing' if timing else ''}"
+        for name, count, reads, bad, seconds, recorded in result["phases"]:
+            check(f"replay {mode} {name} reads", not bad)
+            rows.append(
+                [
+                    mode,
+                    name,
+                    count,
+                    reads,
+                    bad,
+                    f"{1000 * seconds:.0f}",
+                    "" if recorded is None else f"{1000 * recorded:.0f}",
+                    f"{recorded / seconds:.2f}x" if recorded and seconds else "",
+                ]
+            )
+    shutil.rmtree(folder)
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "replay",
+                "phase",
+                "accesses",
+                "reads",
+                "mismatch",
+                "replay ms",
+                "recorded ms",
+                "speedup",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_shadow(args):
+    # bit-field writes behind both muxes; the final chip state must not change
+    rows = []
+    expect = None
+    for shadow in (0, 1):
+        board = SimulatedPyboard(latency=args.latency, i2c_latency=args.i2c_latency)
+        phy = make_phy(board, agent=0, shadow=shadow)
+        pico, bus = phy.i2c, board.bus
+        transactions = bus.transactions
+        start = time.perf_counter()
+        for i in range(args.ops):
+            mux = (0x20, 0x40, 0x80)[i % 3]
+            pico.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+            pico.write(0x50, 0x1, 1, 1, i & 1)
+            pico.write(0x50, 0x3, 4, 3, i & 7)
+            pico.write(0x50, 0x7, 0, 3, i & 7)
+            phy.indirect_enable(i % 3, 2)
+            if i % 50 == 49:
+                phy.pico_gpio_low(25, 1)  # any GPIO_Set drops the cache
+        elapsed = time.perf_counter() - start
+        state = (bus.devices, {k: bytes(v) for k, v in bus.regs.items()}, bus.apb)
+        expect = state if expect is None else expect
+        stats = pico.shadow_stats
+        rows.append(
+            [
+                "shadow" if shadow else "no cache",
+                4 * args.ops,
+                bus.transactions - transactions,
+                stats["hits"],
+                stats["misses"],
+                stats["reads_avoided"],
+                f"{elapsed:.3f}",
+                check("shadow same state", state == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "writes",
+                "I2C",
+                "hits",
+                "misses",
+                "reads avoided",
+                "time (s)",
+                "same state",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_supervise(args):
+    # real pyboard.Pyboard over a fault-injecting raw REPL serial; every fault
+    # must end in a reconnect + replay, or a PyboardError for a batch (not
+    # replayed), with the same final chip state
+    rows = []
+    expect = None
+    for rate in (0.0, args.fault_rate):
+        board = SimulatedPyboard(latency=args.latency)
+        faults = {}
+        rng = random.Random(1)
+        connect = lambda: repl_pyboard(board, faults, rng)
+        phy = make_phy(
+            connect(),
+            supervise=1,
+            supervise_args=dict(connect=connect, timeout=0.2, backoff=0, budget=1000),
+        )
+        pico = phy.i2c
+        faults.update(drop=rate / 3, timeout=rate / 3, garbage=rate / 3)
+        failed = 0
+        start = time.perf_counter()
+        for i in range(args.ops):
+            try:
+                phy.die_sel(die=i % 3)
+                phy.indirect_write(0x2, 0x3300 + 4 * (i % 16), "13:8", i & 0x3F)
+                phy.indirect_read(0x2, 0x3300 + 4 * (i % 16), "13:8")
+            except pyboard.PyboardError:
+                failed += 1
+        elapsed = time.perf_counter() - start
+        expect = board.bus.apb if expect is None else expect
+        stats = pico.pyb.stats
+        rows.append(
+            [
+                rate,
+                args.ops,
+                failed,
+                stats["serial"],
+                stats["timeout"],
+                stats["pyboard"],
+                stats["reconnects"],
+                stats["replays"],
+                stats["not_replayed"],
+                f"{elapsed:.2f}",
+                check("supervise same state", board.bus.apb == expect),
+            ]
+        )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "fault rate",
+                "calls",
+                "failed",
+                "serial",
+                "timeout",
+                "pyboard",
+                "reconnects",
+                "replays",
+                "not replayed",
+                "time (s)",
+                "same state",
+            ],
+        ),
+        flush=True,
+    )
+
+
+def bench_verify(args):
+    # Test Report register sequences with each verify_setup mode; one field of
+    # the first sequence is stuck on the simulator so every mode that reads it
+    # back reports it
+    sections = register_sequences()
+    calls = [
+        dict(die_arr=[die], group_arr=[group], reg_arr=reg_arr, mode="M1_mode")
+        for reg_arr in sections.values()
+        for die in (0, 1, 2)
+        for group in (1, 2)
+    ]
+    modes = [
+        ("none", {}),
+        ("sampled", {"every": 10}),
+        ("deferred", {}),
+        ("strict", {}),
+    ]
+    rows = []
+    for agent in (0, 1):
+        for mode, options in modes:
+            board = SimulatedPyboard(latency=args.latency)
+            phy = make_phy(board, agent=agent)
+            phy.reg_map()  # load untimed
+            op = next(
+                o
+                for o in phy.reg_plan(**calls[0]).ops
+                if not o.read and not o.top and phy.reg_kind(o.address) is None
+            )
+            mask = op.field.mask << (op.address % 4) * 8
+            value = ~(op.value << op.field.shift << (op.address % 4) * 8) & mask
+            board.bus.stuck[(op.die, op.slave, op.address & ~3)] = (mask, value)
+            phy.verify_setup(mode=mode, **options)
+            bus = board.bus
+            out = io.StringIO()  # mismatch tables
+            transactions, execs = bus.transactions, board.execs
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(out):
+                for kwargs in calls:
+                    phy.reg_user_set(show=0, **kwargs)
+            elapsed = time.perf_counter() - start
+            names = sorted({m[-1] for m in phy.verify_mismatch})
+            if mode == "strict":
+                check(f"verify {mode} stuck field", bool(names))
+            rows.append(
+                [
+                    "pico_agent" if agent else "REPL",
+                    mode,
+                    phy.verify_stats["checked"],
+                    phy.verify_stats["mismatches"],
+                    (bus.transactions - transactions) / len(calls),
+                    (board.execs - execs) / len(calls),
+                    f"{1000 * elapsed / len(calls):.1f}",
+                    ", ".join(names),
+                ]
+            )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "path",
+                "mode",
+                "checked",
+                "mismatch",
+                "I2C/seq",
+                "execs/seq",
+                "ms/seq",
+                "field",
+            ],
+        ),
+        flush=True,
+    )
+
+
+BENCHES = {
+    "agent": bench_agent,
+    "batch": bench_batch,
+    "binary": bench_binary,
+    "bits": bench_bits,
+    "broadcast": bench_broadcast,
+    "burst": bench_burst,
+    "cache": bench_cache,
+    "combine": bench_combine,
+    "console": bench_console,
+    "die": bench_die,
+    "gpio": bench_gpio,
+    "log": bench_log,
+    "logstore": bench_logstore,
+    "mux": bench_mux,
+    "plan": bench_plan,
+    "pipeline": bench_pipeline,
+    "qualify": bench_qualify,
+    "ready": bench_ready,
+    "regmap": bench_regmap,
+    "replay": bench_replay,
+    "shadow": bench_shadow,
+    "sim": bench_sim,
+    "supervise": bench_supervise,
+    "trace": bench_trace,
+    "verify": bench_verify,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("bench", choices=sorted(BENCHES))
+    parser.add_argument(
+        "--latency", type=float, default=0.002, help="per-exec latency (s)"
+    )
+    parser.add_argument("--ops", type=int, default=200, help="operations per run")
+    parser.add_argument(
+        "--accesses", type=int, default=100_000, help="log: register accesses"
+    )
+    parser.add_argument(
+        "--lines", type=int, default=20_000, help="console: print() lines"
+    )
+    parser.add_argument(
+        "--call-cost", type=float, default=5e-5, help="console: s per control call"
+    )
+    parser.add_argument(
+        "--log-gb", type=float, default=2.0, help="logstore: GiB of test logs"
+    )
+    parser.add_argument(
+        "--i2c-latency", type=float, default=0.0, help="simulator per-I2C latency (s)"
+    )
+    parser.add_argument(
+        "--nack-rate", type=float, default=0.0, help="simulator NACK probability"
+    )
+    parser.add_argument(
+        "--f-max", type=float, default=0.5e6, help="simulator fastest clean SCL (Hz)"
+    )
+    parser.add_argument(
+        "--fault-rate", type=float, default=0.01, help="supervise: faults per exec"
+    )
+    parser.add_argument(
+        "--service-time", type=float, default=0.002, help="pipeline: board s/command"
+    )
+    parser.add_argument(
+        "--host-time", type=float, default=0.002, help="pipeline: host s/op"
+    )
+    parser.add_argument(
+        "--ready-delay", type=float, default=5e-3, help="ready: EHOST command time (s)"
+    )
+    args = parser.parse_args()
+    BENCHES[args.bench](args)
+    if FAILED:
+        print(f"{args.bench} : check(s) failed : {', '.join(FAILED)}", flush=True)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
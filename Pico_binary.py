@@ -0,0 +1,195 @@
+import struct
+import sys
+import time
+
+import serial.tools.list_ports
+
+from Raspberry_Pico import Pico
+from TestTools.pico_agent import pico_binary as fw
+from TestTools.pico_python_library.mpremote import pyboard
+
+FIRMWARE_PATH = "TestTools/pico_agent/pico_binary.py"
+
+
+class PicoBinaryTransport(Pico):
+    """Drop-in for Raspberry_Pico.Pico that talks struct-packed frames.
+
+    The raw REPL is only used to upload and start TestTools/pico_agent/
+    pico_binary.py. After that every access is one request/reply frame on the
+    board's serial.Serial, with no REPL echo, repr or host-side eval.
+    """
+
+    batching = False
+
+    def __init__(self, i2c_address, **kwargs) -> None:  # 7-bit slave address
+        ser = kwargs.get("serial", None)  # pre-opened port running pico_binary
+        port = kwargs.get("port", None)  # COM port, auto-detect USB if None
+
+        self.state_setup(**kwargs)
+        if self.i2c_freq is None:
+            self.i2c_freq = 1000_000  # pico_binary.main() default
+        self.pyb = None
+        self.serial = ser
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+        if i2c_address != "7-bit":
+            print("Error : Please change i2c_address_bits to 7-bit !!!")
+            return
+
+        if self.serial is None:
+            self.boot(port)
+        if self.serial is None:
+            print("no device found", flush=True)
+            return
+        self.GP25_low()
+        self.default_high_pin10()
+        self.default_high_pin11()
+        self.default_high_pin12()
+        self.scan()
+
+    def boot(self, port=None) -> None:
+        if port is None:
+            for p in sorted(serial.tools.list_ports.comports()):
+                if str(p).find("USB") != -1:
+                    print(p, flush=True)
+                    port = p.device
+                    break
+        if port is None:
+            return
+        try:
+            self.pyb = pyboard.Pyboard(port)
+            self.pyb.enter_raw_repl()
+            self.serial_id = self.board_serial()
+            self.pyb.fs_put(FIRMWARE_PATH, "pico_binary.py")
+            self.pyb.exec_raw_no_follow(
+                f"import pico_binary\npico_binary.main(freq={self.i2c_freq})"
+            )
+        except pyboard.PyboardError:
+            print("failed to access", flush=True)
+            return
+        self.serial = self.pyb.serial
+        self.serial.timeout = 2
+
+    def transact(self, op, addr=0, mem=0, data=b"", n=None) -> bytes:
+        head = struct.pack(
+            fw.REQ, fw.REQ_MAGIC, op, addr, mem, len(data) if n is None else n
+        )
+        request = head + data + struct.pack("<H", fw.crc16(head + data))
+        self.serial.write(request)
+        self.tx_bytes += len(request)
+        rsp = self._read_exact(fw.RSP_LEN)
+        magic, status, length = struct.unpack(fw.RSP, rsp)
+        payload = self._read_exact(length)
+        (crc,) = struct.unpack("<H", self._read_exact(2))
+        self.rx_bytes += fw.RSP_LEN + length + 2
+        if magic != fw.RSP_MAGIC or crc != fw.crc16(rsp + payload):
+            raise pyboard.PyboardError("binary reply frame corrupted")
+        if status != fw.ST_OK:
+            raise pyboard.PyboardError(
+                f"binary request op={op} failed, status={status}"
+            )
+        return payload
+
+    def _read_exact(self, n) -> bytes:
+        data = self.serial.read(n)
+        if len(data) != n:
+            raise pyboard.PyboardError("timeout waiting for binary reply frame")
+        return data
+
+    def close(self) -> None:
+        if self.serial is None:
+            return
+        self.transact(fw.OP_EXIT)
+        if self.pyb:
+            self.pyb.follow(timeout=2)  # back to the raw REPL prompt
+            self.pyb.close()
+        else:
+            self.serial.close()
+
+    def shutdown(self) -> None:
+        if self.pyb:
+            self.close()
+            self.pyb.exit_raw_repl()
+        sys.exit(1)
+
+    def qualify_bus(self, **kwargs) -> int:
+        # pico_binary.main() fixes the clock when the firmware starts
+        raise Exception("Pico qualify_bus is not supported by PicoBinaryTransport ...")
+
+    def begin_batch(self) -> None:
+        raise Exception("Pico batch is not supported by PicoBinaryTransport ...")
+
+    def scan(self) -> list:
+        slave = list(map(hex, self.transact(fw.OP_SCAN)))
+        print(f"I2C address 7-bit , i2c slave address scan : {slave}", flush=True)
+        self.GP25_high()
+
+    def scan_all_mux_channels(self, mux_addr, channels) -> dict:
+        topology = {}
+        for c in channels:
+            self.write_bytes(mux_addr, c, c, 1)
+            topology[c] = list(self.transact(fw.OP_SCAN))
+        return topology
+
+    def default_high(self, pin=2) -> None:
+        self.transact(fw.OP_PIN, pin, 2)
+
+    def default_high_pin6(self, pin=6) -> None:
+        self.default_high(pin)
+
+    def default_high_pin10(self, pin=10) -> None:
+        self.default_high(pin)
+
+    def default_high_pin11(self, pin=11) -> None:
+        self.default_high(pin)
+
+    def default_high_pin12(self, pin=12) -> None:
+        self.default_high(pin)
+
+    def pull_low(self, pin=2) -> None:
+        self.GPIO_Set(pin, 0)
+
+    def GP25_led(self, pin=25) -> None:
+        self.GPIO_Set(pin, 0)
+        time.sleep(0.1)
+        self.GPIO_Set(pin, 1)
+
+    def GP25_low(self, pin=25) -> None:
+        self.GPIO_Set(pin, 0)
+
+    def GP25_high(self, pin=25) -> None:
+        self.GPIO_Set(pin, 1)
+
+    def GPIO_Set(self, pin, H_L) -> None:
+        self.shadow_invalidate()
+        self.transact(fw.OP_PIN, pin, H_L)  # 0:pull_low , 1:pull_high
+
+    def gpio_apply(self, mask_high, mask_low, pulse_us=None) -> None:
+        # no SIO access in pico_binary, one OP_PIN frame per pin
+        self.shadow_invalidate()
+        pins = [n for n in range(30) if (mask_high | mask_low) >> n & 1]
+        for n in pins:
+            self.transact(fw.OP_PIN, n, mask_high >> n & 1)
+        if pulse_us:
+            time.sleep(pulse_us / 1e6)
+            for n in pins:
+                self.transact(fw.OP_PIN, n, mask_low >> n & 1)
+
+    def write_bytes(self, slave, offset, val, bytes=4) -> None:
+        self.transact(fw.OP_WRITE, slave, offset, val.to_bytes(bytes, "little"))
+        self._shadow_put(slave, offset, val, bytes)
+
+    def read_bytes(self, slave, offset, bytes=4) -> int:
+        data = self.transact(fw.OP_READ, slave, offset, n=bytes)
+        result = int.from_bytes(data, "little")
+        self._shadow_put(slave, offset, result, bytes)
+        return result
+
+    def wait_ready(self, slave, offset, mask, ok, **kwargs):
+        # OP_WAIT: the firmware polls, one frame each way
+        deadline_us = min(kwargs.get("deadline_us", 2000), 0xFFFF)
+        poll_us = kwargs.get("poll_us", 8)
+
+        data = struct.pack(fw.WAIT, mask, ok, deadline_us, poll_us)
+        rsp = self.transact(fw.OP_WAIT, slave, offset, data)
+        return self._wait_done(struct.unpack(fw.WAIT_RSP, rsp))
@@ -0,0 +1,117 @@
+import time
+
+from Raspberry_Pico import BATCH_PREAMBLE, Pico, PicoResult
+from TestTools.pico_python_library.mpremote import pyboard
+
+
+class PicoFuture(PicoResult):
+    # read result of a PipelinedPico, get() waits for the board reply
+    def __init__(self, pico, convert=None) -> None:
+        super().__init__(convert)
+        self.pico = pico
+        self.error = None
+        self.t_issue = time.perf_counter()
+        self.t_done = None
+
+    def set(self, raw) -> None:
+        super().set(raw)
+        self.t_done = time.perf_counter()
+
+    def get(self):
+        if not self.done and self.error is None:
+            self.pico.flush()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class PipelineBoard:
+    # self.pyb of a PipelinedPico: blocking exec/eval/... drain the pipeline
+    def __init__(self, pico) -> None:
+        self.pico = pico
+
+    def __getattr__(self, name):
+        attr = getattr(self.pico.board, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.pico.flush()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class PipelinedPico(Pico):
+    """Pico that keeps one command in flight on the raw REPL.
+
+    write/write_bytes/apb_wr/gpio_apply send their command with
+    exec_raw_no_follow and return at once. The reply is collected with follow
+    right before the next command is sent, so the host prepares command N+1
+    while the board runs command N. Commands run strictly in call order, and
+    a command that raises on the board raises on the next call (or flush())
+    before anything later is sent.
+
+    read/read_bytes/apb_rd/wait_ready return their value like Pico does (the
+    call waits for its reply); read_async() returns a PicoFuture instead, for
+    callers that issue more commands before they need the value. There are
+    no batches: begin_batch() raises, and batching is False so UCIe_2p5D
+    never opens one.
+    """
+
+    batching = False
+
+    def __init__(self, i2c_address, **kwargs) -> None:
+        self.inflight = None  # (command, PicoFuture or None) sent, not followed
+        self.futures = False  # read_async(): _queue returns the PicoFuture
+        self.board = None  # the board, once __init__ has set it up
+        super().__init__(i2c_address, **kwargs)
+        if self.pyb is None:
+            return
+        self.board = self.pyb
+        self.board.exec(BATCH_PREAMBLE)
+        self.pyb = PipelineBoard(self)
+
+    def queueing(self) -> bool:
+        return self.board is not None  # every call after the board setup
+
+    def read_async(self, slave, offset, start_bit, field_size) -> PicoFuture:
+        # read() without waiting: PicoFuture.get() is the hex string
+        self.futures = True
+        try:
+            return self.read(slave, offset, start_bit, field_size)
+        finally:
+            self.futures = False
+
+    def begin_batch(self) -> None:
+        raise Exception("Pico batch is not supported by PipelinedPico ...")
+
+    def commit(self) -> list:
+        self.flush()
+        return []
+
+    def _queue(self, line, convert=None, read=False):
+        future = PicoFuture(self, convert) if read else None
+        self.flush()
+        command = f"print({line})" if read else line
+        self.board.exec_raw_no_follow(command)
+        self.inflight = (command, future)
+        if future is not None and not self.futures:
+            return future.get()  # the value, as Pico returns it
+        return future
+
+    def flush(self) -> None:
+        # wait for the command in flight and hand its reply to the future
+        if self.inflight is None:
+            return
+        command, future = self.inflight
+        self.inflight = None
+        ret, ret_err = self.board.follow(timeout=10)
+        if ret_err:
+            self.shadow_invalidate()  # the failed command may have been a mux write
+            error = pyboard.PyboardError("exception", ret, ret_err)
+            if future is not None:
+                future.error = error
+            raise error
+        if future is not None:
+            future.set(self.to_list(ret))
@@ -0,0 +1,628 @@
+import builtins
+import errno
+import io
+import os
+import random
+import threading
+import time
+import traceback
+import types
+
+from TestTools.pico_agent import pico_binary
+from TestTools.pico_python_library.mpremote import pyboard
+
+
+class FakeBus:
+    """Flat I2C memory: every 7-bit slave answers with a sparse byte array."""
+
+    def __init__(self, slaves=(0x01, 0x02, 0x03, 0x70, 0x71)):
+        self.slaves = set(slaves)
+        self.mem = {}  # (slave, mem addr) -> byte
+        self.transactions = 0
+
+    def scan(self):
+        return sorted(self.slaves)
+
+    def writeto_mem(self, addr, memaddr, buf):
+        self.transactions += 1
+        for i, b in enumerate(bytes(buf)):
+            self.mem[(addr, memaddr + i)] = b
+
+    def readfrom_mem(self, addr, memaddr, nbytes):
+        self.transactions += 1
+        return bytes(self.mem.get((addr, memaddr + i), 0) for i in range(nbytes))
+
+
+class FakePyboard:
+    """In-memory stand-in for pyboard.Pyboard.
+
+    Commands sent through exec/eval run in a CPython namespace that provides a
+    MicroPython-like ``machine`` module whose I2C object is ``bus``. Files put
+    with fs_put are kept in memory and are importable by the executed code.
+    ``latency`` (seconds) is added to every exec round trip.
+    """
+
+    def __init__(self, latency=0.0, bus=None, uid=b"\xe6\x60\x58\x38\x83\x4a\x2b\x21"):
+        self.latency = latency
+        self.uid = uid  # machine.unique_id(), the board serial
+        self.bus = bus if bus is not None else FakeBus()
+        self.files = {}
+        self.pins = {}
+        self.pin_log = []  # (time.perf_counter(), pin, level) on every change
+        self.mem32 = {}  # RP2040 register file behind machine.mem32
+        self.execs = 0
+        self.tx_bytes = 0  # command bytes sent + output bytes returned
+        self.rx_bytes = 0
+        self.in_raw_repl = False
+        self._soft_reset()
+
+    def _soft_reset(self):
+        self.modules = {"machine": self._machine(), "time": self._time()}
+        self._out = io.StringIO()
+        self._builtins = dict(builtins.__dict__)
+        self._builtins["print"] = self._print
+        self._builtins["__import__"] = self._import
+        self._builtins["open"] = self._open
+        self.namespace = {"__builtins__": self._builtins, "__name__": "__main__"}
+
+    def _drive(self, pin, level):
+        if self.pins.get(pin) != level:
+            self.pin_log.append((time.perf_counter(), pin, level))
+        self.pins[pin] = level
+
+    def _machine(self):
+        board = self
+
+        class Pin:
+            IN = 0
+            OUT = 1
+
+            def __init__(self, id, mode=-1, value=None):
+                self.id = id
+                if mode != -1:
+                    board._drive(id, 1 if mode == Pin.IN else board.pins.get(id, 0))
+                if value is not None:
+                    board._drive(id, value)
+
+            def value(self, v=None):
+                if v is None:
+                    return board.pins.get(self.id, 1)
+                board._drive(self.id, int(bool(v)))
+
+        class Mem32:
+            # SIO GPIO_OUT/OE and their SET/CLR/XOR aliases drive board.pins
+            OUT, OE = 0xD0000010, 0xD0000020
+
+            def __getitem__(self, addr):
+                return board.mem32.get(addr, 0)
+
+            def __setitem__(self, addr, value):
+                for reg in (self.OUT, self.OE):
+                    old = board.mem32.get(reg, 0)
+                    if addr == reg:
+                        board.mem32[reg] = value
+                    elif addr == reg + 4:
+                        board.mem32[reg] = old | value
+                    elif addr == reg + 8:
+                        board.mem32[reg] = old & ~value
+                    elif addr == reg + 12:
+                        board.mem32[reg] = old ^ value
+                    else:
+                        continue
+                    out, oe = board.mem32.get(self.OUT, 0), board.mem32.get(self.OE, 0)
+                    for n in range(30):
+                        if oe >> n & 1 and board.mem32.get(0x40014004 + 8 * n) == 5:
+                            board._drive(n, out >> n & 1)
+                    return
+                board.mem32[addr] = value
+
+        def I2C(id, sda=None, scl=None, freq=400_000):
+            board.i2c_freq = freq
+            board.bus.freq = freq
+            return board.bus
+
+        def freq(hz=None):
+            return 125_000_000
+
+        machine = types.ModuleType("machine")
+        machine.Pin = Pin
+        machine.I2C = I2C
+        machine.freq = freq
+        machine.mem32 = Mem32()
+        machine.unique_id = lambda: board.uid
+        return machine
+
+    def _time(self):
+        # MicroPython time: CPython time plus the *_us / *_ms / ticks helpers
+        utime = types.ModuleType("time")
+        utime.__dict__.update(time.__dict__)
+        utime.sleep_us = lambda us: time.sleep(us / 1e6)
+        utime.sleep_ms = lambda ms: time.sleep(ms / 1e3)
+        utime.ticks_us = lambda: int(time.perf_counter() * 1e6)
+        utime.ticks_ms = lambda: int(time.perf_counter() * 1e3)
+        utime.ticks_diff = lambda a, b: a - b
+        return utime
+
+    def _print(self, *args, **kwargs):
+        kwargs["file"] = self._out
+        builtins.print(*args, **kwargs)
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if name in self.modules:
+            return self.modules[name]
+        if name + ".py" in self.files:
+            module = types.ModuleType(name)
+            module.__dict__["__builtins__"] = self._builtins
+            self.modules[name] = module
+            exec(
+                compile(self.files[name + ".py"], name + ".py", "exec"), module.__dict__
+            )
+            return module
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    def _open(self, name, mode="r"):
+        # board flash: files written here (e.g. by Pyboard.fs_put) are importable
+        name = name.lstrip("/")
+        if "w" not in mode:
+            data = self.files[name]
+            return io.BytesIO(data) if "b" in mode else io.StringIO(data.decode())
+        f = io.BytesIO() if "b" in mode else io.StringIO()
+        close = f.close
+
+        def store():
+            data = f.getvalue()
+            self.files[name] = data if "b" in mode else data.encode()
+            self.modules.pop(name[:-3], None)
+            close()
+
+        f.close = store
+        return f
+
+    def enter_raw_repl(self, soft_reset=True):
+        if soft_reset:
+            self._soft_reset()
+        self.in_raw_repl = True
+
+    def exit_raw_repl(self):
+        self.in_raw_repl = False
+
+    def close(self):
+        self.in_raw_repl = False
+
+    def exec_raw_no_follow(self, command):
+        if isinstance(command, bytes):
+            command = command.decode()
+        self.execs += 1
+        self.tx_bytes += len(command) + 1  # + ctrl-D
+        if self.latency:
+            time.sleep(self.latency)
+        self._out = io.StringIO()
+        self._err = ""
+        try:
+            exec(compile(command, "<stdin>", "exec"), self.namespace)
+        except Exception:
+            self._err = traceback.format_exc()
+
+    def follow(self, timeout, data_consumer=None):
+        data = self._out.getvalue().replace("\n", "\r\n").encode()
+        self.rx_bytes += len(data) + len(self._err) + 4  # OK + 2x ctrl-D
+        if data_consumer:
+            data_consumer(data)
+        return data, self._err.encode()
+
+    def exec_raw(self, command, timeout=10, data_consumer=None):
+        self.exec_raw_no_follow(command)
+        return self.follow(timeout, data_consumer)
+
+    def exec_(self, command, data_consumer=None):
+        ret, ret_err = self.exec_raw(command, data_consumer=data_consumer)
+        if ret_err:
+            raise pyboard.PyboardError("exception", ret, ret_err)
+        return ret
+
+    exec = exec_
+    eval = pyboard.Pyboard.eval
+
+    def fs_put(self, src, dest, chunk_size=256, progress_callback=None):
+        with open(src, "rb") as f:
+            data = f.read()
+        self.execs += 1 + (len(data) + chunk_size - 1) // chunk_size
+        self.files[dest.lstrip("/")] = data
+        self.modules.pop(dest.lstrip("/")[:-3], None)
+
+
+class ReplSerial:
+    """serial.Serial stand-in that speaks the MicroPython raw REPL for a board.
+
+    A real pyboard.Pyboard runs on top of it (see repl_pyboard), so the
+    supervisor sees the same protocol and errors as on a USB port. Commands
+    go through raw-paste mode like on a current Pico. ``service_time``
+    (seconds) is how long the board takes per command: with it set, commands
+    run on a board thread and replies arrive late, so host and board overlap.
+    ``faults`` maps a fault to its probability per exec:
+      - "drop"    : the command runs, then the port disappears (SerialException
+                    until the next repl_pyboard) -- a USB hiccup
+      - "timeout" : the command runs, no reply comes back
+      - "garbage" : the command does not run, the board answers junk
+    """
+
+    BANNER = b"raw REPL; CTRL-B to exit\r\n>"
+    WINDOW = 128  # raw-paste flow control window
+
+    def __init__(self, board, faults=None, rng=None, service_time=0.0):
+        self.board = board
+        self.faults = faults if faults is not None else {}
+        self.random = rng if rng is not None else random.Random()
+        self.service_time = service_time
+        self.timeout = 1
+        self.out = bytearray()
+        self.cmd = bytearray()
+        self.raw = False
+        self.paste = False
+        self.pasted = 0
+        self.dead = False
+        self.lock = threading.Condition()
+        self.busy = threading.Lock()  # one command at a time on the board
+
+    def _check(self):
+        if self.dead:
+            import serial
+
+            raise serial.SerialException("device disconnected")
+
+    def _fault(self):
+        for fault, p in self.faults.items():
+            if self.random.random() < p:
+                return fault
+        return None
+
+    def _send(self, data):
+        with self.lock:
+            self.out += data
+            self.lock.notify_all()
+
+    def write(self, data):
+        self._check()
+        data = bytes(data)
+        if data == b"\x05A\x01":  # enter raw-paste
+            self.paste = True
+            self.pasted = 0
+            self.cmd.clear()
+            self._send(b"R\x01" + self.WINDOW.to_bytes(2, "little"))
+            return len(data)
+        for b in data:
+            if self.paste and b == 0x04:
+                self.paste = False
+                self._send(b"\x04")
+                self._run(bytes(self.cmd))
+                self.cmd.clear()
+            elif self.paste:
+                self.cmd.append(b)
+                self.pasted += 1
+                if self.pasted % self.WINDOW == 0:
+                    self._send(b"\x01")
+            elif b == 0x03:
+                self.cmd.clear()
+            elif b == 0x01:
+                self.raw = True
+                self.cmd.clear()
+                self._send(b"\r\n" + self.BANNER)
+            elif b == 0x02:
+                self.raw = False
+                self._send(b"\r\n>>> ")
+            elif b == 0x04 and not self.cmd:
+                with self.busy:
+                    self.board._soft_reset()
+                self._send(b"OK\r\nMPY: soft reboot\r\n" + self.BANNER)
+            elif b == 0x04:
+                self._send(b"OK")
+                self._run(bytes(self.cmd))
+                self.cmd.clear()
+            elif self.raw and not (b == 0x0D and not self.cmd):
+                self.cmd.append(b)
+        return len(data)
+
+    def _run(self, command):
+        fault = self._fault()
+        if fault == "garbage":
+            self._send(b"X")
+            return
+        if self.service_time:
+            threading.Thread(target=self._exec, args=(command, fault)).start()
+        else:
+            self._exec(command, fault)
+
+    def _exec(self, command, fault):
+        with self.busy:
+            if self.service_time:
+                time.sleep(self.service_time)
+            out, err = self.board.exec_raw(command)
+        if fault != "timeout":
+            self._send(out + b"\x04" + err + b"\x04>")
+        if fault == "drop":
+            self.dead = True
+
+    def read(self, n=1):
+        self._check()
+        with self.lock:
+            self.lock.wait_for(lambda: len(self.out) >= n or self.dead, self.timeout)
+            data = bytes(self.out[:n])
+            del self.out[:n]
+        return data
+
+    def inWaiting(self):
+        self._check()
+        return len(self.out)
+
+    def close(self):
+        self.dead = True
+
+
+def repl_pyboard(board, faults=None, rng=None, service_time=0.0):
+    # pyboard.Pyboard over a ReplSerial, the way Pyboard(port) opens a Pico
+    pyb = pyboard.Pyboard.__new__(pyboard.Pyboard)
+    pyb.in_raw_repl = False
+    pyb.use_raw_paste = True
+    pyb.serial = ReplSerial(board, faults, rng, service_time)
+    return pyb
+
+
+# APB words a healthy chip reports after PLL lock / training, keyed by the
+# in-slice offset (address % slice_offset); everything else resets to 0
+APB_RESET = {
+    0x2158: 0x20 << 4,  # vco code mid-range
+    0x332C: 0xFF,  # mbt_pass
+}
+
+
+class ChipBus:
+    """I2C model of the GUC test board as seen from the Pico.
+
+    - 0x70 die-select mux: control byte 0x01/0x02/0x04 selects Die0/1/2
+    - 0x71 U142 mux: control byte selects the power/thermal channels
+    - 0x01/0x02/0x03 EHOST slaves (TPORT/H/V) of every selected die
+    - sparse 32-bit APB space per (die, EHOST slave, address), where the
+      slice is address // slice_offset (0x10000)
+
+    ``latency`` (seconds) is added to every I2C transaction and a transaction
+    fails with OSError(EIO) (MicroPython's NACK) with probability ``nack_rate``.
+    Above ``f_max`` (Hz) the clock is too fast for the board: each transfer gets
+    a flipped data bit with probability (freq - f_max) / f_max. With
+    ``expect_die`` set, an EHOST access while 0x70 selects another Die fails
+    with OSError(ENODEV) and counts in ``wrong_die``. With ``ready_delay``
+    (seconds) an EHOST command completes that long after it is written: until
+    then the status reads busy, the read data register holds the old value and
+    the APB write is not applied (the next EHOST write finishes it at once).
+    ``stuck`` {(die, slave, word address): (mask, value)} holds APB bits a write
+    cannot change (a write that does not stick, for read back verification).
+    """
+
+    DIE_MUX = 0x70
+    U142_MUX = 0x71
+    EHOST = (0x01, 0x02, 0x03)
+    U142_DEVICES = (0x50, 0x60, 0x69)
+    DIE_SEL = {0x01: 0, 0x02: 1, 0x04: 2}
+    # EHOST layout: rwcl offset -> (apb_addr, addr bytes, apb_wdat, apb_rdat,
+    #                               wcmd, rcmd, status offset, write ok, read ok)
+    LAYOUT = {
+        0xC: (0x1, 3, 0x4, 0x8, 0x1, 0x2, 0xC, 0x40, 0x80),  # group EHOST
+        0xF: (0x3, 4, 0x7, 0xB, 0x1, 0x80, 0x10, 0x01, 0x01),  # top / TPORT
+    }
+
+    def __init__(
+        self,
+        latency=0.0,
+        nack_rate=0.0,
+        seed=None,
+        slice_offset=0x10000,
+        f_max=1.5e6,
+        ready_delay=0.0,
+    ):
+        self.latency = latency
+        self.ready_delay = ready_delay
+        self.pending = {}  # (die, slave) -> (ready time, finish) of a busy command
+        self.nack_rate = nack_rate
+        self.f_max = f_max
+        self.freq = 400_000  # set by machine.I2C(freq=...)
+        self.bit_errors = 0
+        self.random = random.Random(seed)
+        self.slice_offset = slice_offset
+        self.die_mux = 0x00
+        self.u142_mux = 0x00
+        self.regs = {}  # (die, slave) -> bytearray EHOST register file
+        self.apb = {}  # (die, slave, word address) -> 32-bit value
+        self.stuck = {}  # (die, slave, word address) -> (mask, value)
+        self.devices = {}  # (u142 channel, slave, mem) -> byte
+        self.transactions = 0
+        self.nacks = 0
+        self.apb_reads = 0
+        self.apb_writes = 0
+        self.mux_writes = 0
+        self.expect_die = None  # Die the caller means to address, None: any
+        self.wrong_die = 0
+        for ch in (0x20, 0x40, 0x80):
+            self.devices[(ch, 0x50, 0xC)] = 0x01  # MSD lock
+
+    def dies(self):
+        return [d for m, d in self.DIE_SEL.items() if self.die_mux & m]
+
+    def _transaction(self, addr):
+        self.transactions += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.nack_rate and self.random.random() < self.nack_rate:
+            self.nacks += 1
+            raise OSError(errno.EIO)
+        if addr in (self.DIE_MUX, self.U142_MUX):
+            return
+        if addr in self.EHOST and self.expect_die is not None:
+            if self.dies() != [self.expect_die]:
+                self.wrong_die += 1
+                raise OSError(errno.ENODEV)
+        if addr in self.EHOST and self.dies():
+            return
+        if addr in self.U142_DEVICES and self.u142_mux:
+            return
+        self.nacks += 1
+        raise OSError(errno.ENODEV)
+
+    def scan(self):
+        found = [self.DIE_MUX, self.U142_MUX]
+        found += list(self.EHOST) if self.dies() else []
+        found += list(self.U142_DEVICES) if self.u142_mux else []
+        return sorted(found)
+
+    def error_rate(self):
+        return min(1.0, max(0.0, (self.freq - self.f_max) / self.f_max))
+
+    def _corrupt(self, buf):
+        buf = bytes(buf)
+        if buf and self.random.random() < self.error_rate():
+            self.bit_errors += 1
+            bit = self.random.randrange(8 * len(buf))
+            buf = bytearray(buf)
+            buf[bit // 8] ^= 1 << bit % 8
+        return bytes(buf)
+
+    def apb_word(self, die, slave, address):
+        key = (die, slave, address & ~3)
+        if key not in self.apb:
+            return APB_RESET.get(address % self.slice_offset, 0)
+        return self.apb[key]
+
+    def writeto_mem(self, addr, memaddr, buf):
+        self._transaction(addr)
+        buf = self._corrupt(buf)
+        if addr == self.DIE_MUX:
+            self.mux_writes += 1
+            self.die_mux = memaddr  # the mux takes the first byte as control
+        elif addr == self.U142_MUX:
+            self.mux_writes += 1
+            self.u142_mux = memaddr
+        elif addr in self.EHOST:
+            for die in self.dies():
+                self._ehost_write(die, addr, memaddr, buf)
+        else:
+            for i, b in enumerate(buf):
+                self.devices[(self.u142_mux, addr, memaddr + i)] = b
+
+    def readfrom_mem(self, addr, memaddr, nbytes):
+        self._transaction(addr)
+        return self._corrupt(self._read(addr, memaddr, nbytes))
+
+    def _read(self, addr, memaddr, nbytes):
+        if addr == self.DIE_MUX:
+            return bytes([self.die_mux] * nbytes)
+        if addr == self.U142_MUX:
+            return bytes([self.u142_mux] * nbytes)
+        if addr in self.EHOST:
+            self._settle(self.dies()[0], addr)
+            regs = self._regs(self.dies()[0], addr)
+            return bytes(regs[memaddr : memaddr + nbytes])
+        return bytes(
+            self.devices.get((self.u142_mux, addr, memaddr + i), 0)
+            for i in range(nbytes)
+        )
+
+    def _regs(self, die, slave):
+        if (die, slave) not in self.regs:
+            self.regs[(die, slave)] = bytearray(0x20)
+        return self.regs[(die, slave)]
+
+    def _settle(self, die, slave, force=False):
+        # finish the pending command once its ready time has passed
+        ready, finish = self.pending.get((die, slave), (None, None))
+        if finish is not None and (force or time.perf_counter() >= ready):
+            del self.pending[(die, slave)]
+            finish()
+
+    def _ehost_write(self, die, slave, memaddr, buf):
+        self._settle(die, slave, force=True)
+        regs = self._regs(die, slave)
+        regs[memaddr : memaddr + len(buf)] = buf
+        for rwcl in self.LAYOUT:
+            if memaddr <= rwcl < memaddr + len(buf):
+                self._ehost_command(die, slave, regs, rwcl, regs[rwcl])
+
+    def _ehost_command(self, die, slave, regs, rwcl, cmd):
+        a, a_len, w, r, wcmd, rcmd, sts, w_ok, r_ok = self.LAYOUT[rwcl]
+        address = int.from_bytes(regs[a : a + a_len], "little")
+        data = int.from_bytes(regs[w : w + 4], "little")
+
+        def finish():
+            if cmd == wcmd:
+                self.apb_writes += 1
+                mask, value = self.stuck.get((die, slave, address & ~3), (0, 0))
+                self.apb[(die, slave, address & ~3)] = (data & ~mask) | value
+                regs[sts] = w_ok
+            else:
+                self.apb_reads += 1
+                word = self.apb_word(die, slave, address)
+                regs[r : r + 4] = word.to_bytes(4, "little")
+                regs[sts] = r_ok
+
+        if cmd not in (wcmd, rcmd):
+            return
+        if self.ready_delay:
+            regs[sts] &= ~(w_ok | r_ok) & 0xFF  # busy
+            self.pending[(die, slave)] = (
+                time.perf_counter() + self.ready_delay,
+                finish,
+            )
+        else:
+            finish()
+
+
+class SimulatedPyboard(FakePyboard):
+    """FakePyboard wired to a ChipBus, so Pico(sim=True) runs without a board.
+
+    ``latency`` is the per-exec REPL round trip, ``i2c_latency``,
+    ``nack_rate``, ``f_max`` and ``ready_delay`` are handed to the ChipBus.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        i2c_latency=0.0,
+        nack_rate=0.0,
+        seed=None,
+        f_max=1.5e6,
+        ready_delay=0.0,
+    ):
+        super().__init__(
+            latency=latency,
+            bus=ChipBus(
+                latency=i2c_latency,
+                nack_rate=nack_rate,
+                seed=seed,
+                f_max=f_max,
+                ready_delay=ready_delay,
+            ),
+        )
+
+
+def binary_loopback(bus=None, pins=None):
+    """Run the pico_binary firmware loop in CPython behind a pty pair.
+
+    Returns (serial.Serial, thread); the serial end can be handed to
+    Pico_binary.PicoBinaryTransport(serial=...). The loop ends on OP_EXIT.
+    """
+    import serial
+
+    bus = bus if bus is not None else FakeBus()
+    pins = pins if pins is not None else {}
+    master, slave = os.openpty()
+    ser = serial.Serial(os.ttyname(slave), timeout=2)
+    os.close(slave)
+    rx = os.fdopen(master, "rb", buffering=0)
+    tx = os.fdopen(os.dup(master), "wb", buffering=0)
+
+    def pin(n, v):
+        pins[n] = 1 if v > 1 else v
+
+    thread = threading.Thread(
+        target=pico_binary.serve, args=(bus, rx, tx, pin), daemon=True
+    )
+    thread.pty = (rx, tx)  # keep the master open after OP_EXIT so the reply is read
+    thread.start()
+    return ser, thread
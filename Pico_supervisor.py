@@ -0,0 +1,190 @@
+import contextlib
+import time
+
+import serial
+import serial.tools.list_ports
+
+from TestTools.pico_python_library.mpremote import pyboard
+
+PICO_VID_PID = (0x2E8A, 0x0005)  # Raspberry Pi Pico running MicroPython
+
+
+def find_port(vid_pid=PICO_VID_PID):
+    # Pico COM port by USB VID/PID, else the first USB port like Pico.__init__
+    ports = sorted(serial.tools.list_ports.comports())
+    for p in ports:
+        if (p.vid, p.pid) == tuple(vid_pid):
+            return p.device
+    for p in ports:
+        if str(p).find("USB") != -1:
+            return p.device
+    return None
+
+
+def classify(e):
+    # link failure class of an exception, None if the link itself is fine
+    if isinstance(e, serial.SerialTimeoutException):
+        return "timeout"
+    if isinstance(e, serial.SerialException):
+        return "serial"
+    if isinstance(e, pyboard.PyboardError):
+        if e.args and e.args[0] == "exception":
+            return None  # the command raised on the board, e.g. an I2C NACK
+        if "timeout" in str(e.args[0] if e.args else e):
+            return "timeout"
+        return "pyboard"
+    return None
+
+
+class PicoSupervisor:
+    """Retrying stand-in for the pyboard.Pyboard used by Raspberry_Pico.Pico.
+
+    exec/eval/exec_raw/fs_put run with a per-try ``timeout`` and a per-call
+    ``deadline``. On a timeout, PyboardError or serial failure the supervisor
+    reopens the port (``connect``, default: re-enumerate by VID/PID), enters
+    the raw REPL, calls ``restore`` to rebuild the I2C setup and replays the
+    call. A replay only repeats what may already have run on the board, so
+    it is safe for reads and absolute writes only. Calls made inside
+    ``once(reason)`` (Pico batches, gpio_apply pulses, apb_wr to "ordered"
+    W1C / reset / start words) reconnect the same way, then raise instead of
+    running again. exec_raw_no_follow/follow are never replayed.
+    ``retries`` bounds the reconnects per call, ``budget`` per session.
+    """
+
+    def __init__(self, pyb, **kwargs) -> None:
+        self.pyb = pyb
+        self.connect = kwargs.get("connect", None)
+        self.vid_pid = kwargs.get("vid_pid", PICO_VID_PID)
+        self.timeout = kwargs.get("timeout", 10)  # seconds per try
+        self.deadline = kwargs.get("deadline", 60)  # seconds per call, all tries
+        self.retries = kwargs.get("retries", 3)  # reconnects per call
+        self.budget = kwargs.get("budget", 20)  # reconnects per session
+        self.backoff = kwargs.get("backoff", 0.5)  # seconds, doubled per try
+        self.restore = None  # set by Pico, rebuilds the board state
+        self.restoring = False
+        self.reason = None  # once(): the call must not be replayed
+        self.stats = {
+            "timeout": 0,
+            "pyboard": 0,
+            "serial": 0,
+            "reconnects": 0,
+            "replays": 0,
+            "not_replayed": 0,
+        }
+
+    def __getattr__(self, name):
+        # counters and helpers of the wrapped board (execs, bus, pins, ...)
+        return getattr(self.__dict__["pyb"], name)
+
+    @contextlib.contextmanager
+    def once(self, reason):
+        # calls that must not run twice on the board, reason for the error
+        outer, self.reason = self.reason, reason
+        try:
+            yield
+        finally:
+            self.reason = outer
+
+    def _connect(self):
+        if self.connect is not None:
+            return self.connect()
+        port = find_port(self.vid_pid)
+        if port is None:
+            raise serial.SerialException("Pico port not found")
+        return pyboard.Pyboard(port)
+
+    def reconnect(self) -> None:
+        try:
+            self.pyb.close()
+        except Exception:
+            pass
+        self.pyb = self._connect()
+        self.pyb.enter_raw_repl()
+        self.stats["reconnects"] += 1
+        self.budget -= 1
+        if self.restore:
+            self.restoring = True
+            try:
+                self.restore()
+            finally:
+                self.restoring = False
+
+    def _call(self, name, *args, **kwargs):
+        if self.restoring:
+            return getattr(self.pyb, name)(*args, **kwargs)
+        end = time.monotonic() + self.deadline
+        tries = 0
+        while True:
+            try:
+                result = getattr(self.pyb, name)(*args, **kwargs)
+                self.stats["replays"] += tries > 0
+                return result
+            except Exception as e:
+                kind = classify(e)
+                if kind is None:
+                    raise
+                self.stats[kind] += 1
+                err = e
+            # reconnect until one works or the call runs out of time / tries
+            while True:
+                tries += 1
+                if tries > self.retries or self.budget <= 0:
+                    raise pyboard.PyboardError(
+                        f"Pico link lost ({kind}), out of retries : {err}"
+                    )
+                if time.monotonic() > end:
+                    raise pyboard.PyboardError(
+                        f"Pico link lost ({kind}), deadline passed : {err}"
+                    )
+                print(
+                    f"Pico link {kind} failure : {err} , reconnect {tries}/{self.retries}",
+                    flush=True,
+                )
+                time.sleep(
+                    max(0, min(self.backoff * 2 ** (tries - 1), end - time.monotonic()))
+                )
+                try:
+                    self.reconnect()
+                except Exception as e:
+                    kind = classify(e) or "pyboard"
+                    self.stats[kind] += 1
+                    err = e
+                    continue
+                if self.reason is None:
+                    break
+                self.stats["not_replayed"] += 1
+                raise pyboard.PyboardError(
+                    f"Pico link lost ({kind}) during {self.reason}, "
+                    f"reconnected, not replayed : {err}"
+                )
+
+    def exec_raw(self, command, timeout=None, data_consumer=None):
+        timeout = self.timeout if timeout is None else timeout
+        return self._call("exec_raw", command, timeout, data_consumer)
+
+    def exec_(self, command, data_consumer=None):
+        ret, ret_err = self.exec_raw(command, data_consumer=data_consumer)
+        if ret_err:
+            raise pyboard.PyboardError("exception", ret, ret_err)
+        return ret
+
+    exec = exec_
+    eval = pyboard.Pyboard.eval
+
+    def fs_put(self, src, dest, chunk_size=256, progress_callback=None):
+        return self._call("fs_put", src, dest, chunk_size, progress_callback)
+
+    def exec_raw_no_follow(self, command):
+        return self.pyb.exec_raw_no_follow(command)
+
+    def follow(self, timeout, data_consumer=None):
+        return self.pyb.follow(timeout, data_consumer)
+
+    def enter_raw_repl(self, soft_reset=True):
+        return self.pyb.enter_raw_repl(soft_reset)
+
+    def exit_raw_repl(self):
+        return self.pyb.exit_raw_repl()
+
+    def close(self):
+        return self.pyb.close()
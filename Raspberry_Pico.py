@@ -1,30 +1,203 @@
+import contextlib
+import functools
 import json
 import logging
+import os
+import re
 import sys
 import time
+from collections import namedtuple
+
+import numpy as np
 
 import serial.tools.list_ports
 
 from TestTools.pico_python_library.mpremote import pyboard
 
+AGENT_PATH = "TestTools/pico_agent/pico_agent.py"
+PROJECT_JSON = "TestTools/project.json"
+QUALIFY_KEY = "pico_i2c_qualify"  # project.json: board serial -> qualified freq
+QUALIFY_MAX = 1_000_000  # RP2040 I2C: Fast-mode Plus at most
+QUALIFY_LADDER = [100_000, 400_000, 1_000_000]  # Standard / Fast / Fast-mode Plus
+QUALIFY_PATTERNS = [0x00000000, 0xFFFFFFFF, 0x55555555, 0xAAAAAAAA, 0xA5C33C5A]
+# on-board probe for qualify_bus(): 1 per pattern that NACKs or reads back wrong
+QUALIFY_PROBE = (
+    "def _q(i2c,s,o,v):\n"
+    " try:\n"
+    "  i2c.writeto_mem(s,o,v.to_bytes(4,'little'))\n"
+    "  return int.from_bytes(i2c.readfrom_mem(s,o,4),'little')!=v\n"
+    " except OSError:\n"
+    "  return 1\n"
+)
+
+# helpers prepended to every Pico.commit() snippet
+BATCH_PREAMBLE = (
+    "_r=[]\n"
+    "_rd=lambda s,o,n:int.from_bytes(i2c.readfrom_mem(s,o,n),'little')\n"
+    "_wr=lambda s,o,v,n:i2c.writeto_mem(s,o,v.to_bytes(n,'little'))\n"
+    "_rmw=lambda s,o,m,w:_wr(s,o,(_rd(s,o,4)&m)|w,4)\n"
+    "_mv=lambda s,r,o,m,w:_wr(s,o,(_rd(s,r,4)&~m)|w,4)\n"
+)
+
+# completion poll for Pico.wait_ready(), defined once per board_setup():
+# [polls, us] once (slave[offset] & mask) == ok, polls < 0 after the deadline
+WAIT_HELPER = (
+    "import time\n"
+    "def _wt(s,o,m,k,d,p):\n"
+    " t=time.ticks_us()\n"
+    " n=0\n"
+    " while 1:\n"
+    "  n+=1\n"
+    "  if i2c.readfrom_mem(s,o,1)[0]&m==k:\n"
+    "   return [n,time.ticks_diff(time.ticks_us(),t)]\n"
+    "  u=time.ticks_diff(time.ticks_us(),t)\n"
+    "  if u>=d:\n"
+    "   return [-n,u]\n"
+    "  time.sleep_us(min(p,d-u))\n"
+    "  p=min(2*p,1024)\n"
+)
+
+# RP2040 registers used by Pico.gpio_apply
+IO_BANK0_CTRL = 0x40014004  # GPIOn_CTRL = IO_BANK0_CTRL + 8 * n, FUNCSEL 5 = SIO
+SIO_OUT_SET = 0xD0000014
+SIO_OUT_CLR = 0xD0000018
+SIO_OE_SET = 0xD0000024
+
+# i2c muxes in front of the slaves, the shadow cache is keyed per mux setting
+SHADOW_MUX = (0x70, 0x71, 0xE2)
+# bytes the chip changes on its own, never merged from the shadow cache:
+# EHOST read data / status of both layouts and the mux control bytes
+SHADOW_VOLATILE = set(SHADOW_MUX) | {
+    (slave, mem) for slave in (0x01, 0x02, 0x03) for mem in (*range(0x8, 0xF), 0x10)
+}
+
+
+class BitField(
+    namedtuple("BitField", ["msb", "lsb", "mask", "shift", "width", "spec"])
+):
+    # register bit field, build with bit_field("13:8") / bit_field((8, 6));
+    # spec: the caller's string, logged as is (Bit=0:0, Bit=4:7, ...)
+    __slots__ = ()
+
+    def __str__(self):
+        if self.spec is not None:
+            return self.spec
+        return str(self.lsb) if self.width == 1 else f"{self.msb}:{self.lsb}"
+
+    def extract(self, word) -> int:
+        return (word & self.mask) >> self.shift
+
+    def insert(self, word, val) -> int:
+        return (word & ~self.mask) | ((val << self.shift) & self.mask)
+
+
+@functools.lru_cache(maxsize=4096)
+def _bit_field(bit) -> BitField:
+    spec = None if isinstance(bit, tuple) else bit
+    if isinstance(bit, tuple):  # (start bit, field size)
+        lsb, width = bit
+    elif (bit.strip()).find(":") != -1:
+        buffer = bit.split(":")
+        lsb = int(buffer[1])
+        width = abs(int(buffer[0]) - int(buffer[1])) + 1
+    else:
+        lsb = int(bit)
+        width = 1
+    return BitField(lsb + width - 1, lsb, ((1 << width) - 1) << lsb, lsb, width, spec)
+
+
+def bit_field(bit) -> BitField:
+    # "hi:lo" / "n" string (same parse as indirect_write), (start, size) or a
+    # BitField; parsed once per distinct spelling
+    return bit if isinstance(bit, BitField) else _bit_field(bit)
+
+
+def extract(words, bit):
+    # field value of one word, or of every word of a list / numpy array
+    field = bit_field(bit)
+    if isinstance(words, int):
+        return field.extract(words)
+    return (np.asarray(words, dtype=np.uint64) & np.uint64(field.mask)) >> np.uint64(
+        field.shift
+    )
+
+
+def insert(words, bit, values):
+    # words with the field replaced by values (scalars or arrays, broadcast)
+    field = bit_field(bit)
+    if isinstance(words, int) and isinstance(values, int):
+        return field.insert(words, values)
+    words = np.asarray(words, dtype=np.uint64)
+    values = np.asarray(values, dtype=np.uint64)
+    mask = np.uint64(field.mask)
+    return (words & ~mask) | ((values << np.uint64(field.shift)) & mask)
+
+
+def project_json_update(key, value, path=PROJECT_JSON) -> None:
+    # set one top-level key of project.json as a single line, leaving the rest
+    # of the hand-edited file (tabs, CRLF, repeated "//" comments) untouched
+    with open(path, newline="") as f:
+        text = f.read()
+    nl = "\r\n" if "\r\n" in text else "\n"
+    line = f'\t"{key}": {json.dumps(value)},'
+    pattern = re.compile(rf'^\t"{key}": .*,\r?$', re.M)
+    if pattern.search(text):
+        text = pattern.sub(lambda m: line + ("\r" if nl == "\r\n" else ""), text, 1)
+    else:
+        text = text.replace("{", "{" + nl + line, 1)
+    with open(path, "w", newline="") as f:
+        f.write(text)
+
+
+class PicoResult:
+    # Deferred read result of a Pico batch, filled in by Pico.commit()
+    def __init__(self, convert=None) -> None:
+        self.convert = convert
+        self.done = False
+        self.value = None
+
+    def set(self, raw) -> None:
+        self.value = self.convert(raw) if self.convert else raw
+        self.done = True
+
+    def get(self):
+        if not self.done:
+            raise Exception("Pico batch result read before commit() ...")
+        return self.value
+
 
 class Pico:
+    batching = True  # begin_batch()/commit() available
+
     # def __init__(self, scl=19, sda=18, bit_sel=1) -> None:  # 7-bit slave address
-    def __init__(self, i2c_address) -> None:  # 7-bit slave address
-        self.offset_len = 8
+    def __init__(self, i2c_address, **kwargs) -> None:  # 7-bit slave address
+        pyb = kwargs.get("pyb", None)  # pre-opened board, e.g. Pico_sim.FakePyboard
+        agent = kwargs.get("agent", 1)  # upload pico_agent for 1-trip APB access
+        sim = kwargs.get("sim", os.environ.get("PICO_SIM", "0") == "1")
+        sim_args = kwargs.get("sim_args", {})  # SimulatedPyboard latency/NACK setup
+        freq = kwargs.get("freq", None)  # I2C clock, None: qualified or 1 MHz
+        supervise = kwargs.get("supervise", None)  # None: only auto-detected boards
+        supervise_args = kwargs.get("supervise_args", {})  # PicoSupervisor setup
+
+        self.state_setup(**kwargs)
         if i2c_address != "7-bit":
             print("Error : Please change i2c_address_bits to 7-bit !!!")
             return ()
 
         # self.bit_sel = bit_sel  #  0 :(msb, lsb)  ;  1 : (start_bit, field_size)
-        self.pyb = None
+        self.pyb = pyb
+        if sim and pyb is None:
+            print("Pico simulator (no board)", flush=True)
+            from Pico_sim import SimulatedPyboard  # only with sim=
+
+            self.pyb = pyb = SimulatedPyboard(**sim_args)
         scl = 19
         sda = 18
         # self.pyb = pyboardextended.PyboardExtended('/dev/ttyAMA0') # by GPIO interface
         # self.pyb = pyboardextended.PyboardExtended('/dev/ttyACM0') # by USB  interface
 
         # Auto-detect and auto-connect to the first available device.
-        for p in sorted(serial.tools.list_ports.comports()):
+        for p in sorted(serial.tools.list_ports.comports()) if pyb is None else []:
             if str(p).find("USB") != -1:
                 try:
                     print(p, flush=True)
@@ -45,8 +218,39 @@ class Pico:
         if self.pyb == None:
             print("no device found", flush=True)
             return
+        if supervise if supervise is not None else pyb is None:
+            from Pico_supervisor import PicoSupervisor  # only when supervised
+
+            self.pyb = PicoSupervisor(self.pyb, **supervise_args)
+            self.pyb.restore = self.restore
 
         self.pyb.enter_raw_repl()  # soft_reset=True
+        self.sda = sda
+        self.scl = scl
+        self.serial_id = self.board_serial()
+        if freq is None:
+            freq = self.qualified_freq()
+        self.i2c_freq = freq
+        self.board_setup()
+        if agent == 1:
+            self.agent_load()
+        self.scan()
+
+    def state_setup(self, **kwargs) -> None:
+        # host side state of every transport (Pico, PicoBinaryTransport), set
+        # before the board is opened
+        self.offset_len = 8
+        self.agent = False
+        self.batch = None  # list of (snippet line, PicoResult) while batching
+        self.commit_hooks = []  # on_commit() of the open batch
+        self.serial_id = "unknown"  # machine.unique_id() once the board is open
+        self.i2c_freq = kwargs.get("freq", None)  # None: qualified or 1 MHz
+        self.shadow_setup(**kwargs)
+        self.wait_stats = {"waits": 0, "polls": 0, "timeouts": 0, "us": 0, "us_max": 0}
+
+    def board_setup(self) -> None:
+        # pins and the REPL i2c object, after every raw REPL (soft) reset
+        sda, scl, freq = self.sda, self.scl, self.i2c_freq
         self.pyb.exec("from machine import Pin, I2C, freq")
         self.GP25_low()
         self.default_high_pin10()
@@ -58,13 +262,107 @@ class Pico:
             + "), scl=Pin("
             # +str(scl)+'), freq=1000_000)') # EY0008A okay
             + str(scl)
-            + "), freq=1000_000)"
+            + "), freq="
+            + str(freq)
+            + ")"
         )
-        self.scan()
+        self.pyb.exec(WAIT_HELPER)
+
+    def restore(self) -> None:
+        # PicoSupervisor reconnected: soft reset lost i2c / _ga, registers unknown
+        self.shadow_invalidate()
+        self.board_setup()
+        if self.agent and not self.agent_load():
+            self.agent = True  # the replayed command may be a _ga call, try again
+            raise pyboard.PyboardError("pico_agent reload failed")
+
+    def agent_load(self, path=AGENT_PATH) -> bool:
+        # upload pico_agent.py and bind it to the REPL i2c object as _ga
+        try:
+            self.pyb.fs_put(path, "pico_agent.py")
+            self.pyb.exec("import pico_agent as _ga\n_ga.bind(i2c)")
+            self.agent = True
+        except (OSError, pyboard.PyboardError) as e:
+            print(f"Pico agent load failed, use REPL access : {e}", flush=True)
+            self.agent = False
+        return self.agent
 
     def close(self) -> None:
         self.pyb.close()
 
+    def board_serial(self) -> str:
+        try:
+            return self.pyb.eval("__import__('machine').unique_id().hex()").decode()
+        except pyboard.PyboardError:
+            return "unknown"
+
+    def qualified_freq(self, path=PROJECT_JSON, default=1000_000) -> int:
+        # I2C clock stored by qualify_bus() for this board, else default
+        try:
+            with open(path) as f:
+                boards = json.load(f).get(QUALIFY_KEY, {})
+        except (OSError, ValueError):
+            return default
+        return boards.get(self.serial_id, {}).get("freq", default)
+
+    def set_freq(self, freq) -> None:
+        self.pyb.exec(
+            f"i2c = I2C(1, sda=Pin({self.sda}), scl=Pin({self.scl}), freq={freq})"
+            + ("\n_ga.bind(i2c)" if self.agent else "")
+        )
+        self.i2c_freq = freq
+
+    def qualify_bus(self, **kwargs) -> int:
+        # write/read back scratch patterns over a ladder of I2C clocks, keep the
+        # fastest clock that passes (and every slower one did), save per board
+        ladder = [f for f in kwargs.get("ladder", QUALIFY_LADDER) if f <= QUALIFY_MAX]
+        slave = kwargs.get("slave", 0x02)  # EHOST apb_wdat, no command side effect
+        offset = kwargs.get("offset", 0x04)
+        die = kwargs.get("die", 0x01)  # 0x70 control byte, None: leave the mux
+        rounds = kwargs.get("rounds", 20)
+        max_error = kwargs.get("max_error", 0.0)  # allowed error rate
+        path = kwargs.get("path", PROJECT_JSON)  # None: do not persist
+
+        if self.batch is not None:
+            raise Exception("Pico.qualify_bus inside a batch ...")
+        if die is not None:
+            self.write(0x70, die, 0, 8, die)
+        self.shadow_invalidate(slave)
+        self.pyb.exec(QUALIFY_PROBE + f"_qp={QUALIFY_PATTERNS}*{rounds}")
+        total = rounds * len(QUALIFY_PATTERNS)
+        errors = {}
+        best = None
+        for freq in sorted(ladder):
+            self.set_freq(freq)
+            fail = int(self.pyb.eval(f"sum(_q(i2c,{slave},{offset},v) for v in _qp)"))
+            errors[freq] = fail / total
+            print(
+                f"I2C qualify {freq / 1e6:.1f} MHz : error rate {errors[freq]:.3f}",
+                flush=True,
+            )
+            if errors[freq] > max_error:
+                break
+            best = freq
+        if best is None:
+            best = min(ladder)
+            print(f"I2C qualify failed, fall back to {best} Hz", flush=True)
+        self.set_freq(best)
+        print(f"I2C qualify {self.serial_id} : {best} Hz", flush=True)
+        if path is not None:
+            boards = {}
+            try:
+                with open(path) as f:
+                    boards = json.load(f).get(QUALIFY_KEY, {})
+            except (OSError, ValueError):
+                pass
+            boards[self.serial_id] = {
+                "freq": best,
+                "errors": {str(f): e for f, e in errors.items()},
+                "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            project_json_update(QUALIFY_KEY, boards, path)
+        return best
+
     def shutdown(self) -> None:
         if self.pyb:
             self.pyb.exit_raw_repl()
@@ -77,6 +375,23 @@ class Pico:
         print(f"I2C address 7-bit , i2c slave address scan : {slave}", flush=True)
         self.GP25_high()
 
+    def scan_all_mux_channels(self, mux_addr, channels) -> dict:
+        # select every mux channel and i2c.scan() it on the board, one exec
+        expr = (
+            f"[(i2c.writeto_mem({mux_addr},c,bytes([c])),[c,i2c.scan()])[1]"
+            f" for c in {list(channels)}]"
+        )
+        if self.queueing():
+            if channels:  # a failed commit() drops the shadow
+                self._shadow_put(mux_addr, channels[-1], channels[-1], 1)
+            return self._queue(expr, dict, read=True)
+        self.mux_state.pop(mux_addr, None)  # unknown until the eval goes through
+        topology = dict(self.to_list(self.pyb.eval(expr)))
+        if channels:  # the board ends on the last channel
+            self._shadow_put(mux_addr, channels[-1], channels[-1], 1)
+        self.GP25_high()
+        return topology
+
     def default_high(self, pin=2) -> None:
         logging.debug("  GPIO default_high")
         self.pyb.exec("Pin(" + str(pin) + ", Pin.IN)")
@@ -99,6 +414,7 @@ class Pico:
 
     def pull_low(self, pin=2) -> None:
         logging.debug("  GPIO pull_low")
+        self.shadow_invalidate()  # pin 2 is a chip reset
         self.pyb.exec("rst = Pin(" + str(pin) + ", Pin.OUT)")
         self.pyb.exec("rst.value(0)")
 
@@ -119,27 +435,182 @@ class Pico:
         self.pyb.exec("rst.value(1)")
 
     def GPIO_Set(self, pin, H_L) -> None:
+        self.shadow_invalidate()  # reset pins put every register back to default
         self.pyb.exec("rst = Pin(" + str(pin) + ", Pin.OUT)")
         self.pyb.exec(f"rst.value({H_L})")  # 0:pull_low , 1:pull_high
 
+    def gpio_apply(self, mask_high, mask_low, pulse_us=None) -> None:
+        # drive every pin of mask_high high and mask_low low in the same SIO
+        # write; with pulse_us the board holds them for pulse_us then inverts
+        self.shadow_invalidate()
+        if mask_high & mask_low:
+            raise Exception("GPIO in both mask_high and mask_low ...")
+        pins = [n for n in range(30) if (mask_high | mask_low) >> n & 1]
+        code = (
+            "from machine import mem32\n"
+            f"for _p in {pins}:\n"
+            f" mem32[{IO_BANK0_CTRL}+8*_p]=5\n"
+            f"mem32[{SIO_OUT_SET}]={mask_high}\n"
+            f"mem32[{SIO_OUT_CLR}]={mask_low}\n"
+            f"mem32[{SIO_OE_SET}]={mask_high | mask_low}"
+        )
+        if pulse_us:
+            code += (
+                f"\nimport time\ntime.sleep_us({pulse_us})\n"
+                f"mem32[{SIO_OUT_SET}]={mask_low}\n"
+                f"mem32[{SIO_OUT_CLR}]={mask_high}"
+            )
+        if self.queueing():
+            return self._queue(code)
+        with self.once("gpio_apply"):
+            self.pyb.exec(code)
+
+    @property
+    def supervised(self) -> bool:
+        return hasattr(type(self.pyb), "once")  # PicoSupervisor
+
+    def once(self, reason):
+        # execs that must not run twice: PicoSupervisor raises on a lost link
+        # instead of replaying them (batches, pulses, W1C / start words)
+        if not self.supervised:
+            return contextlib.nullcontext()
+        return self.pyb.once(reason)
+
     def to_list(self, string) -> list:
         return json.loads(string)
 
     def apply_bits(self, rd_data, start_bit, field_size, val, bit_size=32) -> int:
-        mask = 2**bit_size - 1 - (2**field_size - 1) * (2**start_bit)
-        val = min(val, 2 ** (field_size) - 1)
-        w = val * 2**start_bit
-        return (rd_data & mask) | w
+        field = _bit_field((start_bit, field_size))
+        val = min(val, (1 << field_size) - 1)
+        return field.insert(rd_data & ((1 << bit_size) - 1), val)
 
     def get_bits(self, rd_data, start_bit, field_size, bit_size=32) -> int:
-        mask = 0
-        for i in range(start_bit, start_bit + field_size):
-            mask += 1 << i
-
-        mask &= 2**bit_size - 1  # 0xffffffff
-        return (rd_data & mask) >> start_bit
+        field = _bit_field((start_bit, field_size))
+        return field.extract(rd_data & ((1 << bit_size) - 1))
+
+    def shadow_setup(self, **kwargs) -> None:
+        shadow = kwargs.get("shadow", 0)  # 1: merge bit-field writes from a cache
+        volatile = kwargs.get("volatile", SHADOW_VOLATILE)  # slave or (slave, mem)
+        mux_track = kwargs.get("mux_track", 1)  # 0: mux_select always writes
+
+        self.shadow = {} if shadow else None  # (mux state, slave, mem) -> byte
+        self.shadow_volatile = set(volatile)
+        self.shadow_stats = {"hits": 0, "misses": 0, "reads_avoided": 0}
+        self.mux_state = {}  # mux slave -> last control byte written
+        self.mux_track = mux_track
+        self.mux_stats = {"writes": 0, "suppressed": 0, "invalidations": 0}
+        self.shadow_epoch = 0  # +1 on every full invalidate (reset pins, reconnect)
+
+    def mux_select(self, mux, setv, force=False) -> bool:
+        # write a mux control byte unless the mux already holds it, True if written
+        if self.mux_track and not force and self.mux_state.get(mux) == setv:
+            self.mux_stats["suppressed"] += 1
+            return False
+        self.mux_state.pop(mux, None)  # unknown until the write goes through
+        self.write(mux, setv, 0, 8, setv)
+        self.mux_stats["writes"] += 1
+        return True
+
+    def mux_invalidate(self) -> None:
+        # chip reset / reconnect: forget the mux selection, next mux_select writes
+        if self.mux_state:
+            self.mux_stats["invalidations"] += 1
+        self.mux_state.clear()
+
+    def shadow_invalidate(self, slave=None, offset=None, bytes=4) -> None:
+        # drop shadow bytes: all, one slave (any mux state) or slave[offset:+bytes]
+        if slave is None:
+            self.mux_invalidate()
+            self.shadow_epoch += 1
+        if not self.shadow:
+            return
+        if slave is None:
+            self.shadow.clear()
+            return
+        for key in list(self.shadow):
+            if key[1] == slave and (
+                offset is None or offset <= key[2] < offset + bytes
+            ):
+                del self.shadow[key]
+
+    def _shadow_key(self, slave, mem):
+        return (tuple(sorted(self.mux_state.items())), slave, mem)
+
+    def _shadow_volatile(self, slave, offset, bytes):
+        if slave in self.shadow_volatile:
+            return True
+        return any((slave, offset + i) in self.shadow_volatile for i in range(bytes))
+
+    def _shadow_put(self, slave, offset, val, bytes=4) -> None:
+        if slave in SHADOW_MUX:
+            self.mux_state[slave] = offset  # the mux takes the first byte as control
+        if self.shadow is None or slave in self.shadow_volatile:
+            return
+        for i, b in enumerate(val.to_bytes(bytes, "little")):
+            if (slave, offset + i) not in self.shadow_volatile:
+                self.shadow[self._shadow_key(slave, offset + i)] = b
+
+    def _shadow_get(self, slave, offset, bytes=4):
+        # cached little-endian value of slave[offset:+bytes], None on a miss
+        if self.shadow is None or self._shadow_volatile(slave, offset, bytes):
+            return None
+        try:
+            data = [
+                self.shadow[self._shadow_key(slave, offset + i)] for i in range(bytes)
+            ]
+        except KeyError:
+            self.shadow_stats["misses"] += 1
+            return None
+        self.shadow_stats["hits"] += 1
+        self.shadow_stats["reads_avoided"] += 1
+        return int.from_bytes(bytearray(data), "little")
+
+    def queueing(self) -> bool:
+        # batch-aware calls go through _queue: a batch is open (or the
+        # transport queues every call, Pico_pipeline)
+        return self.batch is not None
+
+    def begin_batch(self) -> None:
+        # queue write/read/write_bytes/read_bytes/apb_* until commit()
+        if self.batch is not None:
+            raise Exception("Pico batch already open ...")
+        self.batch = []
+
+    def on_commit(self, hook) -> None:
+        # hook(timeouts) after commit() of the open batch: the number of its
+        # board-side waits (wait_ready, checked apb_*) that timed out
+        self.commit_hooks.append(hook)
+
+    def commit(self) -> list:
+        # run the queued operations as one exec, return the read results in order
+        ops, self.batch = self.batch, None
+        hooks, self.commit_hooks = self.commit_hooks, []
+        timeouts = self.wait_stats["timeouts"]
+        if not ops:
+            return []
+        code = BATCH_PREAMBLE + "\n".join(line for line, _ in ops) + "\nprint(_r)"
+        try:
+            with self.once("batch"):
+                raw = self.to_list(self.pyb.exec(code))
+        except Exception:
+            self.shadow_invalidate()  # stopped part way, mux and shadow unknown
+            raise
+        results = [result for _, result in ops if result is not None]
+        for result, value in zip(results, raw):
+            result.set(value)
+        for hook in hooks:
+            hook(self.wait_stats["timeouts"] - timeouts)
+        return [result.value for result in results]
+
+    def _queue(self, line, convert=None, read=False):
+        result = PicoResult(convert) if read else None
+        self.batch.append((f"_r.append({line})" if read else line, result))
+        return result
 
     def write_bytes(self, slave, offset, val, bytes=4) -> None:
+        if self.queueing():
+            self._shadow_put(slave, offset, val, bytes)
+            return self._queue(f"_wr({slave},{offset},{val},{bytes})")
         self.pyb.exec(
             "i2c.writeto_mem("
             + str(slave)
@@ -149,8 +620,11 @@ class Pico:
             + str(val.to_bytes(bytes, "little"))
             + ")"
         )
+        self._shadow_put(slave, offset, val, bytes)
 
     def read_bytes(self, slave, offset, bytes=4) -> int:
+        if self.queueing():
+            return self._queue(f"_rd({slave},{offset},{bytes})", read=True)
         result = int(
             self.pyb.eval(
                 "int.from_bytes(i2c.readfrom_mem("
@@ -162,14 +636,83 @@ class Pico:
                 + "),'little')"
             )
         )
+        self._shadow_put(slave, offset, result, bytes)
         return result
 
+    def write_merged(self, slave, src, dst, mask, val) -> None:
+        # slave[dst] = (slave[src] & ~mask) | val, 32 bit: an EHOST read data
+        # word merged into the write data register, on the board in a batch
+        if self.queueing():
+            self.shadow_invalidate(slave, dst)  # value only known on the board
+            return self._queue(f"_mv({slave},{src},{dst},{mask},{val})")
+        self.write_bytes(slave, dst, (self.read_bytes(slave, src) & ~mask) | val)
+
+    def apb_rd(self, slave, addr, top=0, chk=0) -> int:
+        # EHOST indirect APB read (addr/cmd/data phases) in one round trip;
+        # chk: wait up to chk us for the read-done status before the data phase
+        self.shadow_invalidate(slave)  # the agent rewrites the EHOST registers
+        line = f"_ga.apb_rd({slave},{addr},{top},{chk})"
+        if self.queueing():
+            return self._queue(line, self._wait_data if chk else None, read=True)
+        if chk:
+            return self._wait_data(self.to_list(self.pyb.eval(line)))
+        return int(self.pyb.eval(line))
+
+    def apb_wr(self, slave, addr, mask, data, top=0, chk=0):
+        # EHOST indirect APB write, read-modify-write of mask bits done on-device;
+        # chk: wait up to chk us for each command, returns True if all completed
+        self.shadow_invalidate(slave)
+        line = f"_ga.apb_wr({slave},{addr},{mask},{data},{top},{chk})"
+        if self.queueing():
+            return self._queue(line, self._wait_done, read=bool(chk))
+        if chk:
+            return self._wait_done(self.to_list(self.pyb.eval(line)))
+        self.pyb.exec(line)
+
+    def wait_ready(self, slave, offset, mask, ok, **kwargs):
+        # poll slave[offset] on the board until (byte & mask) == ok, in one round
+        # trip; the pause doubles from poll_us, True if ready before deadline_us
+        deadline_us = kwargs.get("deadline_us", 2000)
+        poll_us = kwargs.get("poll_us", 8)
+
+        line = f"_wt({slave},{offset},{mask},{ok},{deadline_us},{poll_us})"
+        if self.queueing():
+            return self._queue(line, self._wait_done, read=True)
+        return self._wait_done(self.to_list(self.pyb.eval(line)))
+
+    def _wait_done(self, raw) -> bool:
+        # [polls, us] of a board-side wait into wait_stats
+        polls, us = raw
+        self.wait_stats["waits"] += 1
+        self.wait_stats["polls"] += abs(polls)
+        self.wait_stats["timeouts"] += polls < 0
+        self.wait_stats["us"] += us
+        self.wait_stats["us_max"] = max(self.wait_stats["us_max"], us)
+        return polls > 0
+
+    def _wait_data(self, raw) -> int:
+        # [data, polls, us] of a checked apb_rd
+        self._wait_done(raw[1:])
+        return raw[0]
+
     def write(self, slave, offset, start_bit, field_size, val) -> None:
         # print(f'Pico Write' , flush=True)
         # self.GP25_high()
         if (start_bit + field_size > 32) or (field_size < 1):
             raise Exception("Wrong bit length or start bit ...")
-        if (start_bit == 0) and (field_size == 32):
+        rmw = start_bit != 0 or field_size not in (8, 16, 24, 32)
+        shadow = self._shadow_get(slave, offset) if rmw else None
+        if shadow is not None:  # merge from the shadow cache, no bus read
+            self.write_bytes(
+                slave, offset, self.apply_bits(shadow, start_bit, field_size, val)
+            )
+        elif self.queueing() and rmw:
+            # read-modify-write runs on the board inside the batch
+            mask = self.apply_bits(0xFFFFFFFF, start_bit, field_size, 0)
+            w = self.apply_bits(0, start_bit, field_size, val)
+            self._queue(f"_rmw({slave},{offset},{mask},{w})")
+            self.shadow_invalidate(slave, offset)  # value only known on the board
+        elif (start_bit == 0) and (field_size == 32):
             self.write_bytes(slave, offset, val)
         elif (start_bit == 0) and (field_size == 8):
             self.write_bytes(slave, offset, val, 1)
@@ -192,6 +735,16 @@ class Pico:
         # self.GP25_high()
         if (start_bit + field_size > 32) or (field_size < 1):
             raise Exception("Wrong bit length or start bit ...")
+        if self.queueing():
+            if (start_bit == 0) and (field_size in (8, 16, 24, 32)):
+                return self._queue(
+                    f"_rd({slave},{offset},{field_size // 8})", hex, read=True
+                )
+            return self._queue(
+                f"_rd({slave},{offset},4)",
+                lambda v: hex(self.get_bits(v, start_bit, field_size)),
+                read=True,
+            )
         if (start_bit == 0) and (field_size == 32):
             return hex(self.read_bytes(slave, offset))
         elif (start_bit == 0) and (field_size == 8):
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded register sequence through UCIe_2p5D (Glink_phy).
+
+Reads an i2c_log.txt text log or a Reg_Trace binary trace, runs every access
+again in order against the Pico (or Pico_sim) and compares each read with the
+recorded value. Phases are the log labels ([Sequence] ...). A binary trace has
+timestamps: --timing keeps the recorded gaps between accesses and the report
+gives the speedup of every phase over the recording.
+
+Usage:
+    python Reg_Replay.py TestTools/i2c_log.txt --sim        # chip simulator
+    python Reg_Replay.py trace.bin                          # Pico board
+    python Reg_Replay.py trace.bin --sim --timing --speed 2 # recorded gaps / 2
+    python Reg_Replay.py trace.bin --sim --agent 0 --latency 0.002
+"""
+
+import argparse
+import re
+import time
+from collections import namedtuple
+
+from tabulate import tabulate
+
+from Glink_phy import UCIe_2p5D
+from Raspberry_Pico import Pico
+from Reg_Trace import (
+    HEADER,
+    MAGIC,
+    OP_DIE,
+    OP_I2C_WRITE,
+    OP_KIND,
+    OP_LABEL,
+    OP_READ,
+    OP_RESET,
+    OP_TOP,
+    OP_USER,
+    OP_WRITE,
+    REG_SOURCE,
+    entries,
+    load,
+)
+
+# one recorded access; phase_n: occurrence of the phase label (a label seen
+# again starts a new phase), t_ns: None for a text log, line: log line / record
+# index
+Step = namedtuple(
+    "Step",
+    [
+        "op",
+        "die",
+        "slave",
+        "address",
+        "bit",
+        "value",
+        "slice_num",
+        "top",
+        "source",
+        "phase",
+        "phase_n",
+        "t_ns",
+        "line",
+    ],
+)
+
+HEX = "0x[0-9a-fA-F]+"
+WRITE_RE = re.compile(
+    rf"(< [\w ]+ >) Indirect_Write : Slave=({HEX}) , "
+    rf"(?:Offset=({HEX})|Slice(\d+)_Offset=({HEX})\(Offset={HEX}\)) , "
+    rf"Bit=([\d:]+) , \(W\) Value=(-?{HEX})"
+)
+READ_RE = re.compile(
+    rf"(< [\w ]+ >) indirect_read : slave=({HEX}) , "
+    rf"(?:offset=({HEX}) |slice(\d+)_offset=({HEX})\(offset={HEX}\)), "
+    rf"s_bit=([\d:]+) , \(R\) value=({HEX})"
+)
+I2C_RE = re.compile(
+    rf"(< [\w ]+ >) I2C write : slave=({HEX}) , offset=({HEX}) , "
+    rf"s_bit=(\d+), b_len=(\d+), \(W\) value=({HEX})"
+)
+DIE_RE = re.compile(r"\[Die_Select\] : Die(\d+)")
+TPORT_SLAVE = 0x01  # text logs have no top flag: EHOST[die][0] is TPORT
+
+
+def read_log(path) -> list:
+    # Steps of an i2c_log.txt text log; other "[...]" lines start a phase
+    steps = []
+    die, phase, phase_n = None, "start", 0
+    with open(path, "r", errors="replace") as f:
+        for n, text in enumerate(f, 1):
+            text = text.strip()
+            m = WRITE_RE.match(text) or READ_RE.match(text)
+            if m is not None:
+                source, slave, offset, slice_num, s_offset, bit, value = m.groups()
+                slave = int(slave, 16)
+                steps.append(
+                    Step(
+                        OP_WRITE if "Indirect_Write" in text else OP_READ,
+                        die,
+                        slave,
+                        int(offset or s_offset, 16),
+                        bit,
+                        int(value, 16),
+                        -1 if slice_num is None else int(slice_num),
+                        int(slave == TPORT_SLAVE),
+                        source,
+                        phase,
+                        phase_n,
+                        None,
+                        n,
+                    )
+                )
+            elif I2C_RE.match(text):
+                source, slave, offset, s_bit, b_len, value = I2C_RE.match(text).groups()
+                bit = f"{int(s_bit) + int(b_len) - 1}:{s_bit}"
+                steps.append(
+                    Step(
+                        OP_I2C_WRITE,
+                        die,
+                        int(slave, 16),
+                        int(offset, 16),
+                        bit,
+                        int(value, 16),
+                        -1,
+                        0,
+                        source,
+                        phase,
+                        phase_n,
+                        None,
+                        n,
+                    )
+                )
+            elif DIE_RE.match(text):
+                die = int(DIE_RE.match(text)[1])
+                steps.append(
+                    Step(OP_DIE, die, 0, 0, None, 0, -1, 0, "", phase, phase_n, None, n)
+                )
+            elif text == "< Register Information and sequence >":
+                steps.append(
+                    Step(
+                        OP_RESET, die, 0, 0, None, 0, -1, 0, "", phase, phase_n, None, n
+                    )
+                )
+            elif text.startswith("["):
+                phase, phase_n = text, phase_n + 1
+    return steps
+
+
+def read_trace(path) -> list:
+    # Steps of a Reg_Trace binary trace; OP_LABEL records start a phase
+    steps = []
+    phase, phase_n = "start", 0
+    for n, (rec, label) in enumerate(entries(load(path))):
+        op = int(rec["op"])
+        if op & OP_KIND == OP_LABEL:
+            phase, phase_n = label, phase_n + 1
+            continue
+        mask = int(rec["mask"])
+        lsb = (mask & -mask).bit_length() - 1 if mask else 0
+        msb = max(lsb, mask.bit_length() - 1)
+        steps.append(
+            Step(
+                op & OP_KIND,
+                None if int(rec["die"]) < 0 else int(rec["die"]),
+                int(rec["slave"]),
+                int(rec["address"]),
+                f"{msb}:{lsb}" if msb != lsb else str(lsb),
+                int(rec["value"]),
+                int(rec["slice"]),
+                int(bool(op & OP_TOP)),
+                REG_SOURCE[op & OP_USER],
+                phase,
+                phase_n,
+                int(rec["timestamp_ns"]),
+                n,
+            )
+        )
+    return steps
+
+
+def read(path) -> list:
+    # Steps of a binary trace (Reg_Trace header) or of a text log
+    with open(path, "rb") as f:
+        head = f.read(HEADER.size)
+    if head[: len(MAGIC)] == MAGIC:
+        return read_trace(path)
+    return read_log(path)
+
+
+def replay(phy, steps, **kwargs) -> dict:
+    # run steps in order on phy; returns {"phases": [...], "mismatch": [...]}
+    # timing: wait for the recorded gaps (divided by speed) of a binary trace;
+    # phase replay s counts the accesses only, not the waits
+    timing = kwargs.get("timing", False)
+    speed = kwargs.get("speed", 1.0)
+
+    # (phase_n, phase) -> [steps, reads, mismatches, replay s, first t_ns, last t_ns]
+    phases = {}
+    mismatch = []
+    t0 = next((s.t_ns for s in steps if s.t_ns is not None), None)
+    start = time.perf_counter()
+    for step in steps:
+        if timing and step.t_ns is not None:
+            wait = start + (step.t_ns - t0) / 1e9 / speed - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+        stat = phases.setdefault(
+            (step.phase_n, step.phase), [0, 0, 0, 0.0, step.t_ns, step.t_ns]
+        )
+        begin = time.perf_counter()
+        if step.op == OP_DIE:
+            phy.die_sel(die=step.die)
+        elif step.op == OP_I2C_WRITE:
+            field = phy.i2c.write  # (slave, offset, s_bit, b_len, value)
+            lsb = int(step.bit.split(":")[-1])
+            width = int(step.bit.split(":")[0]) - lsb + 1
+            field(step.slave, step.address, lsb, width, step.value)
+            if (step.address, lsb) == (0x2, 7):
+                field(step.slave, 0x1, 7, 1, 1)  # indirect_enable logs 1 of 2 writes
+        elif step.op == OP_WRITE:
+            phy.indirect_write(
+                step.slave,
+                step.address,
+                step.bit,
+                step.value,
+                slice_num=step.slice_num,
+                top=step.top,
+                reg_source=step.source,
+            )
+        elif step.op == OP_READ:
+            value = int(
+                phy.indirect_read(
+                    step.slave,
+                    step.address,
+                    step.bit,
+                    slice_num=step.slice_num,
+                    top=step.top,
+                    reg_source=step.source,
+                ),
+                16,
+            )
+            stat[1] += 1
+            if value != step.value:
+                stat[2] += 1
+                mismatch.append((step, value))
+        stat[0] += 1
+        stat[3] += time.perf_counter() - begin
+        if step.t_ns is not None:
+            stat[5] = step.t_ns
+    elapsed = time.perf_counter() - start
+
+    # recorded phase time: first access of the phase to the first of the next;
+    # a label seen again is a phase of its own, "label #2", ...
+    rows = []
+    keys = list(phases)
+    seen = {}
+    for i, key in enumerate(keys):
+        count, reads, bad, seconds, first, last = phases[key]
+        recorded = None
+        if first is not None:
+            end = phases[keys[i + 1]][4] if i + 1 < len(keys) else last
+            recorded = ((end or last) - first) / 1e9
+        seen[key[1]] = seen.get(key[1], 0) + 1
+        name = key[1] if seen[key[1]] == 1 else f"{key[1]} #{seen[key[1]]}"
+        rows.append((name, count, reads, bad, seconds, recorded))
+    return {"phases": rows, "mismatch": mismatch, "elapsed": elapsed}
+
+
+def report(result, **kwargs) -> None:
+    show_mismatch = kwargs.get("mismatch", 20)  # mismatching reads to print
+
+    table = []
+    for name, count, reads, bad, seconds, recorded in result["phases"]:
+        table.append(
+            [
+                name,
+                count,
+                reads,
+                bad,
+                f"{1000 * seconds:.1f}",
+                "" if recorded is None else f"{1000 * recorded:.1f}",
+                f"{recorded / seconds:.2f}x" if recorded and seconds else "",
+            ]
+        )
+    print(
+        tabulate(
+            table,
+            headers=[
+                "Phase",
+                "Accesses",
+                "Reads",
+                "Mismatch",
+                "Replay ms",
+                "Recorded ms",
+                "Speedup",
+            ],
+        ),
+        flush=True,
+    )
+    for step, value in result["mismatch"][:show_mismatch]:
+        print(
+            f"Read mismatch line {step.line} : Die{step.die} slave={hex(step.slave)} "
+            f"offset={hex(step.address)} [{step.bit}] recorded=0x{step.value:x} "
+            f"replay=0x{value:x}",
+            flush=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("log", help="i2c_log.txt or Reg_Trace binary trace")
+    parser.add_argument("--sim", action="store_true", help="Pico_sim chip simulator")
+    parser.add_argument("--agent", type=int, default=1, help="pico_agent APB access")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="simulator per-exec latency (s)"
+    )
+    parser.add_argument(
+        "--timing", action="store_true", help="keep the recorded gaps (trace only)"
+    )
+    parser.add_argument("--speed", type=float, default=1.0, help="timing: gap divisor")
+    args = parser.parse_args()
+
+    steps = read(args.log)
+    pico = Pico(
+        "7-bit", agent=args.agent, sim=args.sim, sim_args={"latency": args.latency}
+    )
+    phy = UCIe_2p5D(None, pico, None)
+    phy.save_log = 0  # the log being replayed may be TestTools/i2c_log.txt
+    report(replay(phy, steps, timing=args.timing, speed=args.speed))
+
+
+if __name__ == "__main__":
+    main()
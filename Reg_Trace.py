@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Binary register-transaction trace of UCIe_2p5D (Glink_phy).
+
+One fixed-size record per register access: timestamp_ns, op, die, slave,
+slice, address, mask and value (RECORD, 24 bytes), after an 8-byte file header.
+phy.trace_setup(path) records every access that has an i2c_log.txt line; this
+decoder turns a trace back into those lines or into CSV.
+
+Usage:
+    python Reg_Trace.py trace.bin                       # i2c_log.txt text
+    python Reg_Trace.py trace.bin --csv -o trace.csv    # CSV
+    python Reg_Trace.py trace.bin --die 1 --address 0x3000:0x3fff
+    python Reg_Trace.py trace.bin --since 1.5 --until 3  # s after the first record
+"""
+
+import argparse
+import atexit
+import csv
+import os
+import struct
+import sys
+import time
+
+import numpy as np
+
+from Raspberry_Pico import bit_field
+
+MAGIC = b"GUCTRC"
+VERSION = 1
+# timestamp_ns op die slave slice address mask value
+RECORD = struct.Struct("<QBbBbIII")
+DTYPE = np.dtype(
+    [
+        ("timestamp_ns", "<u8"),
+        ("op", "u1"),
+        ("die", "i1"),
+        ("slave", "u1"),
+        ("slice", "i1"),
+        ("address", "<u4"),
+        ("mask", "<u4"),
+        ("value", "<u4"),
+    ]
+)
+HEADER = struct.Struct("<6sBB")  # magic, version, record size
+
+# op low bits (OP_KIND); OP_USER marks a "< User_Define >" access
+# (reg_user_set), OP_TOP a TPORT (top=1) access
+OP_WRITE = 1  # indirect_write, mask: field bits of address
+OP_READ = 2  # indirect_read, value: field value
+OP_DIE = 3  # [Die_Select], die
+OP_I2C_WRITE = 4  # plain I2C write (indirect_enable), address: I2C offset
+OP_RESET = 5  # resetn: new register sequence
+OP_LABEL = 6  # log label line ([Sequence] ...), value: UTF-8 bytes
+OP_TEXT = 7  # 12 label bytes in address / mask / value, after OP_LABEL
+OP_KIND = 0x3F
+OP_TOP = 0x40
+OP_USER = 0x80
+OP_NAMES = {OP_WRITE: "W", OP_READ: "R", OP_DIE: "DIE", OP_I2C_WRITE: "I2C_W"}
+OP_NAMES.update({OP_RESET: "RESET", OP_LABEL: "LABEL"})
+REG_SOURCE = {0: "< Code >", OP_USER: "< User_Define >"}
+SLICE_OFFSET = 0x10000
+
+
+class TraceWriter:
+    """Appends trace records to a file in chunks.
+
+    record() packs into an in-memory chunk; the chunk goes to the file once it
+    holds chunk_bytes, on flush() and at exit. The file is created with its
+    header, or appended to if it already is a trace.
+    """
+
+    def __init__(self, path, chunk_bytes=1 << 16) -> None:
+        self.path = path
+        self.chunk_bytes = chunk_bytes
+        self.chunk = bytearray()
+        self.records = 0
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "ab")
+        if new:
+            self.file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+        atexit.register(self.close)
+
+    def record(self, op, die, slave, slice_num, address, mask, value) -> None:
+        self.chunk += RECORD.pack(
+            time.time_ns(),
+            op,
+            -1 if die is None else die,
+            slave,
+            slice_num,
+            address & 0xFFFFFFFF,
+            mask & 0xFFFFFFFF,
+            value & 0xFFFFFFFF,
+        )
+        self.records += 1
+        if len(self.chunk) >= self.chunk_bytes:
+            self.flush()
+
+    def label(self, text, die=None) -> None:
+        # OP_LABEL, then the text in OP_TEXT records
+        data = text.encode()
+        self.record(OP_LABEL, die, 0, -1, 0, 0, len(data))
+        for i in range(0, len(data), 12):
+            part = data[i : i + 12].ljust(12, b"\0")
+            address, mask, value = struct.unpack("<III", part)
+            self.record(OP_TEXT, die, 0, -1, address, mask, value)
+
+    def flush(self) -> None:
+        if self.file.closed:
+            return
+        self.file.write(self.chunk)
+        self.file.flush()
+        self.chunk = bytearray()
+
+    def close(self) -> None:
+        self.flush()
+        self.file.close()
+
+
+def load(path) -> np.ndarray:
+    # records of a trace file as a structured array (memory mapped)
+    with open(path, "rb") as f:
+        magic, version, size = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or size != RECORD.size:
+        raise Exception(f"{path} is not a register trace (v{VERSION})")
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if count == 0:
+        return np.zeros(0, dtype=DTYPE)
+    return np.memmap(path, dtype=DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+
+def select(records, **kwargs) -> np.ndarray:
+    # die: Die number, address: (low, high) slice 0 offsets, inclusive
+    # since / until: seconds after the first record
+    die = kwargs.get("die", None)
+    address = kwargs.get("address", None)
+    since = kwargs.get("since", None)
+    until = kwargs.get("until", None)
+
+    keep = np.ones(len(records), dtype=bool)
+    if die is not None:
+        keep &= records["die"] == die
+    if address is not None:
+        offset = records["address"].astype(np.int64)
+        offset -= np.maximum(records["slice"], 0).astype(np.int64) * SLICE_OFFSET
+        keep &= (offset >= address[0]) & (offset <= address[1])
+        keep &= (records["op"] & OP_KIND) <= OP_READ  # register accesses only
+    if len(records) and (since is not None or until is not None):
+        t = (records["timestamp_ns"] - records["timestamp_ns"][0]) / 1e9
+        if since is not None:
+            keep &= t >= since
+        if until is not None:
+            keep &= t <= until
+    return records[keep]
+
+
+def entries(records):
+    # (record, label text or None) of every record but OP_TEXT
+    n = 0
+    while n < len(records):
+        rec = records[n]
+        n += 1
+        op = int(rec["op"]) & OP_KIND
+        if op == OP_TEXT:
+            continue  # label text without its OP_LABEL (filtered out)
+        if op != OP_LABEL:
+            yield rec, None
+            continue
+        size = int(rec["value"])
+        parts = records[n : n + (size + 11) // 12]
+        n += len(parts)
+        data = b"".join(
+            struct.pack("<III", int(p["address"]), int(p["mask"]), int(p["value"]))
+            for p in parts
+        )
+        yield rec, data[:size].decode(errors="replace")
+
+
+def text_line(rec, label=None) -> str:
+    # i2c_log.txt line of one record (as written by UCIe_2p5D)
+    op = int(rec["op"]) & OP_KIND
+    source = REG_SOURCE[int(rec["op"]) & OP_USER]
+    slave, slice_num = int(rec["slave"]), int(rec["slice"])
+    address, value, mask = int(rec["address"]), int(rec["value"]), int(rec["mask"])
+    lsb = (mask & -mask).bit_length() - 1 if mask else 0
+    field = bit_field((lsb, max(1, mask.bit_length() - lsb)))
+    offset = address - SLICE_OFFSET * slice_num
+    if op == OP_DIE:
+        return f"[Die_Select] : Die{int(rec['die'])}"
+    if op == OP_LABEL:
+        return label
+    if op == OP_RESET:
+        return "\n\n\n< Register Information and sequence >"
+    if op == OP_I2C_WRITE:
+        return f"{source} I2C write : slave={hex(slave)} , offset=0x{address:02x} , s_bit={field.lsb}, b_len={field.width}, (W) value=0x{value:02x}"
+    if op == OP_WRITE and slice_num == -1:
+        return f"{source} Indirect_Write : Slave={hex(slave)} , Offset={hex(address)} , Bit={field} , (W) Value={hex(value)}"
+    if op == OP_WRITE:
+        return f"{source} Indirect_Write : Slave={hex(slave)} , Slice{slice_num}_Offset={hex(address)}(Offset={hex(offset)}) , Bit={field} , (W) Value={hex(value)}"
+    digits = int((field.width - 1) / 4) + 1
+    if slice_num == -1:
+        return f"{source} indirect_read : slave={hex(slave)} , offset={hex(address)} , s_bit={field} , (R) value=0x{value:0{digits}x}"
+    return f"{source} indirect_read : slave={hex(slave)} , slice{slice_num}_offset={hex(address)}(offset={hex(offset)}), s_bit={field} , (R) value=0x{value:0{digits}x}"
+
+
+def write_text(records, out) -> None:
+    for rec, label in entries(records):
+        out.write(text_line(rec, label) + "\n")
+
+
+def write_csv(records, out) -> None:
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(
+        ["timestamp_ns", "op", "source", "top", "die", "slave", "slice", "address"]
+        + ["mask", "value"]
+    )
+    for rec, label in entries(records):
+        op = int(rec["op"])
+        writer.writerow(
+            [
+                int(rec["timestamp_ns"]),
+                OP_NAMES.get(op & OP_KIND, op),
+                "user" if op & OP_USER else "code",
+                1 if op & OP_TOP else 0,
+                int(rec["die"]),
+                hex(int(rec["slave"])),
+                int(rec["slice"]),
+                hex(int(rec["address"])),
+                f"0x{int(rec['mask']):08x}",
+                label if label is not None else hex(int(rec["value"])),
+            ]
+        )
+
+
+def _range(text):
+    low, _, high = text.partition(":")
+    return int(low, 16), int(high or low, 16)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("trace", help="trace file (phy.trace_setup)")
+    parser.add_argument("--csv", action="store_true", help="CSV instead of text")
+    parser.add_argument("-o", "--output", help="output file, default stdout")
+    parser.add_argument("--die", type=int, help="only this Die")
+    parser.add_argument(
+        "--address", type=_range, help="slice 0 offset range, hex low:high"
+    )
+    parser.add_argument("--since", type=float, help="s after the first record")
+    parser.add_argument("--until", type=float, help="s after the first record")
+    args = parser.parse_args()
+
+    records = select(
+        load(args.trace),
+        die=args.die,
+        address=args.address,
+        since=args.since,
+        until=args.until,
+    )
+    out = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        (write_csv if args.csv else write_text)(records, out)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+import os
+import re
+from collections import namedtuple
+
+import pandas as pd
+
+from Raspberry_Pico import bit_field
+
+REG_MAP_DIR = "Test_Report/Register_Map/Slice_Map"
+SOURCE_BASE = {"UCIe": 0x0, "PLL": 0x2000, "Slice": 0x3000, "PCS": 0x7000}
+SOURCE_BASE["Adapter"] = 0x7000  # Adapter offsets start at 0x800
+
+
+class Field(
+    namedtuple("Field", ["name", "address", "bit", "access", "reset", "source"])
+):
+    # register map field; address: slice 0 byte offset, bit: BitField of that word
+
+    @property
+    def word(self) -> int:
+        return self.address - (self.address % 4)
+
+    @property
+    def ordered(self) -> bool:
+        # write in program order: W1C/W1S, resets, triggers
+        return self.access in ("RW1C", "RW1S") or bool(
+            re.search("rst|start", self.name, re.IGNORECASE)
+        )
+
+
+class Register:
+    # one 32-bit APB word of the map and its fields
+    def __init__(self, address, name=None) -> None:
+        self.address = address
+        self.name = name  # e.g. PLL_CTRL_015C, None for AutoTest_Use rows
+        self.fields = []
+
+    def __repr__(self) -> str:
+        return f"Register({hex(self.address)}, {self.name}, {len(self.fields)} fields)"
+
+    def field_names(self, mask=0xFFFFFFFF) -> list:
+        # fields with a bit in mask
+        return [f.name for f in self.fields if f.bit.mask & mask]
+
+    @property
+    def kind(self):
+        # "ordered": writes stay in program order, "status": RO fields (a read
+        # sees every earlier write), None: plain RW
+        if any(f.ordered for f in self.fields):
+            return "ordered"
+        if any(f.access == "RO" for f in self.fields):
+            return "status"
+        return None
+
+
+class RegisterMap:
+    """Register / Field model of the Slice_Map datasheet.
+
+    load() reads the AutoTest_Use sheet (UCIe / Slice / PCS / Adapter fields)
+    and the PLL sheet; addresses are slice 0 byte offsets (source base added),
+    a slice adds n * 0x10000. Reserved "-" bits are left out. An empty map
+    (workbook missing) is False, callers then treat every word as ordered.
+    """
+
+    def __init__(self, map_dir=None) -> None:
+        self.registers = {}  # word offset -> Register
+        self.fields = {}  # lower case name -> [Field, ...]
+        if map_dir is not None:
+            self.load(map_dir)
+
+    def __len__(self) -> int:
+        return len(self.registers)
+
+    def __contains__(self, name) -> bool:
+        return str(name).lower() in self.fields
+
+    def load(self, map_dir) -> bool:
+        try:
+            name = sorted(f for f in os.listdir(map_dir) if f.endswith(".xlsx"))[0]
+            xls = pd.ExcelFile(f"{map_dir}/{name}")
+            df = xls.parse("AutoTest_Use", dtype=str)  # every sheet but PLL
+            rows = list(
+                zip(
+                    df["ADDR"].ffill(),
+                    [None] * len(df),
+                    df["Bit"],
+                    df["Register Name"],
+                    df["REG Type"],
+                    df["PWR On"],
+                    df["From Source"],
+                )
+            )
+            df = xls.parse("PLL", header=None, dtype=str)
+            rows += zip(
+                df[0].ffill(),
+                df[1].ffill(),
+                df[2],
+                df[3],
+                df[4],
+                df[5],
+                ["PLL"] * len(df),
+            )
+        except (OSError, IndexError, KeyError, ValueError) as e:
+            print(f"Register map not loaded : {e}", flush=True)
+            return False
+        for offset, reg_name, bit, name, rw, reset, source in rows:
+            if str(name) in ("-", "nan"):
+                continue  # reserved
+            field = Field(
+                str(name),
+                SOURCE_BASE[source] + int(offset, 16),
+                bit_field(str(bit).strip("[] ")),
+                rw,
+                self._reset(reset),
+                source,
+            )
+            self.add(field, None if str(reg_name) == "nan" else reg_name)
+        return True
+
+    def add(self, field, reg_name=None) -> Register:
+        # add a field (e.g. one missing from the datasheet), returns its Register
+        word = field.word
+        register = self.registers.get(word)
+        if register is None:
+            register = self.registers[word] = Register(word, reg_name)
+        register.fields.append(field)
+        self.fields.setdefault(field.name.lower(), []).append(field)
+        return register
+
+    def field(self, name, source=None) -> Field:
+        # field by name (case insensitive); source: UCIe / PLL / Slice / PCS /
+        # Adapter when a name is in more than one block
+        found = [
+            f
+            for f in self.fields.get(str(name).lower(), [])
+            if source is None or f.source == source
+        ]
+        if not found:
+            raise Exception(f"{name} not in the register map")
+        if len(found) > 1:
+            sources = "/".join(f.source for f in found)
+            raise Exception(f"{name} is in {sources}, select one with source=")
+        return found[0]
+
+    def register(self, address):
+        # Register of a byte offset (any slice), None if not in the map
+        word = address % 0x10000
+        return self.registers.get(word - (word % 4))
+
+    def kind(self, address):
+        register = self.register(address)
+        return None if register is None else register.kind
+
+    def describe(self, address, mask=0xFFFFFFFF) -> str:
+        # register / field names of the mask bits of a word, e.g.
+        # "PLL_CTRL_015C.cfg_sel_div_target", hex offset if not in the map
+        register = self.register(address)
+        names = [] if register is None else register.field_names(mask)
+        if not names:
+            return hex(address % 0x10000)
+        prefix = f"{register.name}." if register.name else ""
+        return "/".join(prefix + name for name in names)
+
+    @staticmethod
+    def _reset(text):
+        # Verilog literal of the "PWR On" column (4'd15, 32'h0, 2'b01), None if blank
+        m = re.match(r"\s*\d*'([dhbo])([0-9a-fA-F_]+)", str(text))
+        if m is None:
+            return None
+        return int(m[2].replace("_", ""), {"d": 10, "h": 16, "b": 2, "o": 8}[m[1]])
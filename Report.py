@@ -13,6 +13,8 @@ from docx.oxml.ns import qn
 from docx.shared import Cm, Inches, Pt, RGBColor
 from openpyxl.styles import Alignment, Border, Font, Side
 
+from Log_Store import log_open
+
 
 class Graph:
     def __init__(self, gui):
@@ -450,7 +452,7 @@ class Graph:
         pattern_last = ""
         vco_fail = 0
         err_chk_fail = 0
-        with open(txt_path, "r") as f:
+        with log_open(txt_path) as f:
             Chip_Info_list = f.readlines()
             index = 0
             for log in Chip_Info_list:
@@ -791,7 +793,7 @@ class Graph:
         die_n = "-"
         cntv = []
         die_list = []
-        with open(txt_path, "r") as f:
+        with log_open(txt_path) as f:
             Chip_Info_list = f.readlines()
             index = 0
             for log in Chip_Info_list:
@@ -1067,7 +1069,7 @@ class Graph:
             txt_path = txt_folder + txt_path
         else:
             pass
-        with open(txt_path, "r") as f:
+        with log_open(txt_path) as f:
             table = f.read()
         if len(table.split("Current train results")) > 1:
             table = table.split("Current train results")[1]
@@ -1091,7 +1093,7 @@ class Graph:
             txt_path = txt_folder + txt_path
         else:
             pass
-        with open(txt_path, "r") as f:
+        with log_open(txt_path) as f:
             table = f.read()
         table_C = table.split("Supply Current Measure")
         current_list = []
@@ -1248,7 +1250,7 @@ class Graph:
             txt_path = txt_folder + txt_path
         else:
             pass
-        with open(txt_path, "r") as f:
+        with log_open(txt_path) as f:
             table = f.read()
         if len(table.split("eye results:")) > 1:
             offset_list = []
@@ -0,0 +1,84 @@
+# MicroPython register-access agent, uploaded by Raspberry_Pico.Pico.agent_load()
+# Runs on the Pico so that one EHOST indirect APB access costs one REPL round trip.
+
+import time
+
+_i2c = None
+
+# top : (apb_addr, apb_wdat, apb_rdat, apb_rwcl, apb_wcmv, apb_rcmv)
+_EHOST = (
+    (0x1, 0x4, 0x8, 0xC, 0x1, 0x2),  # EZ0005A group EHOST
+    (0x3, 0x7, 0xB, 0xF, 0x1, 0x80),  # TPORT / top EHOST
+)
+
+# top : ((status, mask, ok) after a write command, (...) after a read command)
+_DONE = (
+    ((0xC, 0x40, 0x40), (0xC, 0x80, 0x80)),  # bit6 write ok, bit7 read ok
+    ((0x10, 0x03, 0x01), (0x10, 0x03, 0x01)),  # [0] ready [1] error
+)
+
+
+def bind(i2c):
+    global _i2c
+    _i2c = i2c
+
+
+def rd(slave, mem, n=4):
+    return int.from_bytes(_i2c.readfrom_mem(slave, mem, n), "little")
+
+
+def wr(slave, mem, val, n=4):
+    _i2c.writeto_mem(slave, mem, val.to_bytes(n, "little"))
+
+
+def wait(slave, mem, mask, ok, deadline_us=2000, poll_us=8):
+    # poll slave[mem] until (byte & mask) == ok, the pause doubles up to 1 ms;
+    # returns [polls, us], polls < 0 if the deadline passed first
+    t = time.ticks_us()
+    n = 0
+    while True:
+        n += 1
+        if _i2c.readfrom_mem(slave, mem, 1)[0] & mask == ok:
+            return [n, time.ticks_diff(time.ticks_us(), t)]
+        us = time.ticks_diff(time.ticks_us(), t)
+        if us >= deadline_us:
+            return [-n, us]
+        time.sleep_us(min(poll_us, deadline_us - us))
+        poll_us = min(2 * poll_us, 1024)
+
+
+def _done(slave, top, read, chk, last=None):
+    # completion wait after a command, added to the wait before it (last)
+    s, m, k = _DONE[top][read]
+    n, us = wait(slave, s, m, k, chk)
+    if last is not None:
+        n = abs(n) + abs(last[0]) if n > 0 and last[0] > 0 else -abs(n) - abs(last[0])
+        us += last[1]
+    return [n, us]
+
+
+def apb_rd(slave, addr, top=0, chk=0):
+    # chk: completion deadline in us, then returns [data, polls, us]
+    a, w, r, c, wc, rc = _EHOST[top]
+    _i2c.writeto_mem(slave, 0x0, b"\x80")
+    _i2c.writeto_mem(slave, a, addr.to_bytes(4, "little"))
+    _i2c.writeto_mem(slave, c, bytes((rc,)))
+    done = _done(slave, top, 1, chk) if chk else None
+    data = int.from_bytes(_i2c.readfrom_mem(slave, r, 4), "little")
+    return [data] + done if chk else data
+
+
+def apb_wr(slave, addr, mask, data, top=0, chk=0):
+    # chk: completion deadline in us, then returns [polls, us]
+    a, w, r, c, wc, rc = _EHOST[top]
+    done = None
+    _i2c.writeto_mem(slave, a, addr.to_bytes(4, "little"))
+    if mask != 0xFFFFFFFF:
+        _i2c.writeto_mem(slave, c, bytes((rc,)))
+        if chk:
+            done = _done(slave, top, 1, chk)
+        old = int.from_bytes(_i2c.readfrom_mem(slave, r, 4), "little")
+        data = (old & ~mask & 0xFFFFFFFF) | (data & mask)
+    _i2c.writeto_mem(slave, w, data.to_bytes(4, "little"))
+    _i2c.writeto_mem(slave, c, bytes((wc,)))
+    return _done(slave, top, 0, chk, done) if chk else data
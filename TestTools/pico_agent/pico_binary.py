@@ -0,0 +1,142 @@
+# MicroPython binary I2C bridge, uploaded by Pico_binary.PicoBinaryTransport
+# Replaces raw-REPL text exec/eval with struct-packed frames on stdin/stdout.
+#   request : <BBBHH magic, op, addr, mem, len> + data[len] + <H crc16>
+#   reply   : <BBH   magic, status, len>        + data[len] + <H crc16>
+# For OP_READ the request len is the byte count to read and carries no data.
+# Plain CPython can import this file too (loopback harness in Pico_sim).
+
+import struct
+
+try:
+    from time import sleep_us, ticks_diff, ticks_us
+except ImportError:  # CPython
+    import time
+
+    sleep_us = lambda us: time.sleep(us / 1e6)
+    ticks_diff = lambda a, b: a - b
+    ticks_us = lambda: int(time.perf_counter() * 1e6)
+
+REQ = "<BBBHH"
+REQ_LEN = 7
+RSP = "<BBH"
+RSP_LEN = 4
+REQ_MAGIC = 0xA5
+RSP_MAGIC = 0x5A
+
+OP_PING = 0x00
+OP_WRITE = 0x01
+OP_READ = 0x02
+OP_SCAN = 0x03
+OP_PIN = 0x04  # addr=pin, mem=0/1 drive low/high, 2 release to input
+OP_WAIT = 0x05  # poll addr[mem] until ready, data <BBHH mask, ok, deadline_us, poll_us>
+OP_EXIT = 0x7F
+
+WAIT = "<BBHH"  # OP_WAIT request data
+WAIT_RSP = "<hH"  # OP_WAIT reply: polls (< 0 on timeout), us
+
+ST_OK = 0
+ST_CRC = 1
+ST_NACK = 2
+ST_OP = 3
+
+
+def crc16(data, crc=0xFFFF):
+    # CRC-16/CCITT-FALSE
+    for b in data:
+        crc ^= b << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else (crc << 1)
+            crc &= 0xFFFF
+    return crc
+
+
+def read_exact(rx, n):
+    buf = b""
+    while len(buf) < n:
+        chunk = rx.read(n - len(buf))
+        if chunk:
+            buf += chunk
+    return buf
+
+
+def frame(status, data=b""):
+    head = struct.pack(RSP, RSP_MAGIC, status, len(data))
+    return head + data + struct.pack("<H", crc16(head + data))
+
+
+def wait(i2c, addr, mem, mask, ok, deadline_us, poll_us):
+    # poll addr[mem] until (byte & mask) == ok, the pause doubles up to 1 ms
+    t = ticks_us()
+    n = 0
+    while True:
+        n += 1
+        if i2c.readfrom_mem(addr, mem, 1)[0] & mask == ok:
+            return n, ticks_diff(ticks_us(), t)
+        us = ticks_diff(ticks_us(), t)
+        if us >= deadline_us:
+            return -n, us
+        sleep_us(min(poll_us, deadline_us - us))
+        poll_us = min(2 * poll_us, 1024)
+
+
+def handle(i2c, pin, op, addr, mem, n, data):
+    if op == OP_WRITE:
+        i2c.writeto_mem(addr, mem, data)
+        return b""
+    if op == OP_READ:
+        return bytes(i2c.readfrom_mem(addr, mem, n))
+    if op == OP_SCAN:
+        return bytes(i2c.scan())
+    if op == OP_PIN:
+        pin(addr, mem)
+        return b""
+    if op == OP_WAIT:
+        polls, us = wait(i2c, addr, mem, *struct.unpack(WAIT, data))
+        return struct.pack(WAIT_RSP, max(-0x8000, min(polls, 0x7FFF)), min(us, 0xFFFF))
+    return data  # OP_PING echo
+
+
+def serve(i2c, rx, tx, pin=None):
+    while True:
+        magic = read_exact(rx, 1)
+        if magic[0] != REQ_MAGIC:
+            continue  # resync on the next request magic
+        head = magic + read_exact(rx, REQ_LEN - 1)
+        _, op, addr, mem, n = struct.unpack(REQ, head)
+        data = b"" if op == OP_READ else read_exact(rx, n)
+        crc = struct.unpack("<H", read_exact(rx, 2))[0]
+        if crc != crc16(head + data):
+            tx.write(frame(ST_CRC))
+        elif op == OP_EXIT:
+            tx.write(frame(ST_OK))
+            return
+        elif op not in (OP_PING, OP_WRITE, OP_READ, OP_SCAN, OP_PIN, OP_WAIT):
+            tx.write(frame(ST_OP))
+        else:
+            try:
+                tx.write(frame(ST_OK, handle(i2c, pin, op, addr, mem, n, data)))
+            except OSError:
+                tx.write(frame(ST_NACK))
+
+
+def _pin(n, v):
+    from machine import Pin
+
+    if v > 1:
+        Pin(n, Pin.IN)
+    else:
+        Pin(n, Pin.OUT).value(v)
+
+
+def main(sda=18, scl=19, freq=1000_000):
+    import sys
+
+    import micropython
+    from machine import I2C, Pin
+
+    i2c = I2C(1, sda=Pin(sda), scl=Pin(scl), freq=freq)
+    micropython.kbd_intr(-1)  # 0x03 in frame data must not raise KeyboardInterrupt
+    try:
+        serve(i2c, sys.stdin.buffer, sys.stdout.buffer, _pin)
+    finally:
+        micropython.kbd_intr(3)
@@ -20,6 +20,7 @@ Usage:
     python prtn_test.py --frequency --set 16       # Set frequency to 16GHz
     python prtn_test.py --temperature              # Read temperature
     python prtn_test.py --all                     # All functions
+    python prtn_test.py --single --sim            # Run on the Pico simulator
 
 Author: Generated for UCIe Test System
 Date: 2025
@@ -52,9 +53,10 @@ class ProteantecsCLI:
     Simple CLI tool for Proteantecs testing and monitoring
     """
 
-    def __init__(self):
+    def __init__(self, sim=False):
         """Initialize the CLI system"""
         self.running = True
+        self.sim = sim
         self.test_system = None
 
         # Set up signal handler for graceful shutdown
@@ -73,7 +75,7 @@ class ProteantecsCLI:
         """Initialize the test system"""
         if self.test_system is None:
             logger.info("Initializing Proteantecs test system...")
-            self.test_system = ProteantecsTestSystem()
+            self.test_system = ProteantecsTestSystem(sim=self.sim)
             logger.info("System ready!")
 
     def single_readout(self, reset_before=False):
@@ -342,8 +344,13 @@ class ProteantecsTestSystem:
     Complete Proteantecs test system following the exact GUI initialization flow
     """
 
-    def __init__(self):
-        """Initialize the complete test system following GUI flow"""
+    def __init__(self, sim=False):
+        """Initialize the complete test system following GUI flow
+
+        Args:
+            sim: Use Pico_sim.SimulatedPyboard instead of a connected Pico
+        """
+        self.sim = sim
         logger.info("=" * 80)
         logger.info("UCIe 2.5D/3D Proteantecs Test System")
         logger.info("=" * 80)
@@ -424,7 +431,7 @@ class ProteantecsTestSystem:
 
         try:
             logger.info("   → Attempting to connect to Raspberry Pi Pico...")
-            self.i2c = Pico("7-bit")
+            self.i2c = Pico("7-bit", sim=self.sim)
 
             if self.i2c.pyb is None:
                 logger.warning("   ⚠ No Pico device found!")
@@ -477,6 +484,12 @@ class ProteantecsTestSystem:
         logger.info("Step 5: Initializing Physical Layer...")
 
         try:
+            if self.sim:
+                # The simulator has no port to share, hand it to the physical layer
+                self.phy_0 = Glink_phy(self.gui, self.i2c, self.jtag)
+                logger.info("   ✓ Physical layer initialized on the Pico simulator")
+                return
+
             # Close our I2C connection first to avoid conflicts
             if hasattr(self.i2c, "pyb") and self.i2c.pyb is not None:
                 try:
@@ -580,6 +593,7 @@ Examples:
   python prtn_test.py --frequency --set 16    # Set frequency to 16GHz
   python prtn_test.py --temperature           # Read temperature
   python prtn_test.py --all                  # All functions
+  python prtn_test.py --single --sim         # Single readout on the simulator
         """,
     )
 
@@ -612,6 +626,12 @@ Examples:
         help="Reset system using soft reset before running tests",
     )
 
+    parser.add_argument(
+        "--sim",
+        action="store_true",
+        help="Run against the Pico simulator instead of a connected board",
+    )
+
     # Control flags
     parser.add_argument(
         "--set",
@@ -643,7 +663,7 @@ Examples:
         sys.exit(1)
 
     # Create CLI instance
-    cli = ProteantecsCLI()
+    cli = ProteantecsCLI(sim=args.sim)
 
     try:
         logger.info("Starting Proteantecs CLI Tool...")
@@ -0,0 +1,49 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)  # the repo modules are top-level scripts
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch, tmp_path):
+    # Test_Report/ workbooks are relative to the repo; UCIe_2p5D logs to a
+    # temporary i2c_log.txt, not TestTools/
+    import Glink_phy
+
+    monkeypatch.chdir(ROOT)
+    monkeypatch.setattr(Glink_phy, "I2C_LOG", str(tmp_path / "i2c_log.txt"))
+
+
+@pytest.fixture
+def apb_ops():
+    # apb_ops(board) -> list the ChipBus fills with every EHOST command it
+    # runs, in bus order: ("W", die, slave, address, data) / ("R", die, slave, address)
+    def record(board):
+        bus = board.bus
+        ops = []
+        command = bus._ehost_command
+
+        def traced(die, slave, regs, rwcl, cmd):
+            a, a_len, w, _, wcmd, rcmd = bus.LAYOUT[rwcl][:6]
+            address = int.from_bytes(regs[a : a + a_len], "little")
+            if cmd == wcmd:
+                ops.append(
+                    (
+                        "W",
+                        die,
+                        slave,
+                        address,
+                        int.from_bytes(regs[w : w + 4], "little"),
+                    )
+                )
+            elif cmd == rcmd:
+                ops.append(("R", die, slave, address))
+            return command(die, slave, regs, rwcl, cmd)
+
+        bus._ehost_command = traced
+        return ops
+
+    return record
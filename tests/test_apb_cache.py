@@ -0,0 +1,82 @@
+# APB word cache (user-015): plain words are served from the cache, volatile,
+# ordered and status words always go to the bus, chip reset / shadow epoch
+# changes drop it and verify_cache finds words changed behind the host
+import pytest
+
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+PLAIN = 0x3450
+ORDERED = 0x2100  # cmu_rstn
+STATUS = 0x2158  # RO field
+VOLATILE = 0x3628  # plain word, made volatile by cache_setup
+
+
+def cached_phy(agent):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=agent)
+    phy.cache_setup(volatile=(VOLATILE,))
+    phy.die_sel(die=1)
+    return phy, board
+
+
+def bus_reads(ops, address):
+    return len([op for op in ops if op[0] == "R" and op[3] == address])
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_plain_word_served_from_cache(agent, apb_ops):
+    phy, board = cached_phy(agent)
+    ops = apb_ops(board)
+    phy.indirect_write(0x2, PLAIN, "31:0", 0x12345678)
+    assert phy.indirect_read(0x2, PLAIN, "15:8") == "0x56"
+    assert phy.indirect_read(0x2, PLAIN, "31:0") == "0x12345678"
+    assert bus_reads(ops, PLAIN) == 0
+    assert phy.cache_stats["hits"] == 2
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("address", [ORDERED, STATUS, VOLATILE])
+def test_volatile_ordered_status_bypass(address, agent, apb_ops):
+    phy, board = cached_phy(agent)
+    ops = apb_ops(board)
+    phy.indirect_write(0x2, address, "31:0", 0x5)
+    board.bus.apb[(1, 0x2, address)] = 0x7  # the chip moves on
+    assert phy.indirect_read(0x2, address, "31:0") == "0x00000007"
+    assert phy.indirect_read(0x2, address, "31:0") == "0x00000007"
+    assert bus_reads(ops, address) == 2
+    assert not [key for key in phy.apb_cache if key[2] == address]
+    assert phy.cache_stats["bypass"] >= 2
+    assert phy.cache_stats["hits"] == 0
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("event", ["mux_invalidate", "shadow_epoch"])
+def test_invalidated_on_reset(event, agent, apb_ops):
+    phy, board = cached_phy(agent)
+    phy.indirect_write(0x2, PLAIN, "31:0", 0x12345678)
+    board.bus.apb[(1, 0x2, PLAIN)] = 0  # chip reset: back to default
+    # still cached until the host learns about the reset
+    assert phy.indirect_read(0x2, PLAIN, "31:0") == "0x12345678"
+    if event == "mux_invalidate":
+        phy.mux_invalidate()
+    else:
+        phy.i2c.shadow_invalidate()  # reset pins / reconnect / failed batch
+    phy.die_sel(die=1)
+    ops = apb_ops(board)
+    assert phy.indirect_read(0x2, PLAIN, "31:0") == "0x00000000"
+    assert bus_reads(ops, PLAIN) == 1
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_verify_cache_reports_difference(agent):
+    phy, board = cached_phy(agent)
+    phy.indirect_write(0x2, PLAIN, "31:0", 0x12345678)
+    phy.indirect_write(0x2, 0x3458, "31:0", 0x1)
+    assert phy.verify_cache(show=0) == []
+    board.bus.apb[(1, 0x2, PLAIN)] = 0x3F  # changed behind the host
+    assert phy.verify_cache(show=0) == [(1, 0x2, PLAIN, 0x12345678, 0x3F)]
+    # the wrong word is dropped, the next read goes to the bus
+    assert (0x02, 0x2, PLAIN) not in phy.apb_cache
+    assert (0x02, 0x2, 0x3458) in phy.apb_cache
+    assert phy.indirect_read(0x2, PLAIN, "31:0") == "0x0000003f"
@@ -0,0 +1,84 @@
+# die_sel / mux_select tracking of the 0x70 die mux (user-013); the ChipBus
+# fails every EHOST access on the wrong Die (expect_die)
+import random
+
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+
+def access_plan(n=300):
+    rng = random.Random(1)
+    plan = []
+    die = 0
+    for i in range(n):
+        if rng.random() < 0.1:
+            die = rng.choice([0, 1, 2])
+        event = None
+        if i % 100 == 75:
+            event = "reset"
+        elif i % 50 == 25:
+            event = "direct"  # Glink_run style i2c.write(0x70, ...)
+        plan.append((die, event, 0x3300 + 4 * (i % 16), i & 0x3F))
+    return plan
+
+
+def run_plan(track, plan):
+    board = SimulatedPyboard()
+    phy = make_phy(board, mux_track=track)
+    bus = board.bus
+    reads = []
+    for die, event, address, value in plan:
+        if event == "direct":
+            phy.non_i2c_write(0x70, 0x04, 0, 8, 0x04)
+        elif event == "reset":
+            phy.mux_invalidate()
+        bus.expect_die = None
+        phy.die_sel(die=die)
+        bus.expect_die = die
+        phy.indirect_write(0x2, address, "13:8", value)
+        reads.append(phy.indirect_read(0x2, address, "13:8"))
+    bus.expect_die = None
+    return reads, bus, phy.i2c.mux_stats
+
+
+def test_tracked_die_sel_right_die_fewer_writes():
+    plan = access_plan()
+    expect, every, _ = run_plan(0, plan)
+    reads, bus, stats = run_plan(1, plan)
+    assert reads == expect
+    assert bus.apb == every.apb
+    assert bus.wrong_die == every.wrong_die == 0
+    assert bus.mux_writes < every.mux_writes
+    assert stats["suppressed"] == every.mux_writes - bus.mux_writes
+    assert stats["invalidations"] > 0
+
+
+def test_die_sel_force_and_invalidate_write_again():
+    board = SimulatedPyboard()
+    phy = make_phy(board)
+    bus = board.bus
+    phy.die_sel(die=1)
+    writes = bus.mux_writes
+    phy.die_sel(die=1)
+    assert bus.mux_writes == writes
+    phy.die_sel(die=1, force=1)
+    assert bus.mux_writes == writes + 1
+    bus.die_mux = 0x01  # chip reset behind the Pico's back
+    phy.mux_invalidate()
+    phy.die_sel(die=1)
+    assert bus.mux_writes == writes + 2
+    assert bus.dies() == [1]
+
+
+def test_failed_mux_write_not_tracked():
+    board = SimulatedPyboard(nack_rate=1.0, seed=1)
+    phy = make_phy(board)
+    board.bus.nack_rate = 1.0
+    try:
+        phy.die_sel(die=2)
+    except Exception:
+        pass
+    assert 0x70 not in phy.i2c.mux_state
+    board.bus.nack_rate = 0.0
+    phy.die_sel(die=2)
+    assert board.bus.dies() == [2]
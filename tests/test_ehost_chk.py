@@ -0,0 +1,60 @@
+# EHOST done checks (user-016) against a ChipBus whose commands complete
+# ready_delay after they are written: chk=1 reports a timed out check,
+# chk=2 raises, one access at a time and batched (report at commit)
+import pytest
+
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+SLICES = [0, 1, 2, 3]
+
+
+def checked_phy(agent, chk, ready_delay, deadline_us):
+    board = SimulatedPyboard(ready_delay=ready_delay)
+    phy = make_phy(board, agent=agent)
+    phy.chk_setup(chk=chk, deadline_us=deadline_us)
+    phy.die_sel(die=1)
+    return phy, board
+
+
+def access(phy, path):
+    if path == "single":
+        phy.indirect_write(0x2, 0x3450, "31:0", 0x12345678)
+    elif path == "batched":
+        phy.slice_access(0x2, 0x3450, "31:0", SLICES, data=0x12345678, r_bk=0)
+    else:  # queued into the caller's batch
+        phy.i2c.begin_batch()
+        phy.slice_access(0x2, 0x3450, "31:0", SLICES, data=0x12345678, r_bk=0)
+        phy.i2c.commit()
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("path", ["single", "batched", "outer"])
+def test_chk_reports_timeout(path, agent, capsys):
+    phy, _ = checked_phy(agent, 1, ready_delay=0.05, deadline_us=200)
+    access(phy, path)
+    assert phy.chk_stats["failed"] >= 1
+    assert phy.i2c.wait_stats["timeouts"] >= 1
+    assert "APB failed" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("path", ["single", "batched", "outer"])
+def test_chk_raises_timeout(path, agent):
+    phy, _ = checked_phy(agent, 2, ready_delay=0.05, deadline_us=200)
+    with pytest.raises(Exception, match="APB failed"):
+        access(phy, path)
+    assert phy.chk_stats["failed"] >= 1
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("path", ["single", "batched", "outer"])
+def test_chk_waits_for_done(path, agent, capsys):
+    # the command completes inside the deadline: no report, the write lands
+    phy, board = checked_phy(agent, 2, ready_delay=0.001, deadline_us=200_000)
+    access(phy, path)
+    assert phy.chk_stats["failed"] == 0
+    assert phy.i2c.wait_stats["timeouts"] == 0
+    assert phy.i2c.wait_stats["waits"] >= 1
+    assert "APB failed" not in capsys.readouterr().out
+    assert board.bus.apb_word(1, 0x2, 0x3450) == 0x12345678
@@ -0,0 +1,134 @@
+# Log_Store rotation, index, eviction and item .txt take-in; LogWriter
+# rotation into the store (user-024)
+import os
+import random
+
+import pytest
+
+from Log_Store import STORE_DIR, LogStore, find_logs, load_index, log_open, read_log
+from Log_Writer import LogWriter
+
+SEGMENT = 4096
+
+
+def item_text(n, size=3000):
+    rng = random.Random(n)
+    lines = (
+        f"< Code > indirect_read : slave=0x2 , offset={hex(0x3000 + 4 * rng.randrange(1024))}"
+        f" , s_bit=31:0 , (R) value=0x{rng.getrandbits(32):08x}\n"
+        for _ in range(size // 40 + 1)
+    )
+    return f"< Start Test > item {n}\n" + "".join(lines)
+
+
+@pytest.fixture
+def report_log(tmp_path):
+    folder = tmp_path / "Test_Report Log"
+    folder.mkdir()
+    return folder
+
+
+def open_store(report_log, **kwargs):
+    kwargs.setdefault("max_bytes", 64 * SEGMENT)
+    kwargs.setdefault("segment_bytes", SEGMENT)
+    return LogStore(str(report_log / STORE_DIR), **kwargs)
+
+
+def run_items(store, report_log, count, **kwargs):
+    # Start_Test: item(), then the test writes its .txt (write_log)
+    texts = {}
+    for n in range(count):
+        name = f"PCS_BIST_{n}.txt"
+        path = str(report_log / name)
+        store.item(name, path=path, item="PCS_BIST", cycle=n // 4, temp=(25, 85)[n % 2])
+        texts[name] = item_text(n, **kwargs)
+        with open(path, "a+") as f:
+            f.write(texts[name])
+    return texts
+
+
+def test_item_txt_taken_in_and_read_back(report_log):
+    store = open_store(report_log)
+    texts = run_items(store, report_log, 6)
+    store.flush()
+    for name in list(texts)[:-1]:  # the last item is taken in at close()
+        assert store.read(name) == texts[name]
+        assert log_open(str(report_log / name)).read() == texts[name]
+    assert store.stats["segments"] > 1  # size rotation
+    store.close()
+
+    index = load_index(str(report_log / STORE_DIR))
+    assert all(seg["gz"] for seg in index["segments"].values())
+    for name, text in texts.items():
+        os.remove(report_log / name)  # only in the store now
+        assert read_log(str(report_log / STORE_DIR), name) == text
+        assert log_open(str(report_log / name)).read() == text
+
+
+def test_index_find(report_log):
+    store = open_store(report_log)
+    run_items(store, report_log, 8)
+    store.close()
+    index = load_index(str(report_log / STORE_DIR))
+    assert [log["name"] for log in find_logs(index, cycle=1)] == [
+        f"PCS_BIST_{n}.txt" for n in range(4, 8)
+    ]
+    assert len(find_logs(index, temp=25)) == 4
+    assert len(find_logs(index, item="PCS")) == 8
+    assert find_logs(index, item="PMA") == []
+
+
+def test_rotate_per_item(report_log):
+    store = open_store(report_log, rotate="item")
+    texts = run_items(store, report_log, 4, size=500)
+    store.close()
+    index = load_index(str(report_log / STORE_DIR))
+    segments = [log["parts"][0][0] for log in index["logs"]]
+    assert len(set(segments)) == len(texts)
+    for name, text in texts.items():
+        assert read_log(str(report_log / STORE_DIR), name) == text
+
+
+def test_cap_evicts_txt_first_then_segments(report_log):
+    store = open_store(report_log, max_bytes=4 * SEGMENT)
+    texts = run_items(store, report_log, 40)
+    store.flush()
+    assert store.disk_bytes() <= store.max_bytes
+    assert store.stats["files"] > 0 and store.stats["evicted"] > 0
+    files = [name for name in texts if os.path.exists(report_log / name)]
+    assert files and files == list(texts)[-len(files) :]  # newest .txt kept
+    kept = [log for log in store.find() if not log.get("partial")]
+    assert kept and "PCS_BIST_0.txt" not in [log["name"] for log in kept]
+    for log in kept[:-1]:
+        assert store.read(log["name"]) == texts[log["name"]]
+    store.close()
+
+
+def test_bad_setup():
+    with pytest.raises(Exception, match="rotate"):
+        LogStore("unused", rotate="never")
+    with pytest.raises(Exception, match="4 segments"):
+        LogStore("unused", max_bytes=3 * SEGMENT, segment_bytes=SEGMENT)
+
+
+def test_writer_rotation_read_truncate(report_log, tmp_path):
+    store = open_store(report_log)
+    store.item("PCS_BIST_0.txt", item="PCS_BIST", cycle=0)
+    i2c_log = LogWriter(str(tmp_path / "i2c_log.txt"))
+    i2c_log.rotate_setup(store, max_bytes=2000)
+    text = item_text(1, size=12000)
+    for i in range(0, len(text), 700):
+        i2c_log.write(text[i : i + 700])
+    assert i2c_log.read() == text
+    assert i2c_log.stats["rotations"] > 0
+    assert os.path.getsize(tmp_path / "i2c_log.txt") < 2000 + 700
+
+    i2c_log.truncate()
+    assert i2c_log.read() == ""
+    i2c_log.write("next item\n")
+    assert i2c_log.read() == "next item\n"
+    logs = store.find(name="i2c_log.txt")
+    assert logs and logs[0]["item"] == "PCS_BIST"
+    rotated = store.read("i2c_log.txt")  # the text rotated before truncate()
+    assert rotated and text.startswith(rotated)
+    store.close()
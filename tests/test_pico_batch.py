@@ -0,0 +1,89 @@
+# Pico.begin_batch() / commit() on the in-memory pyboard double (user-002)
+import pytest
+
+from Pico_sim import FakePyboard
+from Raspberry_Pico import Pico, PicoResult
+
+
+def run_ops(pico, n=16):
+    reads = []
+    for i in range(n):
+        offset = 0x40 + 4 * (i % 8)
+        pico.write(0x2, offset, 4, 6, i & 0x3F)  # read-modify-write field
+        pico.write(0x2, offset + 0x100, 0, 16, 0x1234 + i)
+        reads.append(pico.read(0x2, offset, 0, 32))
+        reads.append(pico.read(0x2, offset, 4, 6))
+    return reads
+
+
+def test_batch_same_reads_and_bus_as_single():
+    single = FakePyboard()
+    expect = run_ops(Pico("7-bit", pyb=single, agent=0))
+
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0)
+    execs = board.execs
+    pico.begin_batch()
+    handles = run_ops(pico)
+    assert all(isinstance(h, PicoResult) and not h.done for h in handles)
+    reads = pico.commit()
+    assert board.execs - execs == 1
+    assert reads == expect
+    assert [h.get() for h in handles] == expect
+    assert board.bus.mem == single.bus.mem
+
+
+def test_batch_result_before_commit_raises():
+    pico = Pico("7-bit", pyb=FakePyboard(), agent=0)
+    pico.begin_batch()
+    result = pico.read(0x2, 0x40, 0, 32)
+    with pytest.raises(Exception, match="before commit"):
+        result.get()
+    pico.commit()
+    assert result.get() == "0x0"
+
+
+def test_batch_already_open_raises():
+    pico = Pico("7-bit", pyb=FakePyboard(), agent=0)
+    pico.begin_batch()
+    with pytest.raises(Exception, match="already open"):
+        pico.begin_batch()
+
+
+def test_empty_commit_no_exec():
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0)
+    execs = board.execs
+    pico.begin_batch()
+    assert pico.commit() == []
+    assert board.execs == execs
+    assert not pico.queueing()
+
+
+def test_commit_hooks_run_once_per_batch():
+    pico = Pico("7-bit", pyb=FakePyboard(), agent=0)
+    calls = []
+    pico.begin_batch()
+    pico.on_commit(calls.append)
+    pico.write(0x2, 0x40, 0, 32, 0x5)
+    pico.commit()
+    assert calls == [0]
+    pico.begin_batch()
+    pico.write(0x2, 0x40, 0, 32, 0x6)
+    pico.commit()
+    assert calls == [0]  # hooks belong to the batch they were added to
+
+
+def test_failed_commit_closes_batch_and_drops_shadow():
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0, shadow=1)
+    pico.write(0x2, 0x40, 0, 32, 0x5)
+    pico.read(0x2, 0x40, 4, 4)  # fills the shadow
+    assert pico.shadow
+    pico.begin_batch()
+    pico.write(0x2, 0x40, 0, 32, 0x6)
+    pico.batch.append(("raise OSError(5)", None))  # NACK part way
+    with pytest.raises(Exception):
+        pico.commit()
+    assert pico.batch is None
+    assert not pico.shadow
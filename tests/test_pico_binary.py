@@ -0,0 +1,110 @@
+# PicoBinaryTransport (user-003) against the pico_binary firmware loop behind
+# a pty (Pico_sim.binary_loopback): same host state and bus results as the
+# REPL Pico, frames with a wrong CRC are rejected both ways
+import struct
+
+import pytest
+
+from Glink_phy import UCIe_2p5D
+from Pico_binary import PicoBinaryTransport
+from Pico_sim import ChipBus, FakeBus, FakePyboard, binary_loopback
+from Raspberry_Pico import Pico
+from TestTools.pico_agent import pico_binary as fw
+from TestTools.pico_python_library.mpremote import pyboard
+
+
+@pytest.fixture
+def loopback():
+    # loopback(bus) -> PicoBinaryTransport on bus, OP_EXIT on teardown
+    opened = []
+
+    def open_link(bus):
+        ser, thread = binary_loopback(bus)
+        opened.append((PicoBinaryTransport("7-bit", serial=ser), thread))
+        return opened[-1][0]
+
+    yield open_link
+    for pico, thread in opened:
+        pico.close()
+        thread.join(2)
+
+
+def sequence(pico):
+    reads = []
+    for i in range(8):
+        pico.write(0x2, 0x40 + 4 * i, 0, 32, 0x01030000 + i)
+        pico.write(0x2, 0x40 + 4 * i, 8, 6, i + 1)  # read-modify-write
+        reads.append(pico.read(0x2, 0x40 + 4 * i, 0, 32))
+        reads.append(pico.read(0x2, 0x40 + 4 * i, 8, 8))
+    return reads
+
+
+def test_shared_host_state(loopback):
+    pico = loopback(ChipBus())
+    repl = Pico("7-bit", pyb=FakePyboard(), agent=0)
+    assert set(vars(repl)) - set(vars(pico)) <= {"sda", "scl"}
+    assert pico.commit_hooks == []
+    assert pico.i2c_freq == 1000_000
+    assert pico.serial_id == "unknown"  # pre-opened port, no raw REPL
+
+
+def test_same_results_as_repl(loopback):
+    bus = FakeBus()
+    pico = loopback(bus)
+    repl_bus = FakeBus()
+    repl = Pico("7-bit", pyb=FakePyboard(bus=repl_bus), agent=0)
+    reads = sequence(repl)
+    assert sequence(pico) == reads
+    assert reads[:4] == ["0x1030100", "0x1", "0x1030201", "0x2"]
+    assert bus.mem == repl_bus.mem
+
+
+def test_same_apb_as_repl(loopback):
+    bus = ChipBus()
+    pico = loopback(bus)
+    repl_bus = ChipBus()
+    phys = [
+        UCIe_2p5D(None, pico, None),
+        UCIe_2p5D(None, Pico("7-bit", pyb=FakePyboard(bus=repl_bus), agent=0), None),
+    ]
+    reads = []
+    for phy in phys:
+        phy.save_log = 0
+        phy.die_sel(die=1)
+        phy.indirect_write(0x2, 0x3450, "31:0", 0x12345678)
+        phy.indirect_write(0x2, 0x3450, "13:8", 0x2A)
+        reads.append(phy.indirect_read(0x2, 0x3450, "31:0"))
+    assert reads[0] == reads[1] == "0x12346a78"
+    assert bus.apb == repl_bus.apb
+
+
+def test_request_crc_rejected(loopback):
+    pico = loopback(FakeBus())
+    head = struct.pack(fw.REQ, fw.REQ_MAGIC, fw.OP_WRITE, 0x2, 0x40, 4)
+    data = b"\x01\x02\x03\x04"
+    crc = fw.crc16(head + data) ^ 0x1
+    pico.serial.write(head + data + struct.pack("<H", crc))
+    magic, status, length = struct.unpack(fw.RSP, pico._read_exact(fw.RSP_LEN))
+    pico._read_exact(length + 2)
+    assert (magic, status) == (fw.RSP_MAGIC, fw.ST_CRC)
+    # not written, and the link stays in step
+    assert pico.read_bytes(0x2, 0x40) == 0
+
+
+def test_reply_crc_rejected(loopback):
+    pico = loopback(FakeBus())
+    pico.write(0x2, 0x40, 0, 32, 0x12345678)
+    read = pico.serial.read
+    reads = []
+
+    def corrupt(n=1):
+        # head, payload, crc: flips a bit of the payload
+        reads.append(n)
+        data = read(n)
+        return data[:-1] + bytes([data[-1] ^ 0x80]) if len(reads) == 2 else data
+
+    pico.serial.read = corrupt
+    with pytest.raises(pyboard.PyboardError, match="corrupted"):
+        pico.read_bytes(0x2, 0x40)
+    pico.serial.read = read
+    assert pico.read_bytes(0x2, 0x40) == 0x12345678
@@ -0,0 +1,46 @@
+# Pico.gpio_apply on the simulated RP2040 mem32 register file (user-007)
+import pytest
+
+from Pico_sim import FakePyboard
+from Raspberry_Pico import SIO_OUT_SET, Pico
+
+RESET_PINS = 1 << 6 | 1 << 7 | 1 << 8
+
+
+def test_gpio_apply_one_exec_sets_pins_together():
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0)
+    execs = board.execs
+    pico.gpio_apply(RESET_PINS, 1 << 9)
+    assert board.execs - execs == 1
+    assert [board.pins[n] for n in (6, 7, 8, 9)] == [1, 1, 1, 0]
+    assert board.mem32[SIO_OUT_SET - 4] & RESET_PINS == RESET_PINS  # GPIO_OUT
+
+
+def test_gpio_apply_pulse_width():
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0)
+    pico.gpio_apply(RESET_PINS, 0)
+    mark = len(board.pin_log)
+    pico.gpio_apply(0, 1 << 7, pulse_us=5000)
+    log = board.pin_log[mark:]
+    assert [(pin, level) for _, pin, level in log] == [(7, 0), (7, 1)]
+    assert log[1][0] - log[0][0] >= 5000e-6
+    assert board.pins[7] == 1
+
+
+def test_gpio_apply_overlapping_masks():
+    pico = Pico("7-bit", pyb=FakePyboard(), agent=0)
+    with pytest.raises(Exception, match="both"):
+        pico.gpio_apply(1 << 6, 1 << 6)
+
+
+def test_gpio_apply_in_batch_waits_for_commit():
+    board = FakePyboard()
+    pico = Pico("7-bit", pyb=board, agent=0)
+    pico.gpio_apply(0, RESET_PINS)
+    pico.begin_batch()
+    pico.gpio_apply(RESET_PINS, 0)
+    assert [board.pins[n] for n in (6, 7, 8)] == [0, 0, 0]
+    pico.commit()
+    assert [board.pins[n] for n in (6, 7, 8)] == [1, 1, 1]
@@ -0,0 +1,60 @@
+# Pico.write read-modify-write merged from the shadow cache (user-005)
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+
+def run_writes(shadow, ops=60):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=0, shadow=shadow)
+    pico, bus = phy.i2c, board.bus
+    transactions = bus.transactions
+    for i in range(ops):
+        mux = (0x20, 0x40, 0x80)[i % 3]
+        pico.write(0x71, mux, 0, 8, mux)  # U142 i2c mux switch
+        pico.write(0x50, 0x1, 1, 1, i & 1)
+        pico.write(0x50, 0x3, 4, 3, i & 7)
+        pico.write(0x50, 0x7, 0, 3, i & 7)
+        phy.indirect_enable(i % 3, 2)
+        if i % 20 == 19:
+            phy.pico_gpio_low(25, 1)  # any GPIO_Set drops the cache
+    state = (bus.devices, {k: bytes(v) for k, v in bus.regs.items()}, bus.apb)
+    return state, bus.transactions - transactions, pico
+
+
+def test_shadow_same_final_state_fewer_transactions():
+    expect, transactions, _ = run_writes(0)
+    state, shadow_transactions, pico = run_writes(1)
+    assert state == expect
+    assert shadow_transactions < transactions
+    stats = pico.shadow_stats
+    assert stats["hits"] > 0 and stats["misses"] > 0
+    assert stats["reads_avoided"] == stats["hits"]
+
+
+def test_shadow_keyed_per_mux_channel():
+    board = SimulatedPyboard()
+    pico = make_phy(board, agent=0, shadow=1).i2c
+    pico.write(0x71, 0x20, 0, 8, 0x20)
+    pico.write(0x50, 0x1, 0, 32, 0x11)
+    pico.write(0x71, 0x40, 0, 8, 0x40)
+    pico.write(0x50, 0x1, 4, 4, 0x2)  # other channel: bus read, not 0x11
+    assert pico.shadow_stats["hits"] == 0
+    assert board.bus.devices[(0x40, 0x50, 0x1)] == 0x20
+
+
+def test_shadow_volatile_and_invalidate():
+    board = SimulatedPyboard()
+    pico = make_phy(board, agent=0, shadow=1, volatile={(0x50, 0x1)}).i2c
+    pico.write(0x71, 0x20, 0, 8, 0x20)
+    pico.write(0x50, 0x1, 0, 8, 0x11)
+    pico.write(0x50, 0x1, 4, 4, 0x2)  # volatile: always read from the bus
+    pico.write(0x50, 0x4, 0, 32, 0x11)
+    assert pico.shadow_stats["hits"] == 0
+    pico.write(0x50, 0x4, 4, 4, 0x2)  # merged from the shadow
+    assert pico.shadow_stats["hits"] == 1
+    assert board.bus.devices[(0x20, 0x50, 0x4)] == 0x21
+    board.bus.devices[(0x20, 0x50, 0x4)] = 0x0F  # the chip changed it
+    pico.shadow_invalidate(0x50, 0x4, 4)
+    pico.write(0x50, 0x4, 4, 4, 0x3)  # miss: read back from the bus
+    assert pico.shadow_stats["hits"] == 1
+    assert board.bus.devices[(0x20, 0x50, 0x4)] == 0x3F
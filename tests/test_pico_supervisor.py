@@ -0,0 +1,90 @@
+# PicoSupervisor (user-009) over a fault-injecting raw REPL serial: a lost
+# link is reconnected and the call replayed, a call inside once() raises
+# instead, and the retries / budget / deadline bound the reconnects
+import pytest
+
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard, repl_pyboard
+from TestTools.pico_python_library.mpremote import pyboard
+
+
+class Script:
+    # random.Random stand-in for ReplSerial: the scripted draws, then no fault
+    def __init__(self):
+        self.draws = []
+
+    def random(self):
+        return self.draws.pop(0) if self.draws else 1.0
+
+
+def supervised_phy(**supervise_args):
+    board = SimulatedPyboard()
+    faults = {}
+    rng = Script()
+    connect = lambda: repl_pyboard(board, faults, rng)
+    args = dict(connect=connect, timeout=0.2, backoff=0)
+    args.update(supervise_args)
+    phy = make_phy(connect(), supervise=1, supervise_args=args)
+    phy.die_sel(die=1)
+    return phy, board, faults, rng
+
+
+@pytest.mark.parametrize("fault", ["drop", "timeout", "garbage"])
+def test_transient_fault_replayed(fault):
+    phy, board, faults, rng = supervised_phy()
+    faults[fault] = 0.5
+    rng.draws = [0.0]  # the next exec fails once
+    phy.indirect_write(0x2, 0x3450, "31:0", 0x12345678)
+    assert phy.indirect_read(0x2, 0x3450, "31:0") == "0x12345678"
+    stats = phy.i2c.pyb.stats
+    assert stats["reconnects"] == 1
+    assert stats["replays"] == 1
+    assert stats["not_replayed"] == 0
+    assert board.bus.apb_word(1, 0x2, 0x3450) == 0x12345678
+
+
+def test_once_not_replayed():
+    phy, board, faults, rng = supervised_phy()
+    pico = phy.i2c
+    pico.begin_batch()
+    pico.write(0x70, 0x04, 0, 8, 0x02)
+    faults["drop"] = 0.5
+    rng.draws = [0.0]  # the batch runs, then the port disappears
+    with pytest.raises(pyboard.PyboardError, match="not replayed"):
+        pico.commit()
+    stats = pico.pyb.stats
+    assert stats["reconnects"] == 1
+    assert stats["not_replayed"] == 1
+    assert stats["replays"] == 0
+    # the reconnected link works for the next call
+    phy.die_sel(die=1)
+    phy.indirect_write(0x2, 0x3450, "31:0", 0x5)
+    assert board.bus.apb_word(1, 0x2, 0x3450) == 0x5
+
+
+def test_budget_exhausted():
+    phy, _, faults, rng = supervised_phy(budget=2, retries=5)
+    faults["drop"] = 0.5
+    rng.draws = [0.0] * 100  # every exec, restore included, loses the port
+    with pytest.raises(pyboard.PyboardError, match="out of retries"):
+        phy.indirect_write(0x2, 0x3450, "31:0", 0x5)
+    assert phy.i2c.pyb.stats["reconnects"] == 2
+    assert phy.i2c.pyb.budget == 0
+
+
+def test_retries_exhausted():
+    phy, _, faults, rng = supervised_phy(retries=2)
+    faults["garbage"] = 0.5
+    rng.draws = [0.0] * 100
+    with pytest.raises(pyboard.PyboardError, match="out of retries"):
+        phy.indirect_write(0x2, 0x3450, "31:0", 0x5)
+    assert phy.i2c.pyb.stats["reconnects"] == 2
+
+
+def test_deadline_passed():
+    phy, _, faults, rng = supervised_phy(deadline=0.05)
+    faults["timeout"] = 0.5
+    rng.draws = [0.0] * 100  # no reply: every try waits out its timeout
+    with pytest.raises(pyboard.PyboardError, match="deadline passed"):
+        phy.indirect_write(0x2, 0x3450, "31:0", 0x5)
+    assert phy.i2c.pyb.stats["timeout"] >= 1
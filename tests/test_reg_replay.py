@@ -0,0 +1,61 @@
+# Reg_Replay of a recorded text log / binary trace on a fresh simulator
+import contextlib
+import io
+
+import pytest
+
+import Reg_Replay
+from Log_Writer import LogWriter
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+REG_ARR = [
+    "0x2000,7:0,0xf1,nan,nan,V,nan,0/1,1,0/1",
+    "0x3450,29:24,0x20,nan,nan,V,nan,0/1,1,0/1",
+    "0x2158,9:4,nan,nan,nan,nan,V,0/1,1,0/1",
+]
+
+
+@pytest.fixture
+def recording(tmp_path):
+    text, trace = str(tmp_path / "i2c_log.txt"), str(tmp_path / "trace.bin")
+    phy = make_phy(SimulatedPyboard(), agent=0)
+    phy.i2c_log = LogWriter(text)
+    phy.save_log = 1
+    phy.trace_setup(path=trace)
+    phy.resetn()
+    for name in ("PLL", "HW1", "PLL"):  # PLL again: a phase of its own
+        label = f"[Sequence] {name}"
+        phy.Save_i2cLog(log_name=label + "\n")
+        phy.trace_label(label)
+        phy.reg_user_set(reg_arr=REG_ARR, mode="USER_mode", show=0)
+        phy.cfg_err_th(1, 1, setv="0x3", r_bk=1, echo=0)
+    phy.i2c_log.flush()
+    phy.trace_setup(path=None)
+    return text, trace
+
+
+@pytest.mark.parametrize("source", ["text", "trace"])
+@pytest.mark.parametrize("agent", [0, 1])
+def test_replay_matches_recording(recording, source, agent):
+    steps = Reg_Replay.read(recording[0] if source == "text" else recording[1])
+    assert (steps[0].t_ns is None) == (source == "text")
+    phy = make_phy(SimulatedPyboard(), agent=agent)
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = Reg_Replay.replay(phy, steps)
+    assert result["mismatch"] == []
+    names = [row[0] for row in result["phases"]]
+    assert names[-3:] == ["[Sequence] PLL", "[Sequence] HW1", "[Sequence] PLL #2"]
+    reads = sum(row[2] for row in result["phases"])
+    assert reads == sum(1 for step in steps if step.op == Reg_Replay.OP_READ) > 0
+
+
+def test_replay_reports_mismatch(recording):
+    steps = Reg_Replay.read(recording[1])
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=1)
+    board.bus.stuck[(1, 2, 0x3628)] = (0x0F000000, 0)  # cfg_err_th never sticks
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = Reg_Replay.replay(phy, steps)
+    assert result["mismatch"]
+    assert {step.address % 0x10000 for step, _ in result["mismatch"]} == {0x3628}
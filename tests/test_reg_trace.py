@@ -0,0 +1,88 @@
+# Reg_Trace binary trace round trip against the i2c_log.txt text logger
+# (user-022)
+import csv
+import io
+
+import pytest
+
+from Log_Writer import LogWriter
+from Pico_bench import make_phy, register_sequences, trace_workload
+from Pico_sim import SimulatedPyboard
+from Reg_Trace import (
+    OP_KIND,
+    OP_READ,
+    OP_WRITE,
+    TraceWriter,
+    entries,
+    load,
+    select,
+    write_csv,
+    write_text,
+)
+
+
+@pytest.fixture(scope="module")
+def sections():
+    return register_sequences()
+
+
+def record_workload(agent, sections, tmp_path):
+    phy = make_phy(SimulatedPyboard(), agent=agent)
+    phy.i2c_log = LogWriter(str(tmp_path / "i2c_log.txt"))
+    phy.save_log = 1
+    phy.trace_setup(path=str(tmp_path / "trace.bin"))
+    trace_workload(phy, sections)  # resetn: starts a new text log
+    label = "[Sequence] trace test"
+    phy.Save_i2cLog(log_name=label + "\n")
+    phy.trace_label(label)
+    phy.cfg_err_th(2, 1, setv="0x5", r_bk=1, echo=0)
+    phy.i2c_log.flush()
+    phy.trace_setup(path=None)
+    return (tmp_path / "i2c_log.txt").read_text(), load(str(tmp_path / "trace.bin"))
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_trace_decodes_to_text_log(agent, sections, tmp_path):
+    text, records = record_workload(agent, sections, tmp_path)
+    out = io.StringIO()
+    write_text(records, out)
+    assert out.getvalue() == text
+    assert "Slice3_Offset" in text and "< User_Define >" in text
+
+
+def test_trace_csv_and_select(sections, tmp_path):
+    _, records = record_workload(1, sections, tmp_path)
+    out = io.StringIO()
+    write_csv(records, out)
+    rows = list(csv.reader(io.StringIO(out.getvalue())))
+    assert rows[0][:3] == ["timestamp_ns", "op", "source"]
+    assert len(rows) - 1 == sum(1 for _ in entries(records))
+    assert [row[1] for row in rows].count("LABEL") == 1
+    assert ["LABEL", "[Sequence] trace test"] in [[row[1], row[-1]] for row in rows]
+
+    die1 = select(records, die=1, address=(0x3000, 0x3FFF))
+    assert len(die1) > 0 and set(die1["die"]) == {1}
+    offsets = die1["address"] % 0x10000
+    assert offsets.min() >= 0x3000 and offsets.max() <= 0x3FFF
+    assert set(die1["op"] & OP_KIND) <= {OP_WRITE, OP_READ}
+    assert len(select(records, since=0)) == len(records)
+    assert len(select(records, until=-1)) == 0
+
+
+def test_trace_writer_appends(tmp_path):
+    path = str(tmp_path / "trace.bin")
+    trace = TraceWriter(path, chunk_bytes=48)
+    trace.record(OP_WRITE, 1, 0x2, 3, 0x33628, 0x0F000000, 0x5)
+    trace.label("[Sequence] a label longer than twelve bytes", die=1)
+    trace.close()
+    trace = TraceWriter(path)  # existing trace: appended, one header
+    trace.record(OP_READ, 1, 0x2, 3, 0x33628, 0x0F000000, 0x5)
+    trace.close()
+    found = [(int(rec["op"]), label) for rec, label in entries(load(path))]
+    assert found == [
+        (OP_WRITE, None),
+        (6, "[Sequence] a label longer than twelve bytes"),
+        (OP_READ, None),
+    ]
+    rec = load(path)[0]
+    assert (int(rec["die"]), int(rec["slice"]), int(rec["address"])) == (1, 3, 0x33628)
@@ -0,0 +1,132 @@
+# RegisterMap field accessors (reg_set / wrapper shims) against the old
+# slice-by-slice indirect_write / indirect_read bodies (user-017): same read
+# backs, APB state, per-word bus traffic and i2c_log text
+import ast
+import contextlib
+import io
+
+import pytest
+
+from Log_Writer import LogWriter
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+from Raspberry_Pico import bit_field
+
+FIELDS = [
+    ("cfg_tp_sel", 0x3450, "6:4"),
+    ("cfg_err_th", 0x3628, "27:24"),
+    ("cfg_cck_ini_offset", 0x3628, "4:0"),
+    ("rg_pmaa_TX_OE_l", 0x3408, "31:0"),
+    ("RX_PCS_BIST_MODE", 0x7100, "0"),
+]
+SLICES = [0, 1, 2, 3]
+
+
+def run_fields(path, agent, apb_ops, tmp_path, runs=3):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=agent)
+    phy.reg_map()
+    log = tmp_path / f"{path}_{agent}.txt"
+    phy.i2c_log = LogWriter(str(log))
+    phy.save_log = 1
+    ops = apb_ops(board)
+    reads = []
+    for i in range(runs):
+        for name, offset, bit in FIELDS:
+            value = (i * 0x9E3779B1) & bit_field(bit).extract(0xFFFFFFFF)
+            if path == "reg_set":
+                reads += phy.reg_set(name, 1, 1, value, slices=SLICES, r_bk=1)
+            elif path == "wrapper":
+                out = io.StringIO()  # the wrapper prints the read back
+                with contextlib.redirect_stdout(out):
+                    getattr(phy, name)(1, 1, setv=hex(value), r_bk=1, slice=SLICES)
+                reads += ast.literal_eval(out.getvalue().split(" = ")[-1])
+            else:
+                phy.die_sel(die=1)
+                for n in SLICES:
+                    address = offset + n * phy.slice_offset
+                    phy.indirect_write(0x2, address, bit, value, slice_num=n)
+                    reads.append(phy.indirect_read(0x2, address, bit, slice_num=n))
+    phy.i2c_log.flush()
+    return reads, dict(board.bus.apb), ops, log.read_text()
+
+
+def per_word(ops):
+    # bus traffic of every APB word in bus order
+    words = {}
+    for op in ops:
+        words.setdefault(op[1:4], []).append(op[0] if op[0] == "R" else op[::4])
+    return words
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("path", ["reg_set", "wrapper"])
+def test_same_traffic_as_per_slice(path, agent, apb_ops, tmp_path):
+    reads, apb, ops, text = run_fields("per slice", agent, apb_ops, tmp_path)
+    b_reads, b_apb, b_ops, b_text = run_fields(path, agent, apb_ops, tmp_path)
+    assert b_reads == reads
+    assert b_apb == apb
+    assert b_text == text
+    assert [op for op in b_ops if op[0] == "W"] == [op for op in ops if op[0] == "W"]
+    assert per_word(b_ops) == per_word(ops)
+
+
+def test_reg_get_matches_indirect_read():
+    phy = make_phy(SimulatedPyboard(), agent=1)
+    phy.reg_set("cfg_err_th", 1, 1, 0x5, slices=SLICES, r_bk=0)
+    phy.die_sel(die=1)
+    expect = [
+        phy.indirect_read(0x2, 0x3628 + n * phy.slice_offset, "27:24", slice_num=n)
+        for n in SLICES
+    ]
+    assert phy.reg_get("cfg_err_th", 1, 1, slices=SLICES) == expect == ["0x5"] * 4
+
+
+def test_unknown_field_raises():
+    phy = make_phy(SimulatedPyboard(), agent=1)
+    with pytest.raises(Exception):
+        phy.reg_set("no_such_field", 1, 1, 0x1, slices=SLICES)
+
+
+def run_slice_access(agent, r_bk, outer, tmp_path):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=agent)
+    log = tmp_path / f"slice_{agent}_{r_bk}_{outer}.txt"
+    phy.i2c_log = LogWriter(str(log))
+    phy.save_log = 1
+    phy.die_sel(die=1)
+    board.bus.apb.update(
+        {(1, 0x2, 0x3464 + n * phy.slice_offset): 0xA5A5A5A5 for n in SLICES}
+    )
+    before = {}
+    if outer:
+        phy.i2c.begin_batch()
+    reads = phy.slice_access(
+        0x2, 0x3464, "7:4", SLICES, data=5, r_bk=r_bk, before=before
+    )
+    if outer:
+        assert all(not result.done for result in reads)
+        phy.i2c.commit()
+        reads = [result.get() for result in reads]
+    phy.i2c_log.flush()
+    return reads, before, dict(board.bus.apb), log.read_text()
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+@pytest.mark.parametrize("r_bk", [0, 1])
+def test_slice_access_in_open_batch(agent, r_bk, tmp_path):
+    # queued into the caller's batch: read-modify-write on the board, read
+    # backs / before values / log lines resolved at its commit()
+    expect = run_slice_access(agent, r_bk, False, tmp_path)
+    assert run_slice_access(agent, r_bk, True, tmp_path) == expect
+    assert expect[1] == {n: "0xa" for n in SLICES}
+    assert [expect[2][(1, 0x2, 0x3464 + n * 0x10000)] for n in SLICES] == [
+        0xA5A5A555
+    ] * 4
+
+
+def test_slice_access_tport_in_open_batch_raises():
+    phy = make_phy(SimulatedPyboard(), agent=1)
+    phy.i2c.begin_batch()
+    with pytest.raises(Exception, match="commit"):
+        phy.slice_access(0x2, 0x3464, "7:4", SLICES, data=5, top=1)
@@ -0,0 +1,108 @@
+# reg_user_set write combining against the per-field path (user-014)
+import pytest
+
+from Log_Writer import LogWriter
+from Pico_bench import make_phy
+from Pico_sim import SimulatedPyboard
+
+FIELDS = [
+    ("0x2000", "7:0", "0xf1"),
+    ("0x2114", "15:0", "0x30a0"),
+    ("0x2100", "0", "0x0"),  # cmu_rstn: ordered
+    ("0x2100", "0", "0x1"),
+    ("0x32e0", "13:8", "0x0"),
+    ("0x32e0", "21:16", "0x3f"),
+    ("0x3300", "5:0", "0x10"),
+    ("0x3504", "2", "0x1"),
+    ("0x3504", "5", "0x0"),
+    ("0x3450", "29:24", "0x20"),
+    ("0x3450", "7:0", "0x11"),
+    ("0x3458", "29:28", "0x0"),
+    ("0x3458", "3:0", "0x5"),
+]
+REG_ARR = [
+    f"{offset},{bit},{value},nan,nan,V,nan,0/1,1/2,0/1" for offset, bit, value in FIELDS
+] + [
+    "0x2158,9:4,nan,nan,nan,nan,V,0/1,1/2,0/1"
+]  # status read
+
+
+def run_sequence(agent, combine, apb_ops, tmp_path):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=agent)
+    ops = apb_ops(board)
+    path = tmp_path / f"i2c_log_{agent}{combine}.txt"
+    phy.i2c_log = LogWriter(str(path))
+    phy.save_log = 1
+    reads = phy.reg_user_set(reg_arr=REG_ARR, mode="USER_mode", show=0, combine=combine)
+    phy.i2c_log.flush()
+    return board.bus.apb, ops, path.read_text(), reads, phy.wc_stats
+
+
+def writes(ops, address=None):
+    return [op for op in ops if op[0] == "W" and address in (None, op[3])]
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_combined_same_apb_and_log(agent, apb_ops, tmp_path):
+    apb, ops, text, reads, _ = run_sequence(agent, 0, apb_ops, tmp_path)
+    c_apb, c_ops, c_text, c_reads, stats = run_sequence(agent, 1, apb_ops, tmp_path)
+    assert c_apb == apb
+    assert c_reads == reads
+    assert c_text == text
+    assert len(writes(c_ops)) < len(writes(ops))
+    assert stats["fields"] > stats["words"] > 0
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_combined_keeps_ordered_writes(agent, apb_ops, tmp_path):
+    _, ops, *_ = run_sequence(agent, 0, apb_ops, tmp_path)
+    _, c_ops, *_ = run_sequence(agent, 1, apb_ops, tmp_path)
+    for die in (0, 1):
+        # cmu_rstn 0 then 1: both writes reach the word, in program order
+        rstn = [op[4] & 1 for op in writes(c_ops, 0x2100) if op[1] == die]
+        assert rstn == [0, 1]
+    # writes to different words keep their first-write order
+    first = lambda ops: list(dict.fromkeys(op[1:4] for op in writes(ops)))
+    assert first(c_ops) == first(ops)
+
+
+def test_read_flushes_pending_word(apb_ops):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=1)
+    phy.die_sel(die=1)
+    assert phy.write_combine_begin()
+    phy.indirect_write(0x2, 0x3450, "7:0", 0x11)
+    phy.indirect_write(0x2, 0x3450, "29:24", 0x20)
+    assert board.bus.apb_word(1, 2, 0x3450) == 0
+    assert int(phy.indirect_read(0x2, 0x3450, "31:0"), 16) == 0x20000011
+    phy.write_combine_end()
+    assert board.bus.apb_word(1, 2, 0x3450) == 0x20000011
+
+
+def flush_in_batch(agent, outer):
+    board = SimulatedPyboard()
+    phy = make_phy(board, agent=agent)
+    phy.die_sel(die=1)
+    for word in (0x3450, 0x3458, 0x3504):
+        board.bus.apb[(1, 0x2, word)] = 0xA5A5A5A5
+    assert phy.write_combine_begin()
+    phy.indirect_write(0x2, 0x3450, "7:0", 0x11)
+    phy.indirect_write(0x2, 0x3450, "29:24", 0x20)
+    phy.indirect_write(0x2, 0x3458, "3:0", 0xA)
+    phy.indirect_write(0x2, 0x3504, "2", 0x0)
+    if outer:
+        phy.i2c.begin_batch()
+    phy.write_combine_end()
+    if outer:
+        phy.i2c.commit()
+    return {word: board.bus.apb_word(1, 2, word) for word in (0x3450, 0x3458, 0x3504)}
+
+
+@pytest.mark.parametrize("agent", [0, 1])
+def test_flush_in_open_batch(agent):
+    # buffered partial words flushed into the caller's batch: the REPL merges
+    # the read data on the board
+    expect = flush_in_batch(agent, False)
+    assert flush_in_batch(agent, True) == expect
+    assert expect == {0x3450: 0xA0A5A511, 0x3458: 0xA5A5A5AA, 0x3504: 0xA5A5A5A1}